@@ -81,6 +81,7 @@ const colorMap = {
     [ServeReplicaState.UPDATING]: yellow,
     [ServeReplicaState.RECOVERING]: orange,
     [ServeReplicaState.RUNNING]: green,
+    [ServeReplicaState.STANDBY]: blue,
     [ServeReplicaState.STOPPING]: red,
   },
 } as {
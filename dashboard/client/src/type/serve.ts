@@ -62,6 +62,7 @@ export enum ServeReplicaState {
   UPDATING = "UPDATING",
   RECOVERING = "RECOVERING",
   RUNNING = "RUNNING",
+  STANDBY = "STANDBY",
   STOPPING = "STOPPING",
 }
 
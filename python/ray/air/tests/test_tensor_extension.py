@@ -170,6 +170,47 @@ def test_arrow_variable_shaped_tensor_array_roundtrip_contiguous_optimization():
         np.testing.assert_array_equal(o, a)
 
 
+def test_arrow_variable_shaped_tensor_array_shapes():
+    arrs = [np.zeros((2, 3)), np.zeros((1, 1)), np.zeros((4, 2))]
+    ata = ArrowVariableShapedTensorArray.from_numpy(arrs)
+    shapes = ata.storage.field("shape")
+    assert shapes.type == pa.list_(pa.int64())
+    assert shapes.to_pylist() == [[2, 3], [1, 1], [4, 2]]
+    np.testing.assert_array_equal(ata[1:]._shapes_to_numpy(), [[1, 1], [4, 2]])
+
+
+@pytest.mark.parametrize("dtype", [np.int64, np.float32, np.bool_])
+def test_arrow_variable_shaped_tensor_array_to_padded_numpy(dtype):
+    arrs = [
+        np.ones((2, 3), dtype=dtype),
+        np.ones((1, 1), dtype=dtype),
+        np.ones((3, 2), dtype=dtype),
+    ]
+    ata = ArrowVariableShapedTensorArray.from_numpy(arrs)
+    out = ata.to_padded_numpy()
+    assert out.shape == (3, 3, 3)
+    assert out.dtype == np.dtype(dtype)
+    for o, a in zip(out, arrs):
+        np.testing.assert_array_equal(o[: a.shape[0], : a.shape[1]], a)
+        assert o.sum() == a.sum()
+
+    # Padding of a slice is relative to the tensor elements in the slice.
+    out = ata[1:2].to_padded_numpy(pad_value=5)
+    np.testing.assert_array_equal(out, np.ones((1, 1, 1), dtype=dtype))
+
+
+def test_arrow_variable_shaped_tensor_array_to_padded_numpy_uniform():
+    # Tensor elements with the same shape are returned as a zero-copy view.
+    base = np.arange(12)
+    arr = np.array([base[:4].reshape(2, 2), base[4:8].reshape(2, 2)], dtype=object)
+    ata = ArrowVariableShapedTensorArray.from_numpy(
+        create_ragged_ndarray(list(arr) + [base[8:].reshape(2, 2)])
+    )
+    out = ata[1:].to_padded_numpy()
+    np.testing.assert_array_equal(out, base[4:].reshape(2, 2, 2))
+    assert out.base.address == base.__array_interface__["data"][0]
+
+
 def test_arrow_variable_shaped_tensor_array_slice():
     shapes = [(2, 2), (3, 3), (4, 4)]
     cumsum_sizes = np.cumsum([0] + [np.prod(shape) for shape in shapes[:-1]])
@@ -1,6 +1,6 @@
 import itertools
 import sys
-from typing import Iterable, Optional, Tuple, List, Sequence, Union
+from typing import Any, Iterable, Optional, Tuple, List, Sequence, Union
 
 from pkg_resources._vendor.packaging.version import parse as parse_version
 import numpy as np
@@ -748,8 +748,13 @@ class ArrowVariableShapedTensorArray(
         offset_array = pa.array(size_offsets)
         data_array = pa.ListArray.from_arrays(offset_array, value_array)
         # We store the tensor element shapes so we can reconstruct each tensor when
-        # converting back to NumPy ndarrays.
-        shape_array = pa.array(shapes)
+        # converting back to NumPy ndarrays. The shapes are built from a single flat
+        # int64 buffer rather than converting each shape tuple to Arrow individually.
+        shape_values = np.array(shapes, dtype=np.int64).reshape(-1)
+        shape_offsets = np.arange(len(shapes) + 1, dtype=np.int32) * ndim
+        shape_array = pa.ListArray.from_arrays(
+            pa.array(shape_offsets), pa.array(shape_values)
+        )
         # Build storage array containing tensor data and the tensor element shapes.
         storage = pa.StructArray.from_arrays(
             [data_array, shape_array],
@@ -780,7 +785,7 @@ class ArrowVariableShapedTensorArray(
         # TODO(Clark): Support strides?
         if index is None:
             # Get individual ndarrays for each tensor element.
-            arrs = [self._to_numpy(i, zero_copy_only) for i in range(len(self))]
+            arrs = self._to_ndarray_views()
             # Return ragged NumPy ndarray in the ndarray of ndarray pointers
             # representation.
             return create_ragged_ndarray(arrs)
@@ -808,6 +813,91 @@ class ArrowVariableShapedTensorArray(
         """
         return self._to_numpy(zero_copy_only=zero_copy_only)
 
+    def to_padded_numpy(self, pad_value: Any = 0) -> np.ndarray:
+        """
+        Convert the entire array of tensors into a single dense ndarray, padding each
+        tensor element up to the largest size along each dimension.
+
+        If all tensor elements have the same shape, this is a zero-copy view on the
+        underlying data buffer (except for boolean tensors).
+
+        Args:
+            pad_value: The value used to fill the padding.
+
+        Returns:
+            An ndarray of shape ``(len(self), *max_shape)``, where ``max_shape`` is
+            the elementwise max of the tensor element shapes.
+        """
+        shapes = self._shapes_to_numpy()
+        if len(shapes) == 0:
+            max_shape = (0,) * self.type.ndim
+        else:
+            max_shape = tuple(shapes.max(axis=0))
+        value_type = self.type.scalar_type
+        if (
+            len(shapes) > 0
+            and (shapes == shapes[0]).all()
+            and not pa.types.is_boolean(value_type)
+        ):
+            # All tensor elements have the same shape and are laid out contiguously
+            # in the data buffer, so we can return a view on the entire buffer.
+            data = self.storage.field("data")
+            offset = data.offsets[0].as_py() if len(self) > 0 else 0
+            return _to_ndarray_helper(
+                (len(self),) + max_shape, value_type, offset, data.buffers()[3]
+            )
+        arrs = self._to_ndarray_views()
+        dtype = arrs[0].dtype if arrs else value_type.to_pandas_dtype()
+        padded = np.full((len(self),) + max_shape, pad_value, dtype=dtype)
+        for i, arr in enumerate(arrs):
+            padded[(i,) + tuple(slice(0, dim) for dim in arr.shape)] = arr
+        return padded
+
+    def _shapes_to_numpy(self) -> np.ndarray:
+        """
+        Get the shapes of all tensor elements as a ``(len(self), ndim)`` ndarray.
+        """
+        shapes = self.storage.field("shape")
+        return (
+            shapes.flatten()
+            .to_numpy(zero_copy_only=False)
+            .reshape(len(self), self.type.ndim)
+        )
+
+    def _to_ndarray_views(self) -> List[np.ndarray]:
+        """
+        Get each tensor element as an ndarray view on the underlying data buffer.
+
+        The offsets and shapes of all tensor elements are converted to NumPy in bulk,
+        rather than fetching an Arrow scalar for each element.
+        """
+        data = self.storage.field("data")
+        value_type = data.type.value_type
+        data_buffer = data.buffers()[3]
+        offsets = data.offsets.to_numpy()
+        shapes = self._shapes_to_numpy()
+        if pa.types.is_boolean(value_type):
+            # Boolean tensors are bit-packed, and need to be unpacked per element.
+            return [
+                _to_ndarray_helper(tuple(shape), value_type, offset, data_buffer)
+                for shape, offset in zip(shapes.tolist(), offsets.tolist())
+            ]
+        ext_dtype = value_type.to_pandas_dtype()
+        if pa.types.is_fixed_size_binary(value_type):
+            ext_dtype = np.dtype(
+                f"<U{value_type.byte_width // NUM_BYTES_PER_UNICODE_CHAR}"
+            )
+        buffer_item_width = value_type.bit_width // 8
+        return [
+            np.ndarray(
+                tuple(shape),
+                dtype=ext_dtype,
+                buffer=data_buffer,
+                offset=buffer_item_width * offset,
+            )
+            for shape, offset in zip(shapes.tolist(), offsets.tolist())
+        ]
+
 
 def _is_contiguous_view(curr: np.ndarray, prev: Optional[np.ndarray]) -> bool:
     """Check if the provided tensor element is contiguous with the previous tensor
@@ -148,9 +148,25 @@ class ArrowBlockAccessor(TableBlockAccessor):
 
     @classmethod
     def from_bytes(cls, data: bytes) -> "ArrowBlockAccessor":
+        # NOTE: This transparently decompresses blocks encoded with
+        # to_compressed_bytes().
         reader = pyarrow.ipc.open_stream(data)
         return cls(reader.read_all())
 
+    def to_compressed_bytes(self, codec: str) -> bytes:
+        """Serialize this block to the Arrow IPC stream format, compressing the
+        buffers with the given codec ("lz4" or "zstd").
+
+        The result is itself a valid block, which is read back with ``from_bytes``.
+        """
+        sink = pyarrow.BufferOutputStream()
+        options = pyarrow.ipc.IpcWriteOptions(compression=codec)
+        with pyarrow.ipc.new_stream(
+            sink, self._table.schema, options=options
+        ) as writer:
+            writer.write_table(self._table)
+        return sink.getvalue().to_pybytes()
+
     @staticmethod
     def numpy_to_block(
         batch: Union[np.ndarray, Dict[str, np.ndarray], Dict[str, list]],
@@ -670,6 +686,32 @@ class ArrowBlockAccessor(TableBlockAccessor):
         return ret, ArrowBlockAccessor(ret).get_metadata(None, exec_stats=stats.build())
 
 
+def maybe_compress_block(block: Block, ctx: DataContext) -> Block:
+    """Compress an Arrow block for storage in the object store, if enabled.
+
+    If ``ctx.block_compression`` is set, Arrow tables of at least
+    ``ctx.block_compression_min_size_bytes`` are encoded as compressed Arrow IPC
+    bytes. The compressed encoding is only kept if its measured compression ratio
+    is at least ``ctx.block_compression_min_ratio``. Compressed blocks are
+    transparently decompressed by ``BlockAccessor.for_block``.
+    """
+    if (
+        ctx.block_compression is None
+        or pyarrow is None
+        or not isinstance(block, pyarrow.Table)
+    ):
+        return block
+    accessor = ArrowBlockAccessor(block)
+    size_bytes = accessor.size_bytes()
+    if size_bytes < ctx.block_compression_min_size_bytes:
+        return block
+    data = accessor.to_compressed_bytes(ctx.block_compression)
+    if size_bytes < len(data) * ctx.block_compression_min_ratio:
+        # Not worth the decompression cost.
+        return block
+    return data
+
+
 def _copy_table(table: "pyarrow.Table") -> "pyarrow.Table":
     """Copy the provided Arrow table."""
     return transform_pyarrow.combine_chunks(table)
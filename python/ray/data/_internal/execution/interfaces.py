@@ -1,5 +1,6 @@
 from dataclasses import dataclass, field
 import os
+import threading
 from typing import Dict, List, Optional, Iterable, Iterator, Tuple, Callable, Union
 
 import ray
@@ -237,6 +238,21 @@ class TaskContext:
     # an AllToAllOperator with an upstream MapOperator.
     upstream_map_transform_fn: Optional["MapTransformFn"] = None
 
+    # The context of the task running on the current thread, if any.
+    _thread_local = threading.local()
+
+    @classmethod
+    def get_current(cls) -> Optional["TaskContext"]:
+        """Get the context of the task running the current block transform.
+
+        Returns None outside of a map task.
+        """
+        return getattr(cls._thread_local, "task_context", None)
+
+    @classmethod
+    def set_current(cls, context: Optional["TaskContext"]) -> None:
+        cls._thread_local.task_context = context
+
 
 # Block transform function applied by task and actor pools in MapOperator.
 MapTransformFn = Callable[[Iterable[Block], TaskContext], Iterable[Block]]
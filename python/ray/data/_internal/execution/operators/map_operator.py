@@ -5,6 +5,7 @@ import itertools
 from typing import Callable, List, Iterator, Any, Dict, Optional, Union
 
 import ray
+from ray.data._internal.arrow_block import maybe_compress_block
 from ray.data.block import (
     Block,
     BlockAccessor,
@@ -26,6 +27,7 @@ from ray.data._internal.execution.interfaces import (
 )
 from ray.data._internal.memory_tracing import trace_allocation
 from ray.data._internal.stats import StatsDict
+from ray.data.context import DataContext
 from ray.util.scheduling_strategies import NodeAffinitySchedulingStrategy
 from ray.types import ObjectRef
 from ray._raylet import ObjectRefGenerator
@@ -386,13 +388,19 @@ def _map_task(
     """
     output_metadata = []
     stats = BlockExecStats.builder()
-    for b_out in fn(iter(blocks), ctx):
-        # TODO(Clark): Add input file propagation from input blocks.
-        m_out = BlockAccessor.for_block(b_out).get_metadata([], None)
-        m_out.exec_stats = stats.build()
-        output_metadata.append(m_out)
-        yield b_out
-        stats = BlockExecStats.builder()
+    TaskContext.set_current(ctx)
+    try:
+        for b_out in fn(iter(blocks), ctx):
+            # TODO(Clark): Add input file propagation from input blocks.
+            m_out = BlockAccessor.for_block(b_out).get_metadata([], None)
+            m_out.exec_stats = stats.build()
+            output_metadata.append(m_out)
+            # NOTE: The transform fn sets the DataContext of the driver, so we look
+            # it up after the first output block is produced.
+            yield maybe_compress_block(b_out, DataContext.get_current())
+            stats = BlockExecStats.builder()
+    finally:
+        TaskContext.set_current(None)
     yield output_metadata
 
 
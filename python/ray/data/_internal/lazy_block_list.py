@@ -7,7 +7,11 @@ from ray.data._internal.block_list import BlockList
 from ray.data._internal.progress_bar import ProgressBar
 from ray.data._internal.remote_fn import cached_remote_fn
 from ray.data._internal.memory_tracing import trace_allocation
-from ray.data._internal.stats import DatastreamStats, _get_or_create_stats_actor
+from ray.data._internal.stats import (
+    DatastreamStats,
+    _get_or_create_stats_actor,
+    _report_task_stats,
+)
 from ray.data._internal.util import _split_list
 from ray.data.block import (
     Block,
@@ -99,7 +103,7 @@ class LazyBlockList(BlockList):
         # Whether the block list is owned by consuming APIs, and if so it can be
         # eagerly deleted after read by the consumer.
         self._owned_by_consumer = owned_by_consumer
-        self._stats_actor = _get_or_create_stats_actor()
+        self._stats_actor = _get_or_create_stats_actor(self._stats_uuid)
 
     def __repr__(self):
         return f"LazyBlockList(owned_by_consumer={self._owned_by_consumer})"
@@ -121,12 +125,22 @@ class LazyBlockList(BlockList):
 
     def stats(self) -> DatastreamStats:
         """Create DatastreamStats for this LazyBlockList."""
+        read_task_metadata = [
+            m if m is not None else [t.get_metadata()]
+            for m, t in zip(self._cached_metadata, self._tasks)
+        ]
+        finished_read_tasks = []
+        if self._execution_started:
+            finished_read_tasks = [
+                i for i, m in enumerate(self._cached_metadata) if m is not None
+            ]
         return DatastreamStats(
-            # Make a copy of metadata, as the DatastreamStats may mutate it in-place.
-            stages={"Read": self.get_metadata(fetch_if_missing=False).copy()},
+            stages={"Read": self._flatten_metadata(read_task_metadata)},
             parent=None,
             needs_stats_actor=True,
             stats_uuid=self._stats_uuid,
+            read_task_metadata=read_task_metadata,
+            finished_read_tasks=finished_read_tasks,
         )
 
     def copy(self) -> "LazyBlockList":
@@ -263,6 +277,20 @@ class LazyBlockList(BlockList):
             owned_by_consumer=self._owned_by_consumer,
         )
 
+    def select(self, indices: List[int]) -> "LazyBlockList":
+        """Select the read tasks at the given indices, without executing them."""
+        self._check_if_cleared()
+        return LazyBlockList(
+            [self._tasks[i] for i in indices],
+            self._read_stage_name,
+            [self._block_partition_refs[i] for i in indices],
+            [self._block_partition_meta_refs[i] for i in indices],
+            [self._cached_metadata[i] for i in indices],
+            ray_remote_args=self._remote_args.copy(),
+            owned_by_consumer=self._owned_by_consumer,
+            stats_uuid=self._stats_uuid,
+        )
+
     # Note: does not force execution prior to division.
     def divide(self, part_idx: int) -> ("LazyBlockList", "LazyBlockList"):
         left = LazyBlockList(
@@ -590,7 +618,7 @@ class LazyBlockList(BlockList):
         be fetched as the last element in ObjectRefGenerator.
         """
         if self._stats_actor is None:
-            self._stats_actor = _get_or_create_stats_actor()
+            self._stats_actor = _get_or_create_stats_actor(self._stats_uuid)
         stats_actor = self._stats_actor
         if not self._execution_started:
             stats_actor.record_start.remote(self._stats_uuid)
@@ -661,7 +689,7 @@ def _execute_read_task_nosplit(
     metadata = BlockAccessor.for_block(block).get_metadata(
         input_files=metadata.input_files, exec_stats=stats.build()
     )
-    stats_actor.record_task.remote(stats_uuid, i, [metadata])
+    _report_task_stats(stats_actor, stats_uuid, i, [metadata])
     return block, metadata
 
 
@@ -695,6 +723,6 @@ def _execute_read_task_split(
         blocks_metadata.append(metadata)
         block_exec_stats = BlockExecStats.builder()
 
-    stats_actor.record_task.remote(stats_uuid, i, blocks_metadata)
+    _report_task_stats(stats_actor, stats_uuid, i, blocks_metadata)
     # Return metadata of blocks as a list at the end.
     yield blocks_metadata
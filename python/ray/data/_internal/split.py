@@ -21,18 +21,24 @@ logger = logging.getLogger(__name__)
 def _calculate_blocks_rows(
     blocks_with_metadata: BlockPartition,
 ) -> List[int]:
-    """Calculate the number of rows for a list of blocks with metadata."""
+    """Calculate the number of rows for a list of blocks with metadata.
+
+    Row counts are taken from the block metadata (as reported by the executor)
+    where available. Missing row counts are fetched with remote tasks that run in
+    parallel, rather than one blocking round trip per block.
+    """
     get_num_rows = cached_remote_fn(_get_num_rows)
-    block_rows = []
-    for block, metadata in blocks_with_metadata:
+    missing_idx = []
+    missing_refs = []
+    for i, (block, metadata) in enumerate(blocks_with_metadata):
         if metadata.num_rows is None:
-            # Need to fetch number of rows.
-            num_rows = ray.get(get_num_rows.remote(block))
-            metadata.num_rows = num_rows
-        else:
-            num_rows = metadata.num_rows
-        block_rows.append(num_rows)
-    return block_rows
+            missing_idx.append(i)
+            missing_refs.append(get_num_rows.remote(block))
+    if missing_refs:
+        # Need to fetch number of rows.
+        for i, num_rows in zip(missing_idx, ray.get(missing_refs)):
+            blocks_with_metadata[i][1].num_rows = num_rows
+    return [metadata.num_rows for _, metadata in blocks_with_metadata]
 
 
 def _generate_valid_indices(
@@ -153,19 +159,54 @@ def _drop_empty_block_split(block_split_indices: List[int], num_rows: int) -> Li
     return optimized_indices
 
 
+def _split_meta_at_indices(
+    meta: BlockMetadata, split_indices: List[int]
+) -> List[BlockMetadata]:
+    """Compute the metadata of the splits of a block on the driver.
+
+    The row counts of the splits are known exactly from the split indices, and the
+    sizes are estimated proportionally to the row counts. This avoids waiting on
+    the remote split tasks just to fetch their metadata.
+    """
+    split_meta = []
+    prev_index = 0
+    prev_bytes = 0
+    for index in split_indices + [meta.num_rows]:
+        if meta.size_bytes is None:
+            size_bytes = None
+        elif index == meta.num_rows:
+            size_bytes = meta.size_bytes - prev_bytes
+        else:
+            size_bytes = int(meta.size_bytes * (index / meta.num_rows)) - prev_bytes
+        split_meta.append(
+            BlockMetadata(
+                num_rows=index - prev_index,
+                size_bytes=size_bytes,
+                schema=meta.schema,
+                input_files=meta.input_files,
+                exec_stats=None,
+            )
+        )
+        prev_index = index
+        if size_bytes is not None:
+            prev_bytes += size_bytes
+    return split_meta
+
+
 def _split_all_blocks(
     blocks_with_metadata: List[Tuple[ObjectRef[Block], BlockMetadata]],
     per_block_split_indices: List[List[int]],
     owned_by_consumer: bool,
 ) -> Iterable[Tuple[ObjectRef[Block], BlockMetadata]]:
-    """Split all the input blocks based on the split indices"""
+    """Split all the input blocks based on the split indices.
+
+    The blocks are sliced by remote tasks, and the split metadata is computed on
+    the driver, so this doesn't block on the split tasks or fetch any block data.
+    """
     split_single_block = cached_remote_fn(_split_single_block)
 
     all_blocks_split_results: List[BlockPartition] = [None] * len(blocks_with_metadata)
 
-    per_block_split_metadata_futures = []
-    per_block_split_block_refs = []
-
     # tracking splitted blocks for gc.
     blocks_splitted = []
     for block_id, block_split_indices in enumerate(per_block_split_indices):
@@ -178,6 +219,7 @@ def _split_all_blocks(
             all_blocks_split_results[block_id] = [(block_ref, meta)]
         else:
             # otherwise call split remote function.
+            split_meta = _split_meta_at_indices(meta, block_split_indices)
             object_refs = split_single_block.options(
                 scheduling_strategy="SPREAD", num_returns=2 + len(block_split_indices)
             ).remote(
@@ -186,20 +228,14 @@ def _split_all_blocks(
                 meta,
                 block_split_indices,
             )
-            per_block_split_metadata_futures.append(object_refs[0])
-            per_block_split_block_refs.append(object_refs[1:])
+            # The first return value is the metadata computed by the split task,
+            # which we don't need to wait for.
+            block_refs = object_refs[1:]
+            assert len(split_meta) == len(block_refs)
+            all_blocks_split_results[block_id] = zip(block_refs, split_meta)
 
             blocks_splitted.append(block_ref)
 
-    if per_block_split_metadata_futures:
-        # only get metadata.
-        per_block_split_metadata = ray.get(per_block_split_metadata_futures)
-        for (block_id, meta), block_refs in zip(
-            per_block_split_metadata, per_block_split_block_refs
-        ):
-            assert len(meta) == len(block_refs)
-            all_blocks_split_results[block_id] = zip(block_refs, meta)
-
     # We make a copy for the blocks that have been splitted, so the input blocks
     # can be cleared if they are owned by consumer (consumer-owned blocks will
     # only be consumed by the owner).
@@ -1,6 +1,10 @@
+import array
 import collections
 from dataclasses import dataclass
+import logging
+import threading
 import time
+import zlib
 from contextlib import contextmanager
 from typing import Dict, List, Optional, Set, Tuple, Union, Any
 
@@ -9,7 +13,7 @@ import numpy as np
 import ray
 from ray.data._internal.block_list import BlockList
 from ray.data._internal.util import capfirst
-from ray.data.block import BlockMetadata
+from ray.data.block import BlockExecStats, BlockMetadata
 from ray.data.context import DataContext
 from ray.util.annotations import DeveloperAPI
 from ray.util.scheduling_strategies import NodeAffinitySchedulingStrategy
@@ -17,6 +21,13 @@ from ray.util.scheduling_strategies import NodeAffinitySchedulingStrategy
 STATS_ACTOR_NAME = "datastreams_stats_actor"
 STATS_ACTOR_NAMESPACE = "_datastream_stats_actor"
 
+# Max time to wait for the stats of finished read tasks to arrive at the stats
+# actor, since workers report them asynchronously.
+STATS_REPORT_WAIT_TIMEOUT_S = 2.0
+STATS_REPORT_POLL_INTERVAL_S = 0.05
+
+logger = logging.getLogger(__name__)
+
 StatsDict = Dict[str, List[BlockMetadata]]
 
 
@@ -121,6 +132,136 @@ class _DatastreamStatsBuilder:
         return stats
 
 
+class _ColumnarBlockStats:
+    """Compact, columnar store of the block metadata reported for one datastream.
+
+    Keeping one Python ``BlockMetadata`` (and ``BlockExecStats``) object per block
+    costs several hundred bytes per block in the stats actor. Instead, the fields
+    needed for stats summaries are kept in typed arrays, and ``BlockMetadata``
+    objects are only materialized when the stats are fetched. Schemas and input
+    files are dropped, since they are not used for stats reporting.
+    """
+
+    def __init__(self):
+        # Per-block columns. Missing values are encoded as -1 (ints) or NaN (floats).
+        self._num_rows = array.array("q")
+        self._size_bytes = array.array("q")
+        self._wall_time_s = array.array("d")
+        self._cpu_time_s = array.array("d")
+        self._max_rss_bytes = array.array("q")
+        # Index into self._node_ids, or -1 if the block has no exec stats.
+        self._node_idx = array.array("i")
+        self._node_ids: List[str] = []
+        self._node_id_to_idx: Dict[str, int] = {}
+        # Mapping from task_idx -> (start, end) row range of its blocks.
+        self._task_ranges: Dict[int, Tuple[int, int]] = {}
+        # Number of rows no longer referenced by any task range.
+        self._num_stale_rows = 0
+
+    def __len__(self) -> int:
+        return len(self._task_ranges)
+
+    def append(self, task_idx: int, blocks_metadata: List[BlockMetadata]) -> None:
+        """Record the blocks of a task, replacing the rows of earlier reports for
+        the same task (e.g. from retries)."""
+        prev_range = self._task_ranges.get(task_idx)
+        if prev_range is not None and prev_range[1] - prev_range[0] == len(
+            blocks_metadata
+        ):
+            # Overwrite the rows of the previous report in place.
+            for i, meta in zip(range(*prev_range), blocks_metadata):
+                self._set_row(i, meta)
+            return
+        if prev_range is not None:
+            self._num_stale_rows += prev_range[1] - prev_range[0]
+        start = len(self._num_rows)
+        for meta in blocks_metadata:
+            self._num_rows.append(-1)
+            self._size_bytes.append(-1)
+            self._wall_time_s.append(float("nan"))
+            self._cpu_time_s.append(float("nan"))
+            self._max_rss_bytes.append(-1)
+            self._node_idx.append(-1)
+            self._set_row(len(self._num_rows) - 1, meta)
+        self._task_ranges[task_idx] = (start, len(self._num_rows))
+        if self._num_stale_rows >= len(self._num_rows) // 2:
+            self._compact()
+
+    def to_stats_map(self) -> Dict[int, List[BlockMetadata]]:
+        """Materialize the mapping from task_idx -> list of block metadata."""
+        return {
+            task_idx: [self._row_to_metadata(i) for i in range(start, end)]
+            for task_idx, (start, end) in self._task_ranges.items()
+        }
+
+    def _set_row(self, i: int, meta: BlockMetadata) -> None:
+        self._num_rows[i] = -1 if meta.num_rows is None else meta.num_rows
+        self._size_bytes[i] = -1 if meta.size_bytes is None else meta.size_bytes
+        stats = meta.exec_stats
+        if stats is None:
+            self._wall_time_s[i] = float("nan")
+            self._cpu_time_s[i] = float("nan")
+            self._max_rss_bytes[i] = -1
+            self._node_idx[i] = -1
+        else:
+            self._wall_time_s[i] = stats.wall_time_s
+            self._cpu_time_s[i] = stats.cpu_time_s
+            self._max_rss_bytes[i] = stats.max_rss_bytes
+            self._node_idx[i] = self._intern_node_id(stats.node_id)
+
+    def _compact(self) -> None:
+        """Drop the rows superseded by later reports of the same task."""
+        columns = [
+            self._num_rows,
+            self._size_bytes,
+            self._wall_time_s,
+            self._cpu_time_s,
+            self._max_rss_bytes,
+            self._node_idx,
+        ]
+        compacted = [array.array(column.typecode) for column in columns]
+        task_ranges = {}
+        for task_idx, (start, end) in self._task_ranges.items():
+            new_start = len(compacted[0])
+            for column, new_column in zip(columns, compacted):
+                new_column.extend(column[start:end])
+            task_ranges[task_idx] = (new_start, len(compacted[0]))
+        (
+            self._num_rows,
+            self._size_bytes,
+            self._wall_time_s,
+            self._cpu_time_s,
+            self._max_rss_bytes,
+            self._node_idx,
+        ) = compacted
+        self._task_ranges = task_ranges
+        self._num_stale_rows = 0
+
+    def _intern_node_id(self, node_id: str) -> int:
+        idx = self._node_id_to_idx.get(node_id)
+        if idx is None:
+            idx = len(self._node_ids)
+            self._node_ids.append(node_id)
+            self._node_id_to_idx[node_id] = idx
+        return idx
+
+    def _row_to_metadata(self, i: int) -> BlockMetadata:
+        exec_stats = None
+        if self._node_idx[i] >= 0:
+            exec_stats = BlockExecStats()
+            exec_stats.wall_time_s = self._wall_time_s[i]
+            exec_stats.cpu_time_s = self._cpu_time_s[i]
+            exec_stats.max_rss_bytes = self._max_rss_bytes[i]
+            exec_stats.node_id = self._node_ids[self._node_idx[i]]
+        return BlockMetadata(
+            num_rows=self._num_rows[i] if self._num_rows[i] >= 0 else None,
+            size_bytes=self._size_bytes[i] if self._size_bytes[i] >= 0 else None,
+            schema=None,
+            input_files=None,
+            exec_stats=exec_stats,
+        )
+
+
 @ray.remote(num_cpus=0)
 class _StatsActor:
     """Actor holding stats for blocks created by LazyBlockList.
@@ -128,25 +269,31 @@ class _StatsActor:
     This actor is shared across all datastreams created in the same cluster.
     In order to cap memory usage, we set a max number of stats to keep
     in the actor. When this limit is exceeded, the stats will be garbage
-    collected in FIFO order.
+    collected in FIFO order. Block metadata is stored in a compact columnar
+    format (see ``_ColumnarBlockStats``).
+
+    To avoid making a single actor a serialization point, datastreams are sharded
+    across ``DataContext.stats_actor_num_shards`` actors by their stats uuid (see
+    ``_get_or_create_stats_actor``), and workers report their stats in batches
+    (see ``_StatsReporter``).
 
     TODO(ekl) we should consider refactoring LazyBlockList so stats can be
     extracted without using an out-of-band actor."""
 
     def __init__(self, max_stats=1000):
-        # Mapping from uuid -> (task_id -> list of blocks statistics).
-        self.metadata = collections.defaultdict(dict)
+        # Mapping from uuid -> columnar block statistics.
+        self.metadata: Dict[str, _ColumnarBlockStats] = {}
         self.last_time = {}
         self.start_time = {}
         self.max_stats = max_stats
-        self.fifo_queue = []
+        self.fifo_queue = collections.deque()
 
     def record_start(self, stats_uuid):
         self.start_time[stats_uuid] = time.perf_counter()
         self.fifo_queue.append(stats_uuid)
         # Purge the oldest stats if the limit is exceeded.
         if len(self.fifo_queue) > self.max_stats:
-            uuid = self.fifo_queue.pop(0)
+            uuid = self.fifo_queue.popleft()
             if uuid in self.start_time:
                 del self.start_time[uuid]
             if uuid in self.last_time:
@@ -157,19 +304,22 @@ class _StatsActor:
     def record_task(
         self, stats_uuid: str, task_idx: int, blocks_metadata: List[BlockMetadata]
     ):
-        # Null out the schema to keep the stats size small.
-        # TODO(chengsu): ideally schema should be null out on caller side.
-        for metadata in blocks_metadata:
-            metadata.schema = None
         if stats_uuid in self.start_time:
-            self.metadata[stats_uuid][task_idx] = blocks_metadata
+            if stats_uuid not in self.metadata:
+                self.metadata[stats_uuid] = _ColumnarBlockStats()
+            self.metadata[stats_uuid].append(task_idx, blocks_metadata)
             self.last_time[stats_uuid] = time.perf_counter()
 
+    def record_task_batch(self, records: List[Tuple[str, int, List[BlockMetadata]]]):
+        """Record a batch of (stats_uuid, task_idx, blocks_metadata) reports."""
+        for stats_uuid, task_idx, blocks_metadata in records:
+            self.record_task(stats_uuid, task_idx, blocks_metadata)
+
     def get(self, stats_uuid):
         if stats_uuid not in self.metadata:
             return {}, 0.0
         return (
-            self.metadata[stats_uuid],
+            self.metadata[stats_uuid].to_stats_map(),
             self.last_time[stats_uuid] - self.start_time[stats_uuid],
         )
 
@@ -177,7 +327,18 @@ class _StatsActor:
         return len(self.start_time), len(self.last_time), len(self.metadata)
 
 
-def _get_or_create_stats_actor():
+def _stats_actor_shard(stats_uuid: Optional[Any], num_shards: int) -> int:
+    """Return the stats actor shard for the given stats uuid.
+
+    This uses a stable hash, since the shard is computed both on the driver and
+    when reporting stats from workers.
+    """
+    if stats_uuid is None or num_shards <= 1:
+        return 0
+    return zlib.crc32(str(stats_uuid).encode()) % num_shards
+
+
+def _get_or_create_stats_actor(stats_uuid: Optional[Any] = None):
     ctx = DataContext.get_current()
     scheduling_strategy = ctx.scheduling_strategy
     if not ray.util.client.ray.is_connected():
@@ -187,8 +348,11 @@ def _get_or_create_stats_actor():
             ray.get_runtime_context().get_node_id(),
             soft=False,
         )
+    shard = _stats_actor_shard(stats_uuid, ctx.stats_actor_num_shards)
+    # The first shard keeps the legacy actor name.
+    name = STATS_ACTOR_NAME if shard == 0 else f"{STATS_ACTOR_NAME}_{shard}"
     return _StatsActor.options(
-        name=STATS_ACTOR_NAME,
+        name=name,
         namespace=STATS_ACTOR_NAMESPACE,
         get_if_exists=True,
         lifetime="detached",
@@ -196,6 +360,99 @@ def _get_or_create_stats_actor():
     ).remote()
 
 
+class _StatsReporter:
+    """Coalesces stats reports from a worker process into batched actor calls.
+
+    Reports are buffered and sent by a background thread, so that reporting never
+    blocks the calling task. At most one batch is in flight per worker process:
+    reports that arrive while a batch is in flight are sent together in the next
+    batch. This bounds the number of pending calls on the stats actors by the
+    number of workers rather than the number of tasks. If the stats actors fall
+    too far behind, the oldest buffered reports are dropped.
+    """
+
+    def __init__(self, max_buffered_reports: int):
+        self._max_buffered_reports = max_buffered_reports
+        self._buffer: collections.deque = collections.deque()
+        self._cv = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._num_dropped = 0
+
+    def report(
+        self,
+        stats_actor: "ray.actor.ActorHandle",
+        stats_uuid: str,
+        task_idx: int,
+        blocks_metadata: List[BlockMetadata],
+    ) -> None:
+        # Null out the schemas to keep the reported stats small.
+        blocks_metadata = [
+            BlockMetadata(
+                num_rows=m.num_rows,
+                size_bytes=m.size_bytes,
+                schema=None,
+                input_files=None,
+                exec_stats=m.exec_stats,
+            )
+            for m in blocks_metadata
+        ]
+        with self._cv:
+            if len(self._buffer) >= self._max_buffered_reports:
+                self._buffer.popleft()
+                self._num_dropped += 1
+            self._buffer.append((stats_actor, (stats_uuid, task_idx, blocks_metadata)))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="DataStatsReporter", daemon=True
+                )
+                self._thread.start()
+            self._cv.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._cv:
+                while not self._buffer:
+                    self._cv.wait()
+                pending = list(self._buffer)
+                self._buffer.clear()
+            # Group the reports by stats actor shard.
+            actors = {}
+            batches = collections.defaultdict(list)
+            for stats_actor, record in pending:
+                actors[stats_actor._actor_id] = stats_actor
+                batches[stats_actor._actor_id].append(record)
+            refs = [
+                actors[actor_id].record_task_batch.remote(records)
+                for actor_id, records in batches.items()
+            ]
+            try:
+                # Wait for the batch to be ingested before sending the next one.
+                ray.get(refs)
+            except Exception:
+                # Stats reporting is best-effort.
+                logger.debug("Failed to report datastream stats.", exc_info=True)
+
+
+_stats_reporter: Optional[_StatsReporter] = None
+_stats_reporter_lock = threading.Lock()
+
+
+def _report_task_stats(
+    stats_actor: "ray.actor.ActorHandle",
+    stats_uuid: str,
+    task_idx: int,
+    blocks_metadata: List[BlockMetadata],
+) -> None:
+    """Asynchronously report the block metadata of a task to the stats actor."""
+    global _stats_reporter
+    with _stats_reporter_lock:
+        if _stats_reporter is None:
+            _stats_reporter = _StatsReporter(
+                DataContext.get_current().stats_max_buffered_reports
+            )
+    _stats_reporter.report(stats_actor, stats_uuid, task_idx, blocks_metadata)
+
+
 class DatastreamStats:
     """Holds the execution times for a given Datastream.
 
@@ -211,6 +468,8 @@ class DatastreamStats:
         needs_stats_actor: bool = False,
         stats_uuid: str = None,
         base_name: str = None,
+        read_task_metadata: Optional[List[List[BlockMetadata]]] = None,
+        finished_read_tasks: Optional[List[int]] = None,
     ):
         """Create datastream stats.
 
@@ -225,6 +484,10 @@ class DatastreamStats:
             stats_uuid: The uuid for the stats, used to fetch the right stats
                 from the stats actor.
             base_name: The name of the base operation for a multi-stage operation.
+            read_task_metadata: The block metadata of each read task known to the
+                driver, used for read tasks without stats at the stats actor.
+            finished_read_tasks: Indices of the read tasks that finished executing.
+                Their stats are waited for when generating the summary.
         """
 
         self.stages: StatsDict = stages
@@ -241,6 +504,8 @@ class DatastreamStats:
         self.time_total_s: float = 0
         self.needs_stats_actor = needs_stats_actor
         self.stats_uuid = stats_uuid
+        self._read_task_metadata = read_task_metadata
+        self._finished_read_tasks = finished_read_tasks or []
 
         self._legacy_iter_batches = False
         # Iteration stats, filled out if the user iterates over the datastream.
@@ -266,7 +531,7 @@ class DatastreamStats:
 
     @property
     def stats_actor(self):
-        return _get_or_create_stats_actor()
+        return _get_or_create_stats_actor(self.stats_uuid)
 
     def child_builder(
         self, name: str, override_start_time: Optional[float] = None
@@ -283,23 +548,36 @@ class DatastreamStats:
         """Placeholder for ops not yet instrumented."""
         return DatastreamStats(stages={"TODO": []}, parent=None)
 
+    def _get_read_task_stats(self) -> Tuple[Dict[int, List[BlockMetadata]], float]:
+        """Fetch the read task stats from the stats actor.
+
+        Workers report stats asynchronously, so this waits for a bounded time
+        until the stats of all finished read tasks have arrived.
+        """
+        ac = self.stats_actor
+        deadline = time.monotonic() + STATS_REPORT_WAIT_TIMEOUT_S
+        while True:
+            stats_map, time_total_s = ray.get(ac.get.remote(self.stats_uuid))
+            if (
+                all(i in stats_map for i in self._finished_read_tasks)
+                or time.monotonic() >= deadline
+            ):
+                return stats_map, time_total_s
+            time.sleep(STATS_REPORT_POLL_INTERVAL_S)
+
     def to_summary(self) -> "DatastreamStatsSummary":
         """Generate a `DatastreamStatsSummary` object from the given `DatastreamStats`
         object, which can be used to generate a summary string."""
         if self.needs_stats_actor:
-            ac = self.stats_actor
-            # TODO(chengsu): this is a super hack, clean it up.
-            stats_map, self.time_total_s = ray.get(ac.get.remote(self.stats_uuid))
-            if DataContext.get_current().block_splitting_enabled:
-                # Only populate stats when stats from all read tasks are ready at
-                # stats actor.
-                if len(stats_map.items()) == len(self.stages["Read"]):
-                    self.stages["Read"] = []
-                    for _, blocks_metadata in sorted(stats_map.items()):
-                        self.stages["Read"] += blocks_metadata
-            else:
-                for i, metadata in stats_map.items():
-                    self.stages["Read"][i] = metadata[0]
+            stats_map, self.time_total_s = self._get_read_task_stats()
+            if self._read_task_metadata is not None:
+                # Use the reported stats of each read task, and fall back to the
+                # metadata known to the driver for tasks without reported stats.
+                self.stages["Read"] = [
+                    meta
+                    for i, task_metadata in enumerate(self._read_task_metadata)
+                    for meta in stats_map.get(i, task_metadata)
+                ]
 
         stages_stats = []
         is_substage = len(self.stages) > 1
@@ -112,6 +112,23 @@ DEFAULT_STRICT_MODE = bool(int(os.environ.get("RAY_DATA_STRICT_MODE", "1")))
 # Set this to True to use the legacy iter_batches codepath prior to 2.4.
 DEFAULT_USE_LEGACY_ITER_BATCHES = False
 
+# Number of stats actors that datastreams are sharded across for stats collection.
+DEFAULT_STATS_ACTOR_NUM_SHARDS = env_integer("RAY_DATA_STATS_ACTOR_NUM_SHARDS", 1)
+
+# Max number of stats reports buffered in a worker process while waiting for the
+# stats actors. The oldest reports are dropped beyond this limit.
+DEFAULT_STATS_MAX_BUFFERED_REPORTS = 10000
+
+# Codec used to compress Arrow blocks stored in the object store ("lz4" or "zstd"),
+# or None to store blocks uncompressed.
+DEFAULT_BLOCK_COMPRESSION = os.environ.get("RAY_DATA_BLOCK_COMPRESSION", None)
+
+# Arrow blocks smaller than this size in bytes are never compressed.
+DEFAULT_BLOCK_COMPRESSION_MIN_SIZE_BYTES = 1024 * 1024
+
+# Compressed blocks are only kept if the measured compression ratio is at least this.
+DEFAULT_BLOCK_COMPRESSION_MIN_RATIO = 1.5
+
 # Use this to prefix important warning messages for the user.
 WARN_PREFIX = "⚠️ "
 
@@ -168,6 +185,11 @@ class DataContext:
         use_legacy_iter_batches: bool,
         strict_mode: bool,
         enable_progress_bars: bool,
+        stats_actor_num_shards: int,
+        stats_max_buffered_reports: int,
+        block_compression: Optional[str],
+        block_compression_min_size_bytes: int,
+        block_compression_min_ratio: float,
     ):
         """Private constructor (use get_current() instead)."""
         self.block_splitting_enabled = block_splitting_enabled
@@ -201,6 +223,11 @@ class DataContext:
         self.use_legacy_iter_batches = use_legacy_iter_batches
         self.strict_mode = strict_mode
         self.enable_progress_bars = enable_progress_bars
+        self.stats_actor_num_shards = stats_actor_num_shards
+        self.stats_max_buffered_reports = stats_max_buffered_reports
+        self.block_compression = block_compression
+        self.block_compression_min_size_bytes = block_compression_min_size_bytes
+        self.block_compression_min_ratio = block_compression_min_ratio
 
     @staticmethod
     def get_current() -> "DataContext":
@@ -250,6 +277,13 @@ class DataContext:
                     use_legacy_iter_batches=DEFAULT_USE_LEGACY_ITER_BATCHES,
                     strict_mode=DEFAULT_STRICT_MODE,
                     enable_progress_bars=DEFAULT_ENABLE_PROGRESS_BARS,
+                    stats_actor_num_shards=DEFAULT_STATS_ACTOR_NUM_SHARDS,
+                    stats_max_buffered_reports=DEFAULT_STATS_MAX_BUFFERED_REPORTS,
+                    block_compression=DEFAULT_BLOCK_COMPRESSION,
+                    block_compression_min_size_bytes=(
+                        DEFAULT_BLOCK_COMPRESSION_MIN_SIZE_BYTES
+                    ),
+                    block_compression_min_ratio=DEFAULT_BLOCK_COMPRESSION_MIN_RATIO,
                 )
 
             return _default_context
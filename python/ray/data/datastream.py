@@ -87,7 +87,11 @@ from ray.data._internal.stage_impl import (
 )
 from ray.data._internal.progress_bar import ProgressBar
 from ray.data._internal.remote_fn import cached_remote_fn
-from ray.data._internal.split import _split_at_indices, _get_num_rows
+from ray.data._internal.split import (
+    _calculate_blocks_rows,
+    _get_num_rows,
+    _split_at_indices,
+)
 from ray.data._internal.stats import DatastreamStats, DatastreamStatsSummary
 from ray.data.aggregate import AggregateFn, Max, Mean, Min, Std, Sum
 from ray.data.block import (
@@ -1040,7 +1044,7 @@ class Datastream:
         return Datastream(plan, self._epoch, self._lazy, logical_plan)
 
     def random_sample(
-        self, fraction: float, *, seed: Optional[int] = None
+        self, fraction: float, *, seed: Optional[int] = None, block_level: bool = False
     ) -> "Datastream":
         """Randomly samples a fraction of the elements of this datastream.
 
@@ -1052,10 +1056,20 @@ class Datastream:
             >>> ds = ray.data.range(100) # doctest: +SKIP
             >>> ds.random_sample(0.1) # doctest: +SKIP
             >>> ds.random_sample(0.2, seed=12345) # doctest: +SKIP
+            >>> # Sample whole blocks, without reading the skipped blocks.
+            >>> ds.random_sample(0.01, block_level=True) # doctest: +SKIP
 
         Args:
             fraction: The fraction of elements to sample.
             seed: Seeds the python random pRNG generator.
+            block_level: If True, sample whole blocks instead of individual rows.
+                Blocks are selected in random order until ``fraction`` of the rows
+                are sampled, using the row counts in the block metadata, so blocks
+                that aren't selected are never read. Note that rows from the same
+                block are sampled together, so this is only a uniform sample of the
+                rows if the rows aren't correlated within blocks. If the row counts
+                aren't known without reading the data, this falls back to sampling
+                individual rows.
 
         Returns:
             Returns a Datastream containing the sampled elements.
@@ -1071,6 +1085,15 @@ class Datastream:
         if fraction < 0 or fraction > 1:
             raise ValueError("Fraction must be between 0 and 1.")
 
+        if block_level:
+            sampled = self._sample_blocks(fraction, seed)
+            if sampled is not None:
+                return sampled
+            logger.warning(
+                "The number of rows of the datastream isn't known from the block "
+                "metadata, falling back to row-level sampling."
+            )
+
         if seed is not None:
             random.seed(seed)
 
@@ -1079,9 +1102,7 @@ class Datastream:
                 return [row for row in batch if random.random() <= fraction]
             if isinstance(batch, pa.Table):
                 # Lets the item pass if weight generated for that item <= fraction
-                return batch.filter(
-                    pa.array(random.random() <= fraction for _ in range(len(batch)))
-                )
+                return batch.filter(pa.array(np.random.random(len(batch)) <= fraction))
             if isinstance(batch, pd.DataFrame):
                 return batch.sample(frac=fraction)
             if isinstance(batch, np.ndarray):
@@ -1092,6 +1113,63 @@ class Datastream:
 
         return self.map_batches(process_batch, batch_format=None)
 
+    def stratified_sample(
+        self, key: str, fractions: Dict[Any, float], *, seed: Optional[int] = None
+    ) -> "Datastream":
+        """Randomly samples each stratum of this datastream with a different fraction.
+
+        Each row is kept with the probability given in ``fractions`` for the value
+        of its ``key`` column. Rows whose key isn't in ``fractions`` are dropped.
+
+        Examples:
+            >>> import ray
+            >>> ds = ray.data.from_items( # doctest: +SKIP
+            ...     [{"label": x % 3, "value": x} for x in range(1000)])
+            >>> # Keep 10% of label 0, 50% of label 1, and all of label 2.
+            >>> ds.stratified_sample( # doctest: +SKIP
+            ...     "label", {0: 0.1, 1: 0.5, 2: 1.0})
+
+        Time complexity: O(datastream size / parallelism)
+
+        Note that, unlike ``groupby()``, this doesn't need to shuffle the datastream,
+        since each row is sampled independently based on its key.
+
+        Args:
+            key: The column name to stratify by.
+            fractions: Mapping from key value to the fraction of the rows with that
+                key to sample.
+            seed: Seeds the random number generator used for each batch.
+
+        Returns:
+            A Datastream containing the sampled rows.
+        """
+        for k, fraction in fractions.items():
+            if fraction < 0 or fraction > 1:
+                raise ValueError(
+                    f"Fraction must be between 0 and 1, but got {fraction} for key {k}."
+                )
+        from ray.data._internal.execution.interfaces import TaskContext
+
+        _validate_key_fn(self.schema(fetch_if_missing=True), key)
+
+        # Map from task index -> random generator used for the batches of the task.
+        rngs: Dict[int, np.random.Generator] = {}
+
+        def process_batch(batch: "pandas.DataFrame") -> "pandas.DataFrame":
+            task_context = TaskContext.get_current()
+            task_idx = task_context.task_idx if task_context is not None else 0
+            if task_idx not in rngs:
+                # Seed every task differently, and draw the batches of a task from
+                # the same generator, so that batches don't reuse the same random
+                # numbers.
+                entropy = None if seed is None else [seed, task_idx]
+                rngs[task_idx] = np.random.default_rng(entropy)
+            rng = rngs[task_idx]
+            probs = batch[key].map(fractions).fillna(0.0).to_numpy(dtype=np.float64)
+            return batch[rng.random(len(batch)) < probs]
+
+        return self.map_batches(process_batch, batch_format="pandas")
+
     @ConsumptionAPI
     def streaming_split(
         self,
@@ -1203,13 +1281,20 @@ class Datastream:
         # simple benchmarks shows spilit_at_indices yields more stable performance.
         # https://github.com/ray-project/ray/pull/26641 for more context.
         if equal and locality_hints is None:
-            count = self.count()
-            split_index = count // n
+            # Row counts are taken from the block metadata reported by the
+            # executor, so that the datastream is only executed once and no block
+            # data is fetched to the driver.
+            block_list = self._plan.execute()
+            blocks_with_metadata = block_list.get_blocks_with_metadata()
+            block_rows = _calculate_blocks_rows(blocks_with_metadata)
+            split_index = sum(block_rows) // n
             # we are creating n split_indices which will generate
             # n + 1 splits; the last split will at most contains (n - 1)
             # rows, which could be safely dropped.
             split_indices = [split_index * i for i in range(1, n + 1)]
-            shards = self.split_at_indices(split_indices)
+            shards = self._split_at_indices_with_metadata(
+                block_list, blocks_with_metadata, split_indices, block_rows
+            )
             return shards[:n]
 
         if locality_hints and len(locality_hints) != n:
@@ -1401,12 +1486,33 @@ class Datastream:
             raise ValueError("indices must be sorted")
         if indices[0] < 0:
             raise ValueError("indices must be positive")
-        start_time = time.perf_counter()
         block_list = self._plan.execute()
+        return self._split_at_indices_with_metadata(
+            block_list, block_list.get_blocks_with_metadata(), indices
+        )
+
+    def _split_at_indices_with_metadata(
+        self,
+        block_list: BlockList,
+        blocks_with_metadata: List[Tuple[ObjectRef[Block], BlockMetadata]],
+        indices: List[int],
+        block_rows: Optional[List[int]] = None,
+    ) -> List["MaterializedDatastream"]:
+        """Split the executed blocks of this datastream at the given indices.
+
+        Args:
+            block_list: The executed block list of this datastream.
+            blocks_with_metadata: The blocks of ``block_list`` with their metadata.
+            indices: The (global) indices at which to split the blocks.
+            block_rows: The number of rows for each block, in case it has already
+                been computed.
+        """
+        start_time = time.perf_counter()
         blocks, metadata = _split_at_indices(
-            block_list.get_blocks_with_metadata(),
+            blocks_with_metadata,
             indices,
             block_list._owned_by_consumer,
+            block_rows,
         )
         split_duration = time.perf_counter() - start_time
         parent_stats = self._plan.stats()
@@ -3977,6 +4083,11 @@ class Datastream:
         """
         blocks = self._plan.execute().get_blocks()
         self._synchronize_progress_bar()
+        if DataContext.get_current().block_compression is not None:
+            # Blocks may be stored as compressed Arrow IPC bytes, which callers
+            # can't use directly, so decompress them into Arrow tables.
+            decompress_block = cached_remote_fn(_decompress_block)
+            blocks = [decompress_block.remote(block) for block in blocks]
         return blocks
 
     @Deprecated(
@@ -4112,6 +4223,58 @@ class Datastream:
         )
         return l_ds, r_ds
 
+    def _sample_blocks(
+        self, fraction: float, seed: Optional[int]
+    ) -> Optional["Datastream"]:
+        """Samples whole blocks, using the row counts in the block metadata.
+
+        Returns None if the row counts aren't known without executing the plan.
+        """
+        import random
+
+        if self._plan._stages_after_snapshot:
+            return None
+        # Without pending stages, this returns the computed snapshot, or the read
+        # tasks of a lazy read without reading any data.
+        blocks = self._plan.execute()
+        if isinstance(blocks, LazyBlockList):
+            num_rows = [task.get_metadata().num_rows for task in blocks._tasks]
+        else:
+            block_refs, metadata = zip(*blocks.get_blocks_with_metadata())
+            num_rows = [m.num_rows for m in metadata]
+        if any(n is None for n in num_rows):
+            return None
+
+        target_num_rows = int(round(sum(num_rows) * fraction))
+        order = list(range(len(num_rows)))
+        random.Random(seed).shuffle(order)
+        indices = []
+        sampled_num_rows = 0
+        for i in order:
+            if sampled_num_rows >= target_num_rows:
+                break
+            indices.append(i)
+            sampled_num_rows += num_rows[i]
+        indices.sort()
+
+        if isinstance(blocks, LazyBlockList):
+            sampled_blocks = blocks.select(indices)
+        else:
+            sampled_blocks = BlockList(
+                [block_refs[i] for i in indices],
+                [metadata[i] for i in indices],
+                owned_by_consumer=blocks._owned_by_consumer,
+            )
+        return Datastream(
+            ExecutionPlan(
+                sampled_blocks,
+                self._plan.stats(),
+                run_by_consumer=blocks._owned_by_consumer,
+            ),
+            self._epoch,
+            self._lazy,
+        )
+
     @Deprecated(message="The batch format is no longer exposed as a public API.")
     def default_batch_format(self) -> Type:
         context = DataContext.get_current()
@@ -4479,6 +4642,12 @@ def _block_to_arrow(block: Block):
     return block.to_arrow()
 
 
+def _decompress_block(block: Block) -> Block:
+    if isinstance(block, bytes):
+        return BlockAccessor.for_block(block).to_arrow()
+    return block
+
+
 def _sliding_window(iterable: Iterable, n: int):
     """Creates an iterator consisting of n-width sliding windows over
     iterable. The sliding windows are constructed lazily such that an
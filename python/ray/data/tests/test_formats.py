@@ -90,6 +90,30 @@ def test_to_arrow_refs(ray_start_regular_shared):
     assert df.equals(dfds)
 
 
+def test_to_arrow_refs_compressed_blocks(ray_start_regular_shared):
+    ctx = ray.data.DataContext.get_current()
+    old_compression = ctx.block_compression
+    old_min_size_bytes = ctx.block_compression_min_size_bytes
+    ctx.block_compression = "lz4"
+    ctx.block_compression_min_size_bytes = 0
+    try:
+        n = 10000
+
+        def add_text(batch):
+            return {"id": batch["id"], "text": ["hello world"] * len(batch["id"])}
+
+        ds = ray.data.range(n, parallelism=2).map_batches(add_text)
+        tables = ray.get(ds.to_arrow_refs())
+        assert all(isinstance(t, pa.Table) for t in tables)
+        ids = sorted(i for t in tables for i in t["id"].to_pylist())
+        assert ids == list(range(n))
+        for b in ray.get(ds.get_internal_block_refs()):
+            assert not isinstance(b, bytes)
+    finally:
+        ctx.block_compression = old_compression
+        ctx.block_compression_min_size_bytes = old_min_size_bytes
+
+
 def test_get_internal_block_refs(ray_start_regular_shared):
     blocks = ray.data.range(10, parallelism=10).get_internal_block_refs()
     assert len(blocks) == 10
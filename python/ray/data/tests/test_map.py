@@ -1,3 +1,4 @@
+import collections
 import itertools
 import math
 import os
@@ -14,6 +15,7 @@ import pytest
 
 import ray
 from ray._private.test_utils import wait_for_condition
+from ray.data._internal.lazy_block_list import LazyBlockList
 from ray.data.block import BlockAccessor
 from ray.data.context import DataContext
 from ray.data.tests.conftest import *  # noqa
@@ -894,6 +896,53 @@ def test_random_sample_checks(ray_start_regular_shared):
         ray.data.range(1).random_sample(10)
 
 
+def test_random_sample_block_level(ray_start_regular_shared):
+    ds = ray.data.range(1000, parallelism=100)
+    sample = ds.random_sample(0.1, seed=0, block_level=True)
+    rows = extract_values("id", sample.take_all())
+    assert len(rows) == 100
+    # Whole blocks of 10 consecutive rows are sampled.
+    assert len(set(rows)) == 100
+    assert len({r // 10 for r in rows}) == 10
+
+    assert ds.random_sample(0, block_level=True).count() == 0
+    assert ds.random_sample(1, block_level=True).count() == 1000
+
+
+def test_stratified_sample(ray_start_regular_shared):
+    ds = ray.data.from_items([{"label": x % 3, "value": x} for x in range(3000)])
+    sample = ds.stratified_sample("label", {0: 0.0, 1: 1.0, 2: 0.5}, seed=0)
+    counts = collections.Counter(row["label"] for row in sample.take_all())
+    assert counts[0] == 0
+    assert counts[1] == 1000
+    assert 300 < counts[2] < 700
+
+    # Keys without a fraction are dropped.
+    assert ds.stratified_sample("label", {1: 1.0}).count() == 1000
+
+    with pytest.raises(ValueError):
+        ds.stratified_sample("label", {1: 2.0})
+
+    # Blocks with the same keys don't sample the same row positions.
+    ds = ray.data.range(1000, parallelism=10).add_column("label", lambda df: 0)
+    sample = ds.stratified_sample("label", {0: 0.5}, seed=0)
+    rows = extract_values("id", sample.take_all())
+    positions = {
+        tuple(r % 100 for r in rows if r // 100 == block) for block in range(10)
+    }
+    assert len(positions) > 1
+    assert extract_values("id", sample.take_all()) == rows
+
+
+def test_random_sample_block_level_lazy(ray_start_regular_shared):
+    ds = ray.data.range(1000, parallelism=100)
+    sample = ds.random_sample(0.1, seed=0, block_level=True)
+    # Only the sampled read tasks are kept, without executing the datastream.
+    assert isinstance(sample._plan._in_blocks, LazyBlockList)
+    assert len(sample._plan._in_blocks._tasks) == 10
+    assert sample.count() == 100
+
+
 # NOTE: All tests above share a Ray cluster, while the tests below do not. These
 # tests should only be carefully reordered to retain this invariant!
 
@@ -17,12 +17,14 @@ from ray.data._internal.equalize import (
 from ray.data._internal.plan import ExecutionPlan
 from ray.data._internal.stats import DatastreamStats
 from ray.data._internal.split import (
+    _calculate_blocks_rows,
     _drop_empty_block_split,
     _generate_valid_indices,
     _generate_per_block_split_indices,
     _generate_global_split_results,
     _split_single_block,
     _split_at_indices,
+    _split_meta_at_indices,
 )
 from ray.data.block import BlockAccessor
 from ray.data.datastream import Dataset
@@ -597,6 +599,34 @@ def test_drop_empty_block_split():
     assert [] == _drop_empty_block_split([0], 0)
 
 
+def test_split_meta_at_indices():
+    meta = BlockMetadata(
+        num_rows=10,
+        size_bytes=100,
+        schema=None,
+        input_files=["a"],
+        exec_stats=None,
+    )
+    split_meta = _split_meta_at_indices(meta, [3, 5])
+    assert [m.num_rows for m in split_meta] == [3, 2, 5]
+    assert [m.size_bytes for m in split_meta] == [30, 20, 50]
+    assert all(m.input_files == ["a"] for m in split_meta)
+
+    meta = _create_meta(10)
+    split_meta = _split_meta_at_indices(meta, [7])
+    assert [m.num_rows for m in split_meta] == [7, 3]
+    assert [m.size_bytes for m in split_meta] == [None, None]
+
+
+def test_calculate_blocks_rows(ray_start_regular_shared):
+    blocks_with_metadata = _create_blocks_with_metadata([[1, 2], [3], [4, 5, 6]])
+    # Row counts missing from the metadata are fetched from the blocks.
+    blocks_with_metadata[0][1].num_rows = None
+    blocks_with_metadata[2][1].num_rows = None
+    assert _calculate_blocks_rows(blocks_with_metadata) == [2, 1, 3]
+    assert [m.num_rows for _, m in blocks_with_metadata] == [2, 1, 3]
+
+
 def verify_splits(splits, blocks_by_split):
     assert len(splits) == len(blocks_by_split)
     for blocks, (block_refs, meta) in zip(blocks_by_split, splits):
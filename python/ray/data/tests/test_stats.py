@@ -1,13 +1,20 @@
 from collections import Counter
 import re
+import threading
 import numpy as np
 
 import pytest
 
 import ray
-from ray.data._internal.stats import _StatsActor, DatastreamStats
+from ray.data._internal.stats import (
+    _ColumnarBlockStats,
+    _StatsActor,
+    _get_or_create_stats_actor,
+    _stats_actor_shard,
+    DatastreamStats,
+)
 from ray.data._internal.datastream_logger import DatastreamLogger
-from ray.data.block import BlockMetadata
+from ray.data.block import BlockExecStats, BlockMetadata
 from ray.data.context import DataContext
 from ray.data.tests.util import column_udf
 from ray.tests.conftest import *  # noqa
@@ -1147,6 +1154,104 @@ def test_stats_actor_cap_num_stats(ray_start_cluster):
     assert ray.get(actor._get_stats_dict_size.remote()) == (3, 2, 2)
 
 
+def test_stats_actor_record_task_batch(ray_start_cluster):
+    actor = _StatsActor.remote()
+    actor.record_start.remote("a")
+    actor.record_start.remote("b")
+    metadata = BlockMetadata(
+        num_rows=10, size_bytes=100, schema=None, input_files=None, exec_stats=None
+    )
+    actor.record_task_batch.remote(
+        [("a", 0, [metadata]), ("b", 0, [metadata, metadata]), ("c", 0, [metadata])]
+    )
+    assert ray.get(actor.get.remote("a"))[0] == {0: [metadata]}
+    assert ray.get(actor.get.remote("b"))[0] == {0: [metadata, metadata]}
+    # Stats for uuids without a recorded start are ignored.
+    assert ray.get(actor.get.remote("c"))[0] == {}
+
+
+def test_columnar_block_stats(ray_start_regular_shared):
+    exec_stats = BlockExecStats()
+    exec_stats.wall_time_s = 1.5
+    exec_stats.cpu_time_s = 0.5
+    exec_stats.max_rss_bytes = 1024
+    exec_stats.node_id = "node_1"
+    with_stats = BlockMetadata(
+        num_rows=3, size_bytes=30, schema=None, input_files=None, exec_stats=exec_stats
+    )
+    without_stats = BlockMetadata(
+        num_rows=None, size_bytes=None, schema=None, input_files=None, exec_stats=None
+    )
+
+    table = _ColumnarBlockStats()
+    table.append(0, [with_stats, without_stats])
+    table.append(1, [without_stats])
+    # Retried tasks replace their previous report in place.
+    table.append(1, [with_stats])
+    assert len(table) == 2
+    assert len(table._num_rows) == 3
+
+    stats_map = table.to_stats_map()
+    assert sorted(stats_map) == [0, 1]
+    assert [m.num_rows for m in stats_map[0]] == [3, None]
+    assert [m.size_bytes for m in stats_map[0]] == [30, None]
+    assert stats_map[0][1].exec_stats is None
+    for meta in (stats_map[0][0], stats_map[1][0]):
+        assert meta.exec_stats.wall_time_s == 1.5
+        assert meta.exec_stats.cpu_time_s == 0.5
+        assert meta.exec_stats.max_rss_bytes == 1024
+        assert meta.exec_stats.node_id == "node_1"
+
+    # Retries with a different number of blocks supersede the earlier rows, which
+    # are dropped on compaction.
+    table.append(0, [without_stats])
+    table.append(0, [with_stats, with_stats, with_stats])
+    assert len(table._num_rows) == 5
+    stats_map = table.to_stats_map()
+    assert [m.num_rows for m in stats_map[0]] == [3, 3, 3]
+    assert [m.num_rows for m in stats_map[1]] == [3]
+
+
+def test_stats_summary_waits_for_read_task_stats(ray_start_regular_shared):
+    stats_uuid = "test_stats_summary_waits_for_read_task_stats"
+    actor = _get_or_create_stats_actor(stats_uuid)
+    ray.get(actor.record_start.remote(stats_uuid))
+
+    def metadata(num_rows):
+        return BlockMetadata(
+            num_rows=num_rows,
+            size_bytes=None,
+            schema=None,
+            input_files=None,
+            exec_stats=None,
+        )
+
+    stats = DatastreamStats(
+        stages={"Read": [metadata(1), metadata(1), metadata(1)]},
+        parent=None,
+        needs_stats_actor=True,
+        stats_uuid=stats_uuid,
+        read_task_metadata=[[metadata(1)], [metadata(1), metadata(1)]],
+        finished_read_tasks=[0, 1],
+    )
+    # Stats of finished tasks can arrive at the stats actor after execution.
+    ray.get(actor.record_task.remote(stats_uuid, 1, [metadata(2), metadata(3)]))
+    threading.Timer(
+        0.5, lambda: actor.record_task.remote(stats_uuid, 0, [metadata(4)])
+    ).start()
+    stats.to_summary()
+    assert [m.num_rows for m in stats.stages["Read"]] == [4, 2, 3]
+
+
+def test_stats_actor_shard():
+    assert _stats_actor_shard("uuid", 1) == 0
+    assert _stats_actor_shard(None, 4) == 0
+    shards = {_stats_actor_shard(str(i), 4) for i in range(100)}
+    assert shards == {0, 1, 2, 3}
+    # The shard assignment must be stable across processes.
+    assert _stats_actor_shard("uuid", 4) == _stats_actor_shard("uuid", 4)
+
+
 if __name__ == "__main__":
     import sys
 
@@ -7,6 +7,8 @@ import pytest
 
 import ray
 from ray.data.block import BlockAccessor
+from ray.data.context import DataContext
+from ray.data._internal.arrow_block import maybe_compress_block
 from ray.data.extensions import (
     ArrowTensorArray,
     ArrowTensorType,
@@ -308,6 +310,35 @@ def test_arrow_block_select():
         block = block_accessor.select([lambda x: x % 3, "two"])
 
 
+@pytest.mark.parametrize("codec", ["lz4", "zstd"])
+def test_arrow_block_compression(codec):
+    table = pa.table({"text": ["hello world"] * 100000, "id": list(range(100000))})
+    ctx = DataContext.get_current()
+    old_compression = ctx.block_compression
+    try:
+        ctx.block_compression = None
+        assert maybe_compress_block(table, ctx) is table
+
+        ctx.block_compression = codec
+        block = maybe_compress_block(table, ctx)
+        assert isinstance(block, bytes)
+        assert len(block) < table.nbytes
+        # Compressed blocks are transparently decompressed on access.
+        accessor = BlockAccessor.for_block(block)
+        assert accessor.num_rows() == table.num_rows
+        assert accessor.to_arrow().equals(table)
+
+        # Small blocks are not compressed.
+        small_table = table.slice(0, 10)
+        assert maybe_compress_block(small_table, ctx) is small_table
+
+        # Blocks that don't compress well are not compressed.
+        random_table = pa.table({"x": np.random.random(1000000)})
+        assert maybe_compress_block(random_table, ctx) is random_table
+    finally:
+        ctx.block_compression = old_compression
+
+
 def test_arrow_block_slice_copy():
     # Test that ArrowBlock slicing properly copies the underlying Arrow
     # table.
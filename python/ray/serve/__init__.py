@@ -19,6 +19,7 @@ try:
     from ray.serve.air_integrations import PredictorDeployment
     from ray.serve.batching import batch
     from ray.serve.config import HTTPOptions
+    from ray.serve.multiplex import get_multiplexed_model_id, multiplexed
 except ModuleNotFoundError as e:
     e.msg += (
         '. You can run `pip install "ray[serve]"` to install all Ray Serve'
@@ -37,11 +38,13 @@ __all__ = [
     "start",
     "HTTPOptions",
     "get_replica_context",
+    "get_multiplexed_model_id",
     "shutdown",
     "ingress",
     "deployment",
     "get_deployment",
     "list_deployments",
+    "multiplexed",
     "run",
     "PredictorDeployment",
     "delete",
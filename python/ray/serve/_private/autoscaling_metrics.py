@@ -1,11 +1,12 @@
-import bisect
 import logging
 import threading
 import time
-from collections import defaultdict
+from collections import deque
 from dataclasses import dataclass, field
 from threading import Event
-from typing import Callable, DefaultDict, Dict, List, Optional, Type
+from typing import Callable, Deque, Dict, List, Optional, Tuple, Type
+
+import numpy as np
 
 import ray
 from ray.serve._private.constants import SERVE_LOGGER_NAME
@@ -89,11 +90,138 @@ class TimeStampedValue:
     value: float = field(compare=False)
 
 
+class _RingBufferTimeSeries:
+    """Timestamp-ordered ring buffer of the data points of one time series.
+
+    The buffer grows up to `max_points`, after which the oldest points are
+    overwritten. A running sum and a monotonic deque of candidates for the
+    max are maintained over the buffered points, so the average and max over
+    a window whose start only moves forward are O(1) amortized: moving the
+    window start forward drops the points before it.
+    """
+
+    INITIAL_CAPACITY = 64
+
+    def __init__(self, max_points: int):
+        self.max_points = max_points
+        self.capacity = min(self.INITIAL_CAPACITY, max_points)
+        self.timestamps = np.empty(self.capacity, dtype=np.float64)
+        self.values = np.empty(self.capacity, dtype=np.float64)
+        # Logical indices of the oldest point and one past the newest point,
+        # the physical position in the arrays is the index modulo capacity.
+        self.start = 0
+        self.end = 0
+        self.sum = 0.0
+        # Logical indices of the points that can still become the max, their
+        # values are decreasing.
+        self.max_candidates: Deque[int] = deque()
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    def _value(self, idx: int) -> float:
+        return self.values[idx % self.capacity]
+
+    def _timestamp(self, idx: int) -> float:
+        return self.timestamps[idx % self.capacity]
+
+    def to_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the timestamps and values of the points in order."""
+        positions = np.arange(self.start, self.end) % self.capacity
+        return self.timestamps[positions], self.values[positions]
+
+    def _reset(self, capacity: int, timestamps: np.ndarray, values: np.ndarray):
+        self.capacity = capacity
+        self.timestamps = np.empty(capacity, dtype=np.float64)
+        self.values = np.empty(capacity, dtype=np.float64)
+        self.start = self.end = 0
+        self.sum = 0.0
+        self.max_candidates.clear()
+        for timestamp, value in zip(timestamps[-capacity:], values[-capacity:]):
+            self._append_in_order(float(timestamp), float(value))
+
+    def append(self, timestamp: float, value: float):
+        if len(self) > 0 and timestamp < self._timestamp(self.end - 1):
+            # Rare case of a point arriving out of order, rebuild the buffer.
+            timestamps, values = self.to_arrays()
+            idx = np.searchsorted(timestamps, timestamp, side="right")
+            capacity = self.capacity
+            if len(self) == capacity:
+                capacity = min(2 * capacity, self.max_points)
+            self._reset(
+                capacity,
+                np.insert(timestamps, idx, timestamp),
+                np.insert(values, idx, value),
+            )
+            return
+
+        if len(self) == self.capacity:
+            if self.capacity < self.max_points:
+                self._reset(
+                    min(2 * self.capacity, self.max_points), *self.to_arrays()
+                )
+            else:
+                self._pop_oldest()
+        self._append_in_order(timestamp, value)
+
+    def _append_in_order(self, timestamp: float, value: float):
+        position = self.end % self.capacity
+        self.timestamps[position] = timestamp
+        self.values[position] = value
+        self.sum += value
+        while self.max_candidates and self._value(self.max_candidates[-1]) <= value:
+            self.max_candidates.pop()
+        self.max_candidates.append(self.end)
+        self.end += 1
+
+    def _pop_oldest(self):
+        self.sum -= self._value(self.start)
+        if self.max_candidates[0] == self.start:
+            self.max_candidates.popleft()
+        self.start += 1
+        if len(self) == 0:
+            # Avoid accumulating floating point errors.
+            self.sum = 0.0
+
+    def compact(self, window_start_timestamp_s: float):
+        """Drop all the points at or before window_start_timestamp_s."""
+        while len(self) > 0 and self._timestamp(self.start) <= window_start_timestamp_s:
+            self._pop_oldest()
+
+    def average(self) -> Optional[float]:
+        if len(self) == 0:
+            return None
+        return self.sum / len(self)
+
+    def max(self) -> Optional[float]:
+        if len(self) == 0:
+            return None
+        return float(self._value(self.max_candidates[0]))
+
+
 class InMemoryMetricsStore:
-    """A very simple, in memory time series database"""
+    """A very simple, in memory time series database.
+
+    Each time series is kept in a ring buffer of at most `max_points_per_key`
+    points with incrementally maintained aggregates, so windowed queries with
+    compaction are O(1) amortized.
+    """
 
-    def __init__(self):
-        self.data: DefaultDict[str, List[TimeStampedValue]] = defaultdict(list)
+    def __init__(self, max_points_per_key: int = 4096):
+        self.max_points_per_key = max_points_per_key
+        self._series: Dict[str, _RingBufferTimeSeries] = dict()
+
+    @property
+    def data(self) -> Dict[str, List[TimeStampedValue]]:
+        """All the data points of each time series, in timestamp order."""
+        data = dict()
+        for key, series in self._series.items():
+            timestamps, values = series.to_arrays()
+            data[key] = [
+                TimeStampedValue(timestamp, value)
+                for timestamp, value in zip(timestamps.tolist(), values.tolist())
+            ]
+        return data
 
     def add_metrics_point(self, data_points: Dict[str, float], timestamp: float):
         """Push new data points to the store.
@@ -106,21 +234,21 @@ class InMemoryMetricsStore:
               collected at.
         """
         for name, value in data_points.items():
-            # Using in-sort to insert while maintaining sorted ordering.
-            bisect.insort(a=self.data[name], x=TimeStampedValue(timestamp, value))
-
-    def _get_datapoints(self, key: str, window_start_timestamp_s: float) -> List[float]:
-        """Get all data points given key after window_start_timestamp_s"""
-
-        datapoints = self.data[key]
-
-        idx = bisect.bisect(
-            a=datapoints,
-            x=TimeStampedValue(
-                timestamp=window_start_timestamp_s, value=0  # dummy value
-            ),
-        )
-        return datapoints[idx:]
+            series = self._series.get(name)
+            if series is None:
+                series = self._series[name] = _RingBufferTimeSeries(
+                    self.max_points_per_key
+                )
+            series.append(timestamp, value)
+
+    def _get_datapoints(self, key: str, window_start_timestamp_s: float) -> np.ndarray:
+        """Get the values of all data points given key after window_start_timestamp_s"""
+        series = self._series.get(key)
+        if series is None:
+            return np.empty(0, dtype=np.float64)
+        timestamps, values = series.to_arrays()
+        idx = np.searchsorted(timestamps, window_start_timestamp_s, side="right")
+        return values[idx:]
 
     def window_average(
         self, key: str, window_start_timestamp_s: float, do_compact: bool = True
@@ -139,14 +267,17 @@ class InMemoryMetricsStore:
             The average of all the datapoints for the key on and after time
             window_start_timestamp_s, or None if there are no such points.
         """
-        points_after_idx = self._get_datapoints(key, window_start_timestamp_s)
-
-        if do_compact:
-            self.data[key] = points_after_idx
-
-        if len(points_after_idx) == 0:
-            return
-        return sum(point.value for point in points_after_idx) / len(points_after_idx)
+        if not do_compact:
+            points = self._get_datapoints(key, window_start_timestamp_s)
+            if len(points) == 0:
+                return None
+            return float(points.mean())
+
+        series = self._series.get(key)
+        if series is None:
+            return None
+        series.compact(window_start_timestamp_s)
+        return series.average()
 
     def max(self, key: str, window_start_timestamp_s: float, do_compact: bool = True):
         """Perform a max operation for metric `key`.
@@ -163,9 +294,14 @@ class InMemoryMetricsStore:
             Max value of the data points for the key on and after time
             window_start_timestamp_s, or None if there are no such points.
         """
-        points_after_idx = self._get_datapoints(key, window_start_timestamp_s)
-
-        if do_compact:
-            self.data[key] = points_after_idx
-
-        return max((point.value for point in points_after_idx), default=None)
+        if not do_compact:
+            points = self._get_datapoints(key, window_start_timestamp_s)
+            if len(points) == 0:
+                return None
+            return float(points.max())
+
+        series = self._series.get(key)
+        if series is None:
+            return None
+        series.compact(window_start_timestamp_s)
+        return series.max()
@@ -1,10 +1,11 @@
 from abc import ABCMeta, abstractmethod
 import math
+import time
 
 from ray.serve.config import AutoscalingConfig
 from ray.serve._private.constants import CONTROL_LOOP_PERIOD_S
 
-from typing import List
+from typing import Callable, List, Optional
 
 
 def calculate_desired_num_replicas(
@@ -89,6 +90,36 @@ class AutoscalingPolicy:
         """
         return curr_target_num_replicas
 
+    def record_replica_startup_time(self, startup_time_s: float):
+        """Record how long a new replica took to start.
+
+        Called each time a replica of the deployment transitions to RUNNING.
+        """
+        pass
+
+    def get_num_standby_replicas(self, curr_target_num_replicas: int) -> int:
+        """Decide how many standby replicas to keep.
+
+        Standby replicas are initialized ahead of time and promoted to running
+        replicas when the deployment scales up. By default, up to
+        `max_standby_replicas` are kept, but no more than the number of
+        replicas the deployment can still scale up by.
+
+        Arguments:
+            curr_target_num_replicas: The number of replicas that the
+                deployment is currently trying to scale to.
+
+        Returns:
+            int: The number of standby replicas to keep.
+        """
+        return max(
+            0,
+            min(
+                self.config.max_standby_replicas,
+                self.config.max_replicas - curr_target_num_replicas,
+            ),
+        )
+
 
 class BasicAutoscalingPolicy(AutoscalingPolicy):
     """The default autoscaling policy based on basic thresholds for scaling.
@@ -176,3 +207,144 @@ class BasicAutoscalingPolicy(AutoscalingPolicy):
             self.decision_counter = 0
 
         return decision_num_replicas
+
+
+class PredictiveAutoscalingPolicy(BasicAutoscalingPolicy):
+    """Autoscaling policy that scales ahead of the forecasted load.
+
+    The load (ongoing plus queued requests) is forecasted from:
+    - a level and trend, smoothed exponentially with a time constant of
+      `look_back_period_s` (Holt's linear trend method).
+    - a seasonal profile: the average load in each of `NUM_SEASONAL_BUCKETS`
+      buckets of `seasonality_period_s` (a day by default), blended across
+      periods.
+
+    The forecast looks ahead by the measured replica startup time, so replicas
+    for a predictable ramp are running by the time the load arrives. Scaling
+    up to the forecast happens right away; scaling down keeps the delays of
+    BasicAutoscalingPolicy and never goes below the forecast.
+    """
+
+    NUM_SEASONAL_BUCKETS = 288
+    # Weight of the most recent period when updating the seasonal profile.
+    SEASONAL_WEIGHT = 0.5
+
+    def __init__(
+        self,
+        config: AutoscalingConfig,
+        time_fn: Callable[[], float] = time.time,
+    ):
+        super().__init__(config)
+        self._time_fn = time_fn
+        self.seasonality_period_s = config.seasonality_period_s
+        self.bucket_width_s = self.seasonality_period_s / self.NUM_SEASONAL_BUCKETS
+
+        self.level: Optional[float] = None
+        # Change of the level per second.
+        self.trend = 0.0
+        self._last_update_time: Optional[float] = None
+
+        # Average load of each bucket of the seasonality period, None if the
+        # bucket hasn't been observed yet.
+        self.seasonal_profile: List[Optional[float]] = [
+            None
+        ] * self.NUM_SEASONAL_BUCKETS
+        self._curr_bucket: Optional[int] = None
+        self._curr_bucket_sum = 0.0
+        self._curr_bucket_count = 0
+
+        # Exponentially weighted moving average of replica startup times.
+        self.replica_startup_time_s: Optional[float] = None
+
+    def record_replica_startup_time(self, startup_time_s: float):
+        if self.replica_startup_time_s is None:
+            self.replica_startup_time_s = startup_time_s
+        else:
+            self.replica_startup_time_s = (
+                0.5 * startup_time_s + 0.5 * self.replica_startup_time_s
+            )
+
+    def _bucket(self, timestamp: float) -> int:
+        return int(timestamp // self.bucket_width_s) % self.NUM_SEASONAL_BUCKETS
+
+    def _update_seasonal_profile(self, now: float, load: float):
+        bucket = self._bucket(now)
+        if bucket != self._curr_bucket and self._curr_bucket_count > 0:
+            mean_load = self._curr_bucket_sum / self._curr_bucket_count
+            prev = self.seasonal_profile[self._curr_bucket]
+            if prev is None:
+                self.seasonal_profile[self._curr_bucket] = mean_load
+            else:
+                self.seasonal_profile[self._curr_bucket] = (
+                    self.SEASONAL_WEIGHT * mean_load
+                    + (1 - self.SEASONAL_WEIGHT) * prev
+                )
+            self._curr_bucket_sum = 0.0
+            self._curr_bucket_count = 0
+        self._curr_bucket = bucket
+        self._curr_bucket_sum += load
+        self._curr_bucket_count += 1
+
+    def _update_level_and_trend(self, now: float, load: float):
+        if self.level is None:
+            self.level = load
+            self._last_update_time = now
+            return
+
+        dt = now - self._last_update_time
+        if dt <= 0:
+            return
+        self._last_update_time = now
+        # Convert the time constant to smoothing factors for this interval.
+        alpha = 1 - math.exp(-dt / self.config.look_back_period_s)
+        prev_level = self.level
+        self.level = alpha * load + (1 - alpha) * (prev_level + self.trend * dt)
+        self.trend = alpha * (self.level - prev_level) / dt + (1 - alpha) * self.trend
+
+    def forecast_load(self, now: float, horizon_s: float) -> float:
+        """Forecast the load `horizon_s` seconds after `now`."""
+        forecast = self.level + self.trend * horizon_s
+        # Add the change in load observed at the same time in past periods.
+        curr_seasonal = self.seasonal_profile[self._bucket(now)]
+        future_seasonal = self.seasonal_profile[self._bucket(now + horizon_s)]
+        if curr_seasonal is not None and future_seasonal is not None:
+            forecast += future_seasonal - curr_seasonal
+        return max(0.0, forecast)
+
+    def get_decision_num_replicas(
+        self,
+        curr_target_num_replicas: int,
+        current_num_ongoing_requests: List[float],
+        current_handle_queued_queries: float,
+    ) -> int:
+        now = self._time_fn()
+        load = sum(current_num_ongoing_requests) + current_handle_queued_queries
+        self._update_level_and_trend(now, load)
+        self._update_seasonal_profile(now, load)
+
+        decision_num_replicas = super().get_decision_num_replicas(
+            curr_target_num_replicas,
+            current_num_ongoing_requests,
+            current_handle_queued_queries,
+        )
+
+        horizon_s = self.replica_startup_time_s or 0.0
+        forecast_num_replicas = math.ceil(
+            self.forecast_load(now, horizon_s)
+            / self.config.target_num_ongoing_requests_per_replica
+        )
+        forecast_num_replicas = min(self.config.max_replicas, forecast_num_replicas)
+        if forecast_num_replicas > decision_num_replicas:
+            self.decision_counter = 0
+            decision_num_replicas = forecast_num_replicas
+
+        return decision_num_replicas
+
+
+def create_autoscaling_policy(config: AutoscalingConfig) -> AutoscalingPolicy:
+    if config.policy == "basic":
+        return BasicAutoscalingPolicy(config)
+    elif config.policy == "predictive":
+        return PredictiveAutoscalingPolicy(config)
+    else:
+        raise ValueError(f"Unknown autoscaling policy '{config.policy}'.")
@@ -15,7 +15,7 @@ from ray.serve.generated.serve_pb2 import (
     ApplicationStatusInfo as ApplicationStatusInfoProto,
     StatusOverview as StatusOverviewProto,
 )
-from ray.serve._private.autoscaling_policy import BasicAutoscalingPolicy
+from ray.serve._private.autoscaling_policy import create_autoscaling_policy
 
 EndpointTag = str
 ReplicaTag = str
@@ -36,6 +36,8 @@ class ReplicaState(str, Enum):
     UPDATING = "UPDATING"
     RECOVERING = "RECOVERING"
     RUNNING = "RUNNING"
+    # Initialized but not receiving requests until promoted to RUNNING.
+    STANDBY = "STANDBY"
     STOPPING = "STOPPING"
 
 
@@ -210,7 +212,7 @@ class DeploymentInfo:
         self.app_name = app_name
         self.route_prefix = route_prefix
         if deployment_config.autoscaling_config is not None:
-            self.autoscaling_policy = BasicAutoscalingPolicy(
+            self.autoscaling_policy = create_autoscaling_policy(
                 deployment_config.autoscaling_config
             )
         else:
@@ -325,6 +327,8 @@ class RunningReplicaInfo:
     actor_handle: ActorHandle
     max_concurrent_queries: int
     is_cross_language: bool = False
+    # ID of the node the replica is running on. Not part of the replica identity.
+    node_id: Optional[str] = None
 
     def __post_init__(self):
         # Set hash value when object is constructed.
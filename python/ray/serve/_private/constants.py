@@ -13,6 +13,9 @@ SERVE_CONTROLLER_NAME = "SERVE_CONTROLLER_ACTOR"
 #: Actor name used to register HTTP proxy actor
 SERVE_PROXY_NAME = "SERVE_PROXY_ACTOR"
 
+#: Actor name used to register gRPC proxy actor
+SERVE_GRPC_PROXY_NAME = "SERVE_GRPC_PROXY_ACTOR"
+
 #: Ray namespace used for all Serve actors
 SERVE_NAMESPACE = "serve"
 
@@ -74,6 +77,10 @@ HEALTH_CHECK_METHOD = "check_health"
 #: Name of deployment reconfiguration method implemented by user.
 RECONFIGURE_METHOD = "reconfigure"
 
+#: Name of the static or class method implemented by user to prefetch model
+#: artifacts to node-local disk before the deployment is constructed.
+PREFETCH_METHOD = "prefetch"
+
 SERVE_ROOT_URL_ENV_KEY = "RAY_SERVE_ROOT_URL"
 
 #: Number of historically deleted deployments to store in the checkpoint.
@@ -128,6 +135,60 @@ SYNC_HANDLE_IN_DAG_FEATURE_FLAG_ENV_KEY = "SERVE_DEPLOYMENT_HANDLE_IS_SYNC"
 RECOVERING_LONG_POLL_BROADCAST_TIMEOUT_S = 10.0
 
 
+# Policy used by handles to choose the replica for each request, either
+# "round_robin" or "power_of_two_choices". The power of two choices policy is
+# opt-in; it prefers replicas on the handle's node while they have capacity.
+RAY_SERVE_ROUTING_POLICY = os.environ.get("RAY_SERVE_ROUTING_POLICY", "round_robin")
+
+# Smoothing factor for the exponentially weighted moving average of replica
+# latencies used by the power of two choices routing policy.
+ROUTING_LATENCY_EWMA_ALPHA = 0.2
+
+# Maximum number of ASGI messages of a streaming HTTP response that a replica
+# buffers before the generator producing them is paused until the HTTP proxy
+# pulls them.
+RAY_SERVE_HTTP_STREAM_MAX_BUFFERED_MESSAGES = int(
+    os.environ.get("RAY_SERVE_HTTP_STREAM_MAX_BUFFERED_MESSAGES", 16)
+)
+
+# HTTP request bodies larger than this are put in the object store once by the
+# HTTP proxy and read by the replica as a zero-copy buffer, instead of being
+# pickled inline with the request.
+RAY_SERVE_HTTP_BODY_OBJECT_STORE_THRESHOLD_BYTES = int(
+    os.environ.get("RAY_SERVE_HTTP_BODY_OBJECT_STORE_THRESHOLD_BYTES", 1024 * 1024)
+)
+
+# A streaming HTTP response is aborted and dropped from the replica if the HTTP
+# proxy hasn't pulled from it for this long, e.g. because the proxy died.
+RAY_SERVE_HTTP_STREAM_IDLE_TIMEOUT_S = float(
+    os.environ.get("RAY_SERVE_HTTP_STREAM_IDLE_TIMEOUT_S", 60)
+)
+
+# Number of recent request paths whose matching route is cached by the HTTP
+# proxy.
+RAY_SERVE_ROUTE_MATCH_CACHE_SIZE = int(
+    os.environ.get("RAY_SERVE_ROUTE_MATCH_CACHE_SIZE", 1024)
+)
+
+# HTTP header used to pass the ID of the multiplexed model a request is for.
+SERVE_MULTIPLEXED_MODEL_ID = "serve_multiplexed_model_id"
+
+# HTTP header used to pass the priority of a request. Queued requests with a
+# higher priority are sent to replicas first.
+SERVE_REQUEST_PRIORITY = "serve_request_priority"
+
+# HTTP header used to pass the number of seconds after which a request is
+# dropped if it hasn't been sent to a replica yet.
+SERVE_REQUEST_TIMEOUT_S = "serve_request_timeout_s"
+
+# gRPC metadata key used to pick the application a gRPC call is for, when
+# several applications have an ingress deployment named after its service.
+SERVE_GRPC_APPLICATION_NAME = "serve_application"
+
+# Default number of multiplexed models loaded in each replica.
+DEFAULT_MAX_NUM_MODELS_PER_REPLICA = 3
+
+
 class ServeHandleType(str, Enum):
     SYNC = "SYNC"
     ASYNC = "ASYNC"
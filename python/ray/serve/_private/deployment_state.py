@@ -10,7 +10,7 @@ import traceback
 from collections import defaultdict, OrderedDict
 from copy import copy
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set, Tuple, Union
 
 import ray
 from ray import ObjectRef, cloudpickle
@@ -39,6 +39,7 @@ from ray.serve.schema import (
 )
 from ray.serve.config import DeploymentConfig
 from ray.serve._private.constants import (
+    CONTROL_LOOP_PERIOD_S,
     MAX_DEPLOYMENT_CONSTRUCTOR_RETRY_COUNT,
     MAX_NUM_DELETED_DEPLOYMENTS,
     REPLICA_HEALTH_CHECK_UNHEALTHY_THRESHOLD,
@@ -210,6 +211,7 @@ class ActorReplicaWrapper:
         self._healthy: bool = True
         self._health_check_ref: Optional[ObjectRef] = None
         self._last_health_check_time: float = 0.0
+        self._next_health_check_time: float = 0.0
         self._consecutive_health_check_failures = 0
         # NOTE: storing these is necessary to keep the actor and PG alive in
         # the non-detached case.
@@ -290,6 +292,17 @@ class ActorReplicaWrapper:
         if self.deployment_config:
             return self.deployment_config.health_check_timeout_s
 
+    @property
+    def next_health_check_time(self) -> float:
+        """Time at which check_health() next has something to do.
+
+        While a health check is in flight, this is the current time so that
+        it's polled until it returns or times out.
+        """
+        if self._health_check_ref is not None:
+            return time.time()
+        return self._next_health_check_time
+
     @property
     def pid(self) -> Optional[int]:
         """Returns the pid of the actor, None if not started."""
@@ -648,11 +661,9 @@ class ActorReplicaWrapper:
 
         # If there's no active health check, kick off another and reset
         # the timer if it's been long enough since the last health
-        # check. Add some randomness to avoid synchronizing across all
-        # replicas.
-        time_since_last = time.time() - self._last_health_check_time
-        randomized_period = self.health_check_period_s * random.uniform(0.9, 1.1)
-        return time_since_last > randomized_period
+        # check. The next check time is randomized when a check is started
+        # to avoid synchronizing across all replicas.
+        return time.time() > self._next_health_check_time
 
     def check_health(self) -> bool:
         """Check if the actor is healthy.
@@ -699,6 +710,10 @@ class ActorReplicaWrapper:
 
         if self._should_start_new_health_check():
             self._last_health_check_time = time.time()
+            self._next_health_check_time = (
+                self._last_health_check_time
+                + self.health_check_period_s * random.uniform(0.9, 1.1)
+            )
             self._health_check_ref = self._actor_handle.check_health.remote()
 
         return self._healthy
@@ -750,6 +765,7 @@ class DeploymentReplica(VersionedReplica):
             actor_handle=self._actor.actor_handle,
             max_concurrent_queries=self._actor.max_concurrent_queries,
             is_cross_language=self._actor.is_cross_language,
+            node_id=self._actor.node_id,
         )
 
     def get_replica_details(self, state: ReplicaState) -> ReplicaDetails:
@@ -868,6 +884,11 @@ class DeploymentReplica(VersionedReplica):
         """
         return self._actor.check_health()
 
+    @property
+    def next_health_check_time(self) -> float:
+        """Time at which check_health() should be called next."""
+        return self._actor.next_health_check_time
+
     def resource_requirements(self) -> Tuple[str, str]:
         """Returns required and currently available resources.
 
@@ -894,11 +915,104 @@ class DeploymentReplica(VersionedReplica):
         return json.dumps(required), json.dumps(available)
 
 
+class TimerWheel:
+    """Hashed timer wheel to schedule many timers with O(1) operations.
+
+    Timers are hashed into `num_slots` slots of `tick_s` seconds by deadline.
+    pop_expired() only visits the slots for the ticks that elapsed since its
+    previous call, so its cost doesn't grow with the number of timers that
+    aren't due. Timers further out than the span of the wheel stay in their
+    slot until a later rotation reaches their deadline.
+    """
+
+    def __init__(self, tick_s: float, num_slots: int = 1024):
+        self._tick_s = tick_s
+        self._num_slots = num_slots
+        # Dicts are used as insertion-ordered sets of keys.
+        self._slots: List[Dict[Hashable, None]] = [dict() for _ in range(num_slots)]
+        # Map key -> (deadline, item). Keys in a slot without an entry here,
+        # or with a deadline hashing to another slot, are stale and dropped
+        # lazily when the slot is visited.
+        self._timers: Dict[Hashable, Tuple[float, Any]] = dict()
+        # Tick of the previous pop_expired() call, None if never called.
+        self._current_tick: Optional[int] = None
+
+    def __len__(self) -> int:
+        return len(self._timers)
+
+    def _tick(self, t: float) -> int:
+        return int(t // self._tick_s)
+
+    def schedule(self, key: Hashable, item: Any, deadline: float):
+        """Schedule the item to be returned once the deadline is reached.
+
+        Replaces any timer previously scheduled with the same key.
+        """
+        self._timers[key] = (deadline, item)
+        tick = self._tick(deadline)
+        if self._current_tick is not None:
+            # Past deadlines are returned by the next pop_expired() call.
+            tick = max(tick, self._current_tick)
+        self._slots[tick % self._num_slots][key] = None
+
+    def cancel(self, key: Hashable):
+        self._timers.pop(key, None)
+
+    def clear(self):
+        for slot in self._slots:
+            slot.clear()
+        self._timers.clear()
+
+    def pop_expired(self, now: float) -> List[Any]:
+        """Remove and return the items of all timers with deadline <= now."""
+        now_tick = self._tick(now)
+        if self._current_tick is None or now_tick - self._current_tick >= (
+            self._num_slots
+        ):
+            slot_indices = range(self._num_slots)
+        else:
+            # The current slot is visited again because timers may have been
+            # added to it since the previous call.
+            slot_indices = (
+                tick % self._num_slots
+                for tick in range(self._current_tick, now_tick + 1)
+            )
+        self._current_tick = max(now_tick, self._current_tick or now_tick)
+
+        expired = []
+        for slot_index in slot_indices:
+            slot = self._slots[slot_index]
+            for key in list(slot):
+                timer = self._timers.get(key)
+                if timer is None:
+                    del slot[key]
+                elif timer[0] <= now:
+                    del slot[key]
+                    del self._timers[key]
+                    expired.append(timer[1])
+                elif self._tick(timer[0]) % self._num_slots != slot_index:
+                    # The timer was rescheduled to another slot.
+                    del slot[key]
+
+        return expired
+
+
 class ReplicaStateContainer:
     """Container for mapping ReplicaStates to lists of DeploymentReplicas."""
 
     def __init__(self):
         self._replicas: Dict[ReplicaState, List[DeploymentReplica]] = defaultdict(list)
+        # Incremented whenever replicas are added or removed.
+        self._num_changes: int = 0
+
+    @property
+    def num_changes(self) -> int:
+        """Number of times replicas were added or removed.
+
+        Can be compared to a previous value to check if the container has
+        been modified since.
+        """
+        return self._num_changes
 
     def add(self, state: ReplicaState, replica: VersionedReplica):
         """Add the provided replica under the provided state.
@@ -910,6 +1024,7 @@ class ReplicaStateContainer:
         assert isinstance(state, ReplicaState)
         assert isinstance(replica, VersionedReplica)
         self._replicas[state].append(replica)
+        self._num_changes += 1
 
     def get(
         self, states: Optional[List[ReplicaState]] = None
@@ -980,6 +1095,9 @@ class ReplicaStateContainer:
             self._replicas[state] = remaining
             replicas.extend(popped)
 
+        if len(replicas) > 0:
+            self._num_changes += 1
+
         return replicas
 
     def count(
@@ -1066,6 +1184,25 @@ class DeploymentState:
             self._name, DeploymentStatus.UPDATING
         )
 
+        # Once the deployment reaches its target state, update() only checks
+        # the health of the running replicas that are due, as scheduled in
+        # this timer wheel, until the target state or the replicas change.
+        self._health_check_wheel = TimerWheel(tick_s=CONTROL_LOOP_PERIOD_S)
+        # self._replicas.num_changes when the deployment reached its target
+        # state, None if it isn't in its target state.
+        self._steady_state_num_changes: Optional[int] = None
+
+        # Map replica_tag -> IDs of the multiplexed models loaded on the
+        # replica, as reported by the replicas.
+        self._multiplexed_model_ids: Dict[str, List[str]] = dict()
+
+        # Tags of the STANDBY replicas that finished initializing and can be
+        # promoted to RUNNING.
+        self._ready_standby_replica_tags: Set[ReplicaTag] = set()
+        # Last time a standby replica failed to start, used to back off
+        # starting new standby replicas.
+        self._last_standby_failure_time: float = 0.0
+
         self.health_check_gauge = metrics.Gauge(
             "serve_deployment_replica_healthy",
             description=(
@@ -1101,14 +1238,26 @@ class DeploymentState:
             f"Recovering target state for deployment {self._name} from checkpoint."
         )
         self._target_state = target_state_checkpoint
+        self._notify_deployment_config_changed()
+
+    def get_standby_replica_tags(self) -> List[ReplicaTag]:
+        """Return the tags of the standby replicas, to be checkpointed so they
+        are recovered as standby replicas rather than running ones."""
+        return [
+            replica.replica_tag
+            for replica in self._replicas.get([ReplicaState.STANDBY])
+        ]
 
     def recover_current_state_from_replica_actor_names(
-        self, replica_actor_names: List[str]
+        self,
+        replica_actor_names: List[str],
+        standby_replica_tags: Optional[Set[ReplicaTag]] = None,
     ):
         assert self._target_state is not None, (
             "Target state should be recovered successfully first before "
             "recovering current state from replica actor names."
         )
+        standby_replica_tags = standby_replica_tags or set()
 
         logger.info(
             "Recovering current state for deployment "
@@ -1125,9 +1274,15 @@ class DeploymentState:
                 None,
             )
             new_deployment_replica.recover()
-            self._replicas.add(ReplicaState.RECOVERING, new_deployment_replica)
+            # Standby replicas don't serve requests, they become ready standby
+            # replicas again once _check_standby_replicas() sees them started.
+            if new_deployment_replica.replica_tag in standby_replica_tags:
+                state = ReplicaState.STANDBY
+            else:
+                state = ReplicaState.RECOVERING
+            self._replicas.add(state, new_deployment_replica)
             logger.debug(
-                f"RECOVERING replica: {new_deployment_replica.replica_tag}, "
+                f"{state.value} replica: {new_deployment_replica.replica_tag}, "
                 f"deployment: {self._name}."
             )
 
@@ -1169,6 +1324,31 @@ class DeploymentState:
             self.get_running_replica_infos(),
         )
 
+    def _notify_deployment_config_changed(self):
+        self._long_poll_host.notify_changed(
+            (LongPollNamespace.DEPLOYMENT_CONFIG, self._name),
+            self._target_state.info.deployment_config,
+        )
+
+    def _notify_multiplexed_model_ids_changed(self):
+        self._long_poll_host.notify_changed(
+            (LongPollNamespace.MULTIPLEXED_MODEL_IDS, self._name),
+            dict(self._multiplexed_model_ids),
+        )
+
+    def record_multiplexed_model_ids(self, replica_tag: str, model_ids: List[str]):
+        """Record the multiplexed models loaded on a running replica."""
+        running_replica_tags = {
+            replica.replica_tag
+            for replica in self._replicas.get([ReplicaState.RUNNING])
+        }
+        if replica_tag not in running_replica_tags:
+            # The report raced with the replica being stopped.
+            return
+
+        self._multiplexed_model_ids[replica_tag] = list(model_ids)
+        self._notify_multiplexed_model_ids_changed()
+
     def _set_target_state_deleting(self) -> None:
         """Set the target state for the deployment to be deleted."""
 
@@ -1183,6 +1363,7 @@ class DeploymentState:
         self._curr_status_info = DeploymentStatusInfo(
             self._name, DeploymentStatus.UPDATING
         )
+        self._steady_state_num_changes = None
         logger.info(f"Deleting deployment {self._name}.")
 
     def _set_target_state(self, target_info: DeploymentInfo) -> None:
@@ -1211,9 +1392,11 @@ class DeploymentState:
                 )
 
         self._target_state = target_state
+        self._notify_deployment_config_changed()
         self._curr_status_info = DeploymentStatusInfo(
             self._name, DeploymentStatus.UPDATING
         )
+        self._steady_state_num_changes = None
         self._replica_constructor_retry_counter = 0
         self._backoff_time_s = 1
 
@@ -1433,6 +1616,13 @@ class DeploymentState:
             return replicas_changed
 
         elif delta_replicas > 0:
+            # Initialized standby replicas are promoted first, new replicas
+            # are only started for the rest.
+            num_promoted = self._promote_standby_replicas(delta_replicas)
+            if num_promoted > 0:
+                replicas_changed = True
+                delta_replicas -= num_promoted
+
             # Don't ever exceed self._target_state.num_replicas.
             stopping_replicas = self._replicas.count(
                 states=[
@@ -1506,6 +1696,152 @@ class DeploymentState:
 
         return replicas_changed
 
+    def _target_num_standby_replicas(self) -> int:
+        """Number of standby replicas to keep, as decided by the autoscaler."""
+        if self._target_state.deleting or self._target_state.info is None:
+            return 0
+        autoscaling_policy = self._target_state.info.autoscaling_policy
+        if autoscaling_policy is None:
+            return 0
+        return autoscaling_policy.get_num_standby_replicas(
+            self._target_state.num_replicas
+        )
+
+    def _promote_standby_replicas(self, max_to_promote: int) -> int:
+        """Promote up to max_to_promote initialized standby replicas to RUNNING.
+
+        Returns the number of promoted replicas.
+        """
+        if self._replicas.count(states=[ReplicaState.STANDBY]) == 0:
+            return 0
+
+        num_promoted = 0
+        for replica in self._replicas.pop(states=[ReplicaState.STANDBY]):
+            if (
+                num_promoted < max_to_promote
+                and replica.replica_tag in self._ready_standby_replica_tags
+                and replica.version == self._target_state.version
+            ):
+                self._ready_standby_replica_tags.remove(replica.replica_tag)
+                self._replicas.add(ReplicaState.RUNNING, replica)
+                num_promoted += 1
+            else:
+                self._replicas.add(ReplicaState.STANDBY, replica)
+
+        if num_promoted > 0:
+            # Checkpoint before the promoted replicas receive requests, so
+            # that they aren't recovered as standby replicas.
+            self._save_checkpoint_func(writeahead_checkpoints=None)
+            logger.info(
+                f"Promoted {num_promoted} standby "
+                f"replica{'s' if num_promoted > 1 else ''} of deployment "
+                f"'{self._name}' to running."
+            )
+        return num_promoted
+
+    def _scale_standby_replicas(self):
+        """Start or stop standby replicas to match the autoscaler's target.
+
+        New standby replicas are only started once the deployment is healthy,
+        so that they don't compete with the replicas it's scaling up to.
+        """
+        # Outdated standby replicas are replaced by new ones. Recovered standby
+        # replicas don't have a version until they are checked as started.
+        for replica in self._replicas.pop(
+            exclude_version=self._target_state.version,
+            states=[ReplicaState.STANDBY],
+        ):
+            if replica.version is None:
+                self._replicas.add(ReplicaState.STANDBY, replica)
+            else:
+                self._stop_replica(replica)
+
+        target_num_standby = self._target_num_standby_replicas()
+        delta_standby = target_num_standby - self._replicas.count(
+            states=[ReplicaState.STANDBY]
+        )
+        if delta_standby > 0:
+            if (
+                self._curr_status_info.status != DeploymentStatus.HEALTHY
+                or time.time() - self._last_standby_failure_time
+                < self._backoff_time_s
+            ):
+                return
+
+            logger.info(
+                f"Adding {delta_standby} standby "
+                f"replica{'s' if delta_standby > 1 else ''} to deployment "
+                f"{self._name}."
+            )
+            new_standby_replicas = []
+            for _ in range(delta_standby):
+                replica_name = ReplicaName(self._name, get_random_letters())
+                new_deployment_replica = DeploymentReplica(
+                    self._controller_name,
+                    self._detached,
+                    replica_name.replica_tag,
+                    replica_name.deployment_tag,
+                    self._target_state.version,
+                )
+                self._replicas.add(ReplicaState.STANDBY, new_deployment_replica)
+                new_standby_replicas.append(new_deployment_replica)
+            # Checkpoint the standby replicas before starting their actors, so
+            # that they are recovered as standby replicas after a controller
+            # failure.
+            self._save_checkpoint_func(writeahead_checkpoints=None)
+            for new_deployment_replica in new_standby_replicas:
+                new_deployment_replica.start(
+                    self._target_state.info, self._target_state.version
+                )
+
+        elif delta_standby < 0:
+            # Standby replicas that are still initializing are stopped first.
+            for replica in self._replicas.pop(
+                states=[ReplicaState.STANDBY],
+                max_replicas=-delta_standby,
+                ranking_function=lambda replicas: sorted(
+                    replicas,
+                    key=lambda r: r.replica_tag in self._ready_standby_replica_tags,
+                ),
+            ):
+                self._stop_replica(replica)
+
+    def _check_standby_replicas(self):
+        """Check the startup and health of the standby replicas.
+
+        Standby replicas that fail to start or fail their health check are
+        stopped, and replaced by the next _scale_standby_replicas() call.
+        """
+        for replica in self._replicas.pop(states=[ReplicaState.STANDBY]):
+            if replica.replica_tag in self._ready_standby_replica_tags:
+                if replica.check_health():
+                    self._replicas.add(ReplicaState.STANDBY, replica)
+                else:
+                    logger.warning(
+                        f"Standby replica {replica.replica_tag} of deployment "
+                        f"{self._name} failed health check, stopping it."
+                    )
+                    self._stop_replica(replica, graceful_stop=False)
+                continue
+
+            start_status, error_msg = replica.check_started()
+            if start_status == ReplicaStartupStatus.SUCCEEDED:
+                self._ready_standby_replica_tags.add(replica.replica_tag)
+                self._replicas.add(ReplicaState.STANDBY, replica)
+                logger.info(
+                    f"Standby replica {replica.replica_tag} started successfully.",
+                    extra={"log_to_stderr": False},
+                )
+            elif start_status == ReplicaStartupStatus.FAILED:
+                logger.warning(
+                    f"Standby replica {replica.replica_tag} of deployment "
+                    f"{self._name} failed to start: {error_msg}"
+                )
+                self._last_standby_failure_time = time.time()
+                self._stop_replica(replica)
+            else:
+                self._replicas.add(ReplicaState.STANDBY, replica)
+
     def _check_curr_status(self) -> Tuple[bool, bool]:
         """Check the current deployment status.
 
@@ -1612,6 +1948,14 @@ class DeploymentState:
                 # set.
                 self._replicas.add(ReplicaState.RUNNING, replica)
                 transitioned_to_running = True
+                autoscaling_policy = self._target_state.info.autoscaling_policy
+                if (
+                    original_state == ReplicaState.STARTING
+                    and autoscaling_policy is not None
+                ):
+                    autoscaling_policy.record_replica_startup_time(
+                        time.time() - replica._start_time
+                    )
                 logger.info(
                     f"Replica {replica.replica_tag} started successfully.",
                     extra={"log_to_stderr": False},
@@ -1666,6 +2010,9 @@ class DeploymentState:
         """
         replica.stop(graceful=graceful_stop)
         self._replicas.add(ReplicaState.STOPPING, replica)
+        self._ready_standby_replica_tags.discard(replica.replica_tag)
+        if self._multiplexed_model_ids.pop(replica.replica_tag, None) is not None:
+            self._notify_multiplexed_model_ids_changed()
         self.health_check_gauge.set(
             0,
             tags={
@@ -1801,6 +2148,8 @@ class DeploymentState:
 
             self._prev_startup_warning = time.time()
 
+        self._check_standby_replicas()
+
         for replica in self._replicas.pop(states=[ReplicaState.STOPPING]):
             stopped = replica.check_stopped()
             if not stopped:
@@ -1808,6 +2157,76 @@ class DeploymentState:
 
         return running_replicas_changed
 
+    def _in_steady_state(self) -> bool:
+        """Whether nothing changed since the deployment reached its target state."""
+        return self._steady_state_num_changes == self._replicas.num_changes
+
+    def _maybe_enter_steady_state(self):
+        """Start tracking health checks incrementally if the target is reached.
+
+        The deployment is in its target state if it's healthy, all of its
+        replicas are running the target version and all of its standby
+        replicas are initialized.
+        """
+        standby_replicas = self._replicas.get([ReplicaState.STANDBY])
+        if (
+            self._target_state.deleting
+            or self._curr_status_info.status != DeploymentStatus.HEALTHY
+            or self._replicas.count(states=[ReplicaState.RUNNING])
+            != self._target_state.num_replicas
+            or self._replicas.count(
+                states=[
+                    ReplicaState.STARTING,
+                    ReplicaState.UPDATING,
+                    ReplicaState.RECOVERING,
+                    ReplicaState.STOPPING,
+                ]
+            )
+            > 0
+            or len(standby_replicas) != self._target_num_standby_replicas()
+            or any(
+                r.replica_tag not in self._ready_standby_replica_tags
+                for r in standby_replicas
+            )
+        ):
+            self._steady_state_num_changes = None
+            return
+
+        if not self._in_steady_state():
+            self._health_check_wheel.clear()
+            for replica in self._replicas.get(
+                [ReplicaState.RUNNING, ReplicaState.STANDBY]
+            ):
+                self._health_check_wheel.schedule(
+                    replica.replica_tag, replica, replica.next_health_check_time
+                )
+            self._steady_state_num_changes = self._replicas.num_changes
+
+    def _check_due_replicas_health(self) -> bool:
+        """Check the health of the running and standby replicas that are due.
+
+        Returns False if any of them is unhealthy, in which case the
+        deployment leaves its steady state.
+        """
+        for replica in self._health_check_wheel.pop_expired(time.time()):
+            if not replica.check_health():
+                self._steady_state_num_changes = None
+                return False
+
+            self.health_check_gauge.set(
+                1,
+                tags={
+                    "deployment": self._name,
+                    "replica": replica.replica_tag,
+                    "application": self.app_name,
+                },
+            )
+            self._health_check_wheel.schedule(
+                replica.replica_tag, replica, replica.next_health_check_time
+            )
+
+        return True
+
     def update(self) -> Tuple[bool, bool]:
         """Attempts to reconcile this deployment to match its goal state.
 
@@ -1820,11 +2239,17 @@ class DeploymentState:
         """
         deleted, any_replicas_recovering = False, False
         try:
+            # If nothing changed since the target state was reached, only the
+            # replicas with a health check due need to be looked at.
+            if self._in_steady_state() and self._check_due_replicas_health():
+                return deleted, any_replicas_recovering
+
             # Add or remove DeploymentReplica instances in self._replicas.
             # This should be the only place we adjust total number of replicas
             # we manage.
 
             running_replicas_changed = self._scale_deployment_replicas()
+            self._scale_standby_replicas()
 
             # Check the state of existing replicas and transition if necessary.
             running_replicas_changed |= self._check_and_update_replicas()
@@ -1833,12 +2258,14 @@ class DeploymentState:
                 self._notify_running_replicas_changed()
 
             deleted, any_replicas_recovering = self._check_curr_status()
+            self._maybe_enter_steady_state()
         except Exception:
             self._curr_status_info = DeploymentStatusInfo(
                 name=self._name,
                 status=DeploymentStatus.UNHEALTHY,
                 message="Failed to update deployment:" f"\n{traceback.format_exc()}",
             )
+            self._steady_state_num_changes = None
 
         return deleted, any_replicas_recovering
 
@@ -2025,6 +2452,14 @@ class DeploymentStateManager:
     def record_handle_metrics(self, data: Dict[str, float], send_timestamp: float):
         self.handle_metrics_store.add_metrics_point(data, send_timestamp)
 
+    def record_multiplexed_model_ids(
+        self, deployment_name: str, replica_tag: str, model_ids: List[str]
+    ):
+        if deployment_name in self._deployment_states:
+            self._deployment_states[deployment_name].record_multiplexed_model_ids(
+                replica_tag, model_ids
+            )
+
     def get_autoscaling_metrics(self):
         """
         Return autoscaling metrics (used for dumping from controller)
@@ -2078,10 +2513,16 @@ class DeploymentStateManager:
         )
         checkpoint = self._kv_store.get(CHECKPOINT_KEY)
         if checkpoint is not None:
+            checkpoint_data = cloudpickle.loads(checkpoint)
             (
                 deployment_state_info,
                 self._deleted_deployment_metadata,
-            ) = cloudpickle.loads(checkpoint)
+            ) = checkpoint_data[:2]
+            # Checkpoints written by older versions don't include the standby
+            # replicas.
+            standby_replica_tags = (
+                checkpoint_data[2] if len(checkpoint_data) > 2 else {}
+            )
 
             for deployment_tag, checkpoint_data in deployment_state_info.items():
                 if checkpoint_data.info.is_driver_deployment:
@@ -2093,7 +2534,8 @@ class DeploymentStateManager:
                 deployment_state.recover_target_state_from_checkpoint(checkpoint_data)
                 if len(deployment_to_current_replicas[deployment_tag]) > 0:
                     deployment_state.recover_current_state_from_replica_actor_names(  # noqa: E501
-                        deployment_to_current_replicas[deployment_tag]
+                        deployment_to_current_replicas[deployment_tag],
+                        set(standby_replica_tags.get(deployment_tag, [])),
                     )
                 self._deployment_states[deployment_tag] = deployment_state
 
@@ -2138,10 +2580,21 @@ class DeploymentStateManager:
         if writeahead_checkpoints is not None:
             deployment_state_info.update(writeahead_checkpoints)
 
+        # Standby replicas have the same actor names as running replicas, so
+        # they are checkpointed to recover them as standby replicas.
+        standby_replica_tags = {
+            deployment_name: deployment_state.get_standby_replica_tags()
+            for deployment_name, deployment_state in self._deployment_states.items()
+        }
+
         self._kv_store.put(
             CHECKPOINT_KEY,
             cloudpickle.dumps(
-                (deployment_state_info, self._deleted_deployment_metadata)
+                (
+                    deployment_state_info,
+                    self._deleted_deployment_metadata,
+                    standby_replica_tags,
+                )
             ),
         )
 
@@ -0,0 +1,390 @@
+import asyncio
+from collections import defaultdict
+import logging
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import grpc
+
+import ray
+from ray._private.tls_utils import add_port_to_grpc_server
+from ray._private.utils import get_or_create_event_loop
+from ray.exceptions import RayActorError, RayTaskError
+from ray.util import metrics
+
+from ray import serve
+from ray.serve.handle import RayServeHandle
+from ray.serve._private.common import EndpointInfo, EndpointTag, ApplicationName
+from ray.serve._private.constants import (
+    SERVE_LOGGER_NAME,
+    SERVE_NAMESPACE,
+    DEFAULT_LATENCY_BUCKET_MS,
+    DEPLOYMENT_NAME_PREFIX_SEPARATOR,
+    HEALTH_CHECK_METHOD,
+    PREFETCH_METHOD,
+    RECONFIGURE_METHOD,
+    SERVE_GRPC_APPLICATION_NAME,
+    SERVE_MULTIPLEXED_MODEL_ID,
+    SERVE_REQUEST_PRIORITY,
+    SERVE_REQUEST_TIMEOUT_S,
+)
+from ray.serve._private.http_proxy import HTTP_REQUEST_MAX_RETRIES
+from ray.serve._private.long_poll import LongPollClient, LongPollNamespace
+from ray.serve._private.logging_utils import access_log_msg, configure_component_logger
+from ray.serve._private.utils import get_random_letters
+from ray.serve.exceptions import BackPressureError, RequestDeadlineExceededError
+
+logger = logging.getLogger(SERVE_LOGGER_NAME)
+
+# Methods of the ingress deployment that Serve calls itself. They can't be called
+# through the gRPC proxy.
+SERVE_INTERNAL_METHODS = {HEALTH_CHECK_METHOD, PREFETCH_METHOD, RECONFIGURE_METHOD}
+
+
+def _is_callable_method(method: str) -> bool:
+    """Whether a gRPC method can be routed to the ingress deployment."""
+    return not method.startswith("_") and method not in SERVE_INTERNAL_METHODS
+
+
+async def _send_request_to_handle(
+    handle: RayServeHandle, request: bytes
+) -> Tuple[grpc.StatusCode, Any]:
+    """Send the serialized request to a replica and return its response.
+
+    Returns the status code of the call and the serialized response, or an
+    error message if the status code isn't OK.
+    """
+    retries = 0
+    backoff_time_s = 0.05
+    while retries < HTTP_REQUEST_MAX_RETRIES + 1:
+        try:
+            result = await (await handle.remote(request))
+            break
+        except BackPressureError as error:
+            # Rejected without being queued, so the client can retry elsewhere.
+            return grpc.StatusCode.UNAVAILABLE, str(error)
+        except RequestDeadlineExceededError as error:
+            return grpc.StatusCode.DEADLINE_EXCEEDED, str(error)
+        except RayTaskError as error:
+            return grpc.StatusCode.INTERNAL, f"Task Error. Traceback: {error}."
+        except RayActorError:
+            logger.info(
+                "Request failed due to replica failure. There are "
+                f"{HTTP_REQUEST_MAX_RETRIES - retries} retries "
+                "remaining."
+            )
+            await asyncio.sleep(backoff_time_s)
+            backoff_time_s *= 1.5
+            retries += 1
+    else:
+        return (
+            grpc.StatusCode.INTERNAL,
+            f"Task failed with {HTTP_REQUEST_MAX_RETRIES} retries.",
+        )
+
+    if isinstance(result, bytes):
+        return grpc.StatusCode.OK, result
+    if hasattr(result, "SerializeToString"):
+        return grpc.StatusCode.OK, result.SerializeToString()
+    return (
+        grpc.StatusCode.INTERNAL,
+        "Deployments called through gRPC must return bytes or a protobuf "
+        f"message, got {type(result).__name__}.",
+    )
+
+
+class gRPCProxy:
+    """Routes gRPC calls to the ingress deployments of Serve applications.
+
+    A call to `/<package>.<Service>/<Method>` is sent to the method named
+    `<Method>` of the ingress deployment named `<Service>`. If several
+    applications have such a deployment, the application is picked with the
+    "serve_application" metadata key. Requests and responses are passed as
+    serialized protobuf bytes, so the proxy doesn't need the protobuf
+    definitions and never decodes them.
+    """
+
+    def __init__(self, controller_name: str):
+        # Set the controller name so that serve will connect to the
+        # controller instance this proxy is running in.
+        ray.serve.context._set_internal_replica_context(
+            None, None, controller_name, None, None
+        )
+
+        # Map deployment name -> {application name: endpoint}.
+        self._service_routes: Dict[str, Dict[ApplicationName, EndpointTag]] = dict()
+        # Handles are created once per endpoint and method, sharing the
+        # endpoint's router.
+        self._handles: Dict[EndpointTag, RayServeHandle] = dict()
+        self._method_handles: Dict[Tuple[EndpointTag, str], RayServeHandle] = dict()
+
+        self.long_poll_client = LongPollClient(
+            ray.get_actor(controller_name, namespace=SERVE_NAMESPACE),
+            {
+                LongPollNamespace.ROUTE_TABLE: self._update_routes,
+            },
+            call_in_event_loop=get_or_create_event_loop(),
+        )
+        self.request_counter = metrics.Counter(
+            "serve_num_grpc_requests",
+            description="The number of gRPC requests processed.",
+            tag_keys=("route", "application"),
+        )
+        self.request_error_counter = metrics.Counter(
+            "serve_num_grpc_error_requests",
+            description="The number of gRPC calls that didn't return OK.",
+            tag_keys=("route", "error_code"),
+        )
+        self.processing_latency_tracker = metrics.Histogram(
+            "serve_grpc_request_latency_ms",
+            description=(
+                "The end-to-end latency of gRPC requests "
+                "(measured from the Serve gRPC proxy)."
+            ),
+            boundaries=DEFAULT_LATENCY_BUCKET_MS,
+            tag_keys=("route", "application"),
+        )
+
+    def _update_routes(self, endpoints: Dict[EndpointTag, EndpointInfo]) -> None:
+        service_routes = defaultdict(dict)
+        for endpoint, info in endpoints.items():
+            app_prefix = (
+                info.app_name + DEPLOYMENT_NAME_PREFIX_SEPARATOR
+                if info.app_name
+                else ""
+            )
+            deployment_name = endpoint
+            if endpoint.startswith(app_prefix):
+                deployment_name = endpoint[len(app_prefix) :]
+            service_routes[deployment_name][info.app_name] = endpoint
+        self._service_routes = dict(service_routes)
+
+        self._handles = {
+            endpoint: handle
+            for endpoint, handle in self._handles.items()
+            if endpoint in endpoints
+        }
+        self._method_handles = {
+            key: handle
+            for key, handle in self._method_handles.items()
+            if key[0] in endpoints
+        }
+
+    def match_service(
+        self, service: str, app_name: Optional[str] = None
+    ) -> Optional[Tuple[EndpointTag, ApplicationName]]:
+        """Return the endpoint and application a gRPC service is routed to.
+
+        The service is matched by its name without its package. Returns None
+        if no application has a matching ingress deployment, or if several
+        do and `app_name` isn't given.
+        """
+        apps = self._service_routes.get(service.rsplit(".", 1)[-1])
+        if not apps:
+            return None
+        if app_name is not None:
+            endpoint = apps.get(app_name)
+            return None if endpoint is None else (endpoint, app_name)
+        if len(apps) == 1:
+            ((app_name, endpoint),) = apps.items()
+            return endpoint, app_name
+        return None
+
+    def _get_handle(self, endpoint: EndpointTag, method: str) -> RayServeHandle:
+        assert _is_callable_method(method), method
+        handle = self._method_handles.get((endpoint, method))
+        if handle is None:
+            endpoint_handle = self._handles.get(endpoint)
+            if endpoint_handle is None:
+                endpoint_handle = serve.context.get_global_client().get_handle(
+                    endpoint, sync=False, missing_ok=True
+                )
+                self._handles[endpoint] = endpoint_handle
+            handle = endpoint_handle.options(method_name=method)
+            self._method_handles[(endpoint, method)] = handle
+        return handle
+
+    async def __call__(
+        self,
+        service: str,
+        method: str,
+        request: bytes,
+        context: grpc.aio.ServicerContext,
+    ) -> bytes:
+        """Handles a unary gRPC call with a serialized protobuf request."""
+        start_time = time.time()
+        route = f"/{service}/{method}"
+        metadata = dict(context.invocation_metadata() or ())
+
+        match = self.match_service(service, metadata.get(SERVE_GRPC_APPLICATION_NAME))
+        if match is None:
+            self._record_call(route, "", grpc.StatusCode.UNIMPLEMENTED, start_time)
+            await context.abort(
+                grpc.StatusCode.UNIMPLEMENTED,
+                f"Service '{service}' not found. Make sure an application has "
+                "an ingress deployment with the same name, and set the "
+                f"'{SERVE_GRPC_APPLICATION_NAME}' metadata key if several do.",
+            )
+        endpoint, app_name = match
+        if not _is_callable_method(method):
+            self._record_call(
+                route, app_name, grpc.StatusCode.UNIMPLEMENTED, start_time
+            )
+            await context.abort(
+                grpc.StatusCode.UNIMPLEMENTED,
+                f"Method '{method}' of service '{service}' can't be called. Private "
+                "methods and methods that Serve calls itself aren't exposed.",
+            )
+
+        deadline_s = None
+        time_remaining = context.time_remaining()
+        if time_remaining is not None:
+            deadline_s = start_time + time_remaining
+        try:
+            priority = int(metadata.get(SERVE_REQUEST_PRIORITY, 0))
+            if SERVE_REQUEST_TIMEOUT_S in metadata:
+                timeout_deadline_s = start_time + float(
+                    metadata[SERVE_REQUEST_TIMEOUT_S]
+                )
+                if deadline_s is None or timeout_deadline_s < deadline_s:
+                    deadline_s = timeout_deadline_s
+        except ValueError as e:
+            self._record_call(
+                route, app_name, grpc.StatusCode.INVALID_ARGUMENT, start_time
+            )
+            await context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT, f"Invalid request metadata: {e}"
+            )
+
+        ray.serve.context._serve_request_context.set(
+            ray.serve.context.RequestContext(
+                route,
+                get_random_letters(10),
+                app_name,
+                metadata.get(SERVE_MULTIPLEXED_MODEL_ID, ""),
+                priority=priority,
+                deadline_s=deadline_s,
+            )
+        )
+        status_code, response = await _send_request_to_handle(
+            self._get_handle(endpoint, method), request
+        )
+        self._record_call(route, app_name, status_code, start_time)
+        if status_code != grpc.StatusCode.OK:
+            await context.abort(status_code, response)
+        return response
+
+    def _record_call(
+        self,
+        route: str,
+        app_name: ApplicationName,
+        status_code: grpc.StatusCode,
+        start_time: float,
+    ):
+        latency_ms = (time.time() - start_time) * 1000.0
+        self.request_counter.inc(tags={"route": route, "application": app_name})
+        self.processing_latency_tracker.observe(
+            latency_ms, tags={"route": route, "application": app_name}
+        )
+        logger.info(
+            access_log_msg(
+                method="GRPC",
+                status=status_code.name,
+                latency_ms=latency_ms,
+            ),
+            extra={"log_to_stderr": False},
+        )
+        if status_code != grpc.StatusCode.OK:
+            self.request_error_counter.inc(
+                tags={"route": route, "error_code": status_code.name}
+            )
+
+
+class _gRPCProxyHandler(grpc.GenericRpcHandler):
+    """Handles every gRPC method, without deserializing the messages."""
+
+    def __init__(self, proxy: gRPCProxy):
+        self._proxy = proxy
+
+    def service(
+        self, handler_call_details: grpc.HandlerCallDetails
+    ) -> Optional[grpc.RpcMethodHandler]:
+        # The method is formatted as "/<package>.<Service>/<Method>".
+        parts = handler_call_details.method.split("/")
+        if len(parts) != 3 or not parts[1] or not parts[2]:
+            return None
+        _, service, method = parts
+
+        # Must be a coroutine function for gRPC to run it on the event loop.
+        async def handle_call(request: bytes, context: grpc.aio.ServicerContext):
+            return await self._proxy(service, method, request, context)
+
+        # Without serializers, requests and responses are passed as bytes.
+        return grpc.unary_unary_rpc_method_handler(handle_call)
+
+
+@ray.remote(num_cpus=0)
+class gRPCProxyActor:
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        controller_name: str,
+        node_ip_address: str,
+    ):
+        configure_component_logger(
+            component_name="grpc_proxy", component_id=node_ip_address
+        )
+
+        self.host = host
+        self.port = port
+
+        self.setup_complete = asyncio.Event()
+
+        self.app = gRPCProxy(controller_name)
+
+        # Start running the gRPC server on the event loop.
+        # This task should be running forever. We track it in case of failure.
+        self.running_task = get_or_create_event_loop().create_task(self.run())
+
+    async def ready(self):
+        """Returns when gRPC proxy is ready to serve traffic.
+        Or throw exception when it is not able to serve traffic.
+        """
+        setup_task = get_or_create_event_loop().create_task(self.setup_complete.wait())
+        done_set, _ = await asyncio.wait(
+            [setup_task, self.running_task],
+            return_when=asyncio.FIRST_COMPLETED,
+        )
+
+        # Return log filepath, or re-throw the exception from self.running_task.
+        if self.setup_complete.is_set():
+            return f"/serve/grpc_proxy_{ray.util.get_node_ip_address()}.log"
+
+        return await done_set.pop()
+
+    async def run(self):
+        server = grpc.aio.server()
+        server.add_generic_rpc_handlers((_gRPCProxyHandler(self.app),))
+        try:
+            # Depending on whether RAY_USE_TLS is on, `add_port_to_grpc_server`
+            # can create a secure or insecure port.
+            bound_port = add_port_to_grpc_server(server, f"{self.host}:{self.port}")
+        except RuntimeError:
+            bound_port = 0
+        if bound_port == 0:
+            raise ValueError(
+                f"Failed to bind Ray Serve gRPC proxy to '{self.host}:{self.port}'. "
+                "Please make sure your http-host and grpc-port are specified "
+                "correctly."
+            )
+
+        await server.start()
+        self.setup_complete.set()
+        await server.wait_for_termination()
+
+    async def check_health(self):
+        """No-op method to check on the health of the gRPC Proxy.
+        Make sure the async event loop is not blocked.
+        """
+        pass
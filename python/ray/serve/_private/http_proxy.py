@@ -1,13 +1,15 @@
 import asyncio
 from asyncio.tasks import FIRST_COMPLETED
+from functools import lru_cache
 import os
 import logging
 import pickle
 import socket
 import time
-from typing import Callable, List, Dict, Optional, Tuple
+from typing import Any, Callable, List, Dict, Optional, Tuple
 from ray._private.utils import get_or_create_event_loop
 
+import numpy as np
 import uvicorn
 import starlette.responses
 import starlette.routing
@@ -24,17 +26,24 @@ from ray.serve._private.http_util import (
     receive_http_body,
     Response,
     set_socket_reuse_port,
+    StreamingASGIResponse,
 )
 from ray.serve._private.common import EndpointInfo, EndpointTag, ApplicationName
 from ray.serve._private.constants import (
     SERVE_LOGGER_NAME,
     SERVE_NAMESPACE,
     DEFAULT_LATENCY_BUCKET_MS,
+    RAY_SERVE_HTTP_BODY_OBJECT_STORE_THRESHOLD_BYTES,
+    RAY_SERVE_ROUTE_MATCH_CACHE_SIZE,
+    SERVE_MULTIPLEXED_MODEL_ID,
+    SERVE_REQUEST_PRIORITY,
+    SERVE_REQUEST_TIMEOUT_S,
 )
 from ray.serve._private.long_poll import LongPollClient, LongPollNamespace
 from ray.serve._private.logging_utils import access_log_msg, configure_component_logger
 
 from ray.serve._private.utils import get_random_letters
+from ray.serve.exceptions import BackPressureError, RequestDeadlineExceededError
 
 logger = logging.getLogger(SERVE_LOGGER_NAME)
 
@@ -69,6 +78,14 @@ if os.environ.get("SERVE_REQUEST_PROCESSING_TIMEOUT_S") is not None:
 async def _send_request_to_handle(handle, scope, receive, send) -> str:
     http_body_bytes = await receive_http_body(scope, receive, send)
 
+    # Large bodies are put in the object store once and passed by reference,
+    # so the replica reads them as a zero-copy buffer instead of the body
+    # being copied through several rounds of pickling.
+    request_args = ()
+    if len(http_body_bytes) > RAY_SERVE_HTTP_BODY_OBJECT_STORE_THRESHOLD_BYTES:
+        request_args = (ray.put(np.frombuffer(http_body_bytes, dtype=np.uint8)),)
+        http_body_bytes = None
+
     # NOTE(edoakes): it's important that we defer building the starlette
     # request until it reaches the replica to avoid unnecessary
     # serialization cost, so we use a simple dataclass here.
@@ -85,7 +102,7 @@ async def _send_request_to_handle(handle, scope, receive, send) -> str:
     # call might never arrive; if it does, it can only be `http.disconnect`.
     client_disconnection_task = loop.create_task(receive())
     while retries < HTTP_REQUEST_MAX_RETRIES + 1:
-        assignment_task: asyncio.Task = handle.remote(request)
+        assignment_task: asyncio.Task = handle.remote(request, *request_args)
         done, _ = await asyncio.wait(
             [assignment_task, client_disconnection_task],
             return_when=FIRST_COMPLETED,
@@ -133,6 +150,15 @@ async def _send_request_to_handle(handle, scope, receive, send) -> str:
             # Here because the client disconnected, we will return a custom
             # error code for metric tracking.
             return DISCONNECT_ERROR_CODE
+        except BackPressureError as error:
+            # Rejected without being queued, so the client can retry elsewhere.
+            client_disconnection_task.cancel()
+            await Response(str(error), status_code=503).send(scope, receive, send)
+            return "503"
+        except RequestDeadlineExceededError as error:
+            client_disconnection_task.cancel()
+            await Response(str(error), status_code=504).send(scope, receive, send)
+            return "504"
         except RayTaskError as error:
             error_message = "Task Error. Traceback: {}.".format(error)
             await Response(error_message, status_code=500).send(scope, receive, send)
@@ -157,7 +183,24 @@ async def _send_request_to_handle(handle, scope, receive, send) -> str:
         await Response(error_message, status_code=500).send(scope, receive, send)
         return "500"
 
-    if isinstance(result, (starlette.responses.Response, RawASGIResponse)):
+    if isinstance(result, StreamingASGIResponse):
+        # The replica stays busy until the response is done, so keep its slot
+        # in the router taken while it streams.
+        release_slot = None
+        if not result.done:
+            release_slot = handle.router.hold_in_flight_slot(result.replica_tag)
+        # The rest of the response is pulled from the replica as it's sent to
+        # the client; failures past this point can only truncate the response.
+        try:
+            await result(scope, receive, send)
+        except (RayTaskError, RayActorError) as error:
+            logger.warning(f"Streaming response failed after it started: {error}")
+            return "500"
+        finally:
+            if release_slot is not None:
+                release_slot()
+        return str(result.status_code)
+    elif isinstance(result, (starlette.responses.Response, RawASGIResponse)):
         await result(scope, receive, send)
         return str(result.status_code)
     else:
@@ -165,14 +208,35 @@ async def _send_request_to_handle(handle, scope, receive, send) -> str:
         return "200"
 
 
+# Key of the route ending at a node of the route trie. Can't collide with the
+# keys of child nodes, which are single characters.
+_ROUTE_KEY = ""
+
+
 class LongestPrefixRouter:
-    """Router that performs longest prefix matches on incoming routes."""
+    """Router that performs longest prefix matches on incoming routes.
+
+    Routes are stored in a character trie, so matching a path takes time
+    proportional to its length rather than to the number of routes. The
+    matches of recently requested paths are cached.
+    """
 
-    def __init__(self, get_handle: Callable):
+    def __init__(
+        self,
+        get_handle: Callable,
+        match_cache_size: int = RAY_SERVE_ROUTE_MATCH_CACHE_SIZE,
+    ):
         # Function to get a handle given a name. Used to mock for testing.
         self._get_handle = get_handle
-        # Routes sorted in order of decreasing length.
-        self.sorted_routes: List[str] = list()
+        # Trie of the routes. Each node maps the next character to the child
+        # node, and _ROUTE_KEY to the route ending at the node if any.
+        self._route_trie: Dict[str, Any] = dict()
+        self._match_cache_size = match_cache_size
+        # Cached version of self._match_route_in_trie, recreated when the
+        # routes are updated.
+        self._match_route_cached: Callable[[str], Optional[str]] = lru_cache(
+            maxsize=match_cache_size
+        )(self._match_route_in_trie)
         # Endpoints associated with the routes.
         self.route_info: Dict[str, Tuple[EndpointTag, ApplicationName]] = dict()
         # Contains a ServeHandle for each endpoint.
@@ -206,10 +270,44 @@ class LongestPrefixRouter:
         for endpoint in existing_handles:
             del self.handles[endpoint]
 
-        # Routes are sorted in order of decreasing length to enable longest
-        # prefix matching.
-        self.sorted_routes = sorted(routes, key=lambda x: len(x), reverse=True)
+        route_trie = dict()
+        for route in routes:
+            node = route_trie
+            for char in route:
+                node = node.setdefault(char, dict())
+            node[_ROUTE_KEY] = route
+        self._route_trie = route_trie
         self.route_info = route_info
+        self._match_route_cached = lru_cache(maxsize=self._match_cache_size)(
+            self._match_route_in_trie
+        )
+
+    def _match_route_in_trie(self, target_route: str) -> Optional[str]:
+        """Return the longest route matching the target route, if any."""
+        matched_route = None
+        node = self._route_trie
+        for i in range(len(target_route) + 1):
+            route = node.get(_ROUTE_KEY)
+            # A route that is a prefix of the target route only matches if it
+            # ends in a '/', if it's an exact match, or if the next character
+            # in the target route is a '/'. This is to guard against the
+            # scenario where we have '/route' as a prefix and there's a
+            # request to '/routesuffix'. In this case, it should *not* be a
+            # match.
+            if route is not None and (
+                route.endswith("/")
+                or i == len(target_route)
+                or target_route[i] == "/"
+            ):
+                matched_route = route
+
+            if i == len(target_route):
+                break
+            node = node.get(target_route[i])
+            if node is None:
+                break
+
+        return matched_route
 
     def match_route(
         self, target_route: str
@@ -224,27 +322,12 @@ class LongestPrefixRouter:
             else (None, None).
         """
 
-        for route in self.sorted_routes:
-            if target_route.startswith(route):
-                matched = False
-                # If the route we matched on ends in a '/', then so does the
-                # target route and this must be a match.
-                if route.endswith("/"):
-                    matched = True
-                # If the route we matched on doesn't end in a '/', we need to
-                # do another check to ensure that either this is an exact match
-                # or the next character in the target route is a '/'. This is
-                # to guard against the scenario where we have '/route' as a
-                # prefix and there's a request to '/routesuffix'. In this case,
-                # it should *not* be a match.
-                elif len(target_route) == len(route) or target_route[len(route)] == "/":
-                    matched = True
-
-                if matched:
-                    endpoint, app_name = self.route_info[route]
-                    return route, self.handles[endpoint], app_name
-
-        return None, None, None
+        route = self._match_route_cached(target_route)
+        if route is None:
+            return None, None, None
+
+        endpoint, app_name = self.route_info[route]
+        return route, self.handles[endpoint], app_name
 
 
 class HTTPProxy:
@@ -422,9 +505,31 @@ class HTTPProxy:
             scope["root_path"] = root_path + route_prefix
 
         start_time = time.time()
+        multiplexed_model_id = ""
+        priority = 0
+        deadline_s = None
+        try:
+            for key, value in scope.get("headers", []):
+                key = key.decode()
+                if key == SERVE_MULTIPLEXED_MODEL_ID:
+                    multiplexed_model_id = value.decode()
+                elif key == SERVE_REQUEST_PRIORITY:
+                    priority = int(value)
+                elif key == SERVE_REQUEST_TIMEOUT_S:
+                    deadline_s = start_time + float(value)
+        except ValueError as e:
+            return await starlette.responses.PlainTextResponse(
+                f"Invalid request header: {e}", status_code=400
+            )(scope, receive, send)
+
         ray.serve.context._serve_request_context.set(
             ray.serve.context.RequestContext(
-                route_path, get_random_letters(10), app_name
+                route_path,
+                get_random_letters(10),
+                app_name,
+                multiplexed_model_id,
+                priority=priority,
+                deadline_s=deadline_s,
             )
         )
         status_code = await _send_request_to_handle(handle, scope, receive, send)
@@ -13,10 +13,12 @@ from ray.serve.config import HTTPOptions, DeploymentMode
 from ray.serve._private.constants import (
     ASYNC_CONCURRENCY,
     SERVE_LOGGER_NAME,
+    SERVE_GRPC_PROXY_NAME,
     SERVE_PROXY_NAME,
     SERVE_NAMESPACE,
     PROXY_HEALTH_CHECK_PERIOD_S,
 )
+from ray.serve._private.grpc_proxy import gRPCProxyActor
 from ray.serve._private.http_proxy import HTTPProxyActor
 from ray.serve._private.utils import (
     format_actor_name,
@@ -131,6 +133,8 @@ class HTTPState:
         else:
             self._config = HTTPOptions()
         self._proxy_states: Dict[NodeId, HTTPProxyState] = dict()
+        # gRPC proxies run next to the HTTP proxies if a gRPC port is set.
+        self._grpc_proxy_states: Dict[NodeId, HTTPProxyState] = dict()
         self._head_node_id: str = head_node_id
 
         self._gcs_client = gcs_client
@@ -144,6 +148,8 @@ class HTTPState:
     def shutdown(self) -> None:
         for proxy in self.get_http_proxy_handles().values():
             ray.kill(proxy, no_restart=True)
+        for proxy_state in self._grpc_proxy_states.values():
+            ray.kill(proxy_state.actor_handle, no_restart=True)
 
     def get_config(self):
         return self._config
@@ -176,6 +182,8 @@ class HTTPState:
         self._stop_proxies_if_needed()
         for proxy_state in self._proxy_states.values():
             proxy_state.update()
+        for proxy_state in self._grpc_proxy_states.values():
+            proxy_state.update()
 
     def _get_target_nodes(self) -> List[Tuple[str, str]]:
         """Return the list of (node_id, ip_address) to deploy HTTP servers on."""
@@ -255,6 +263,50 @@ class HTTPState:
 
             self._proxy_states[node_id] = HTTPProxyState(proxy, name, node_ip_address)
 
+        if self._config.grpc_port is not None:
+            self._start_grpc_proxies_if_needed()
+
+    def _start_grpc_proxies_if_needed(self) -> None:
+        """Start a gRPC proxy on every node with an HTTP proxy."""
+        for node_id, node_ip_address in self._get_target_nodes():
+            if node_id in self._grpc_proxy_states:
+                continue
+
+            name = format_actor_name(
+                SERVE_GRPC_PROXY_NAME, self._controller_name, node_id
+            )
+            try:
+                proxy = ray.get_actor(name, namespace=SERVE_NAMESPACE)
+            except ValueError:
+                logger.info(
+                    "Starting gRPC proxy with name '{}' on node '{}' "
+                    "listening on '{}:{}'".format(
+                        name, node_id, self._config.host, self._config.grpc_port
+                    ),
+                    extra={"log_to_stderr": False},
+                )
+                proxy = gRPCProxyActor.options(
+                    num_cpus=self._config.num_cpus,
+                    name=name,
+                    namespace=SERVE_NAMESPACE,
+                    lifetime="detached" if self._detached else None,
+                    max_concurrency=ASYNC_CONCURRENCY,
+                    max_restarts=-1,
+                    max_task_retries=-1,
+                    scheduling_strategy=NodeAffinitySchedulingStrategy(
+                        node_id, soft=False
+                    ),
+                ).remote(
+                    self._config.host,
+                    self._config.grpc_port,
+                    controller_name=self._controller_name,
+                    node_ip_address=node_ip_address,
+                )
+
+            self._grpc_proxy_states[node_id] = HTTPProxyState(
+                proxy, name, node_ip_address
+            )
+
     def _stop_proxies_if_needed(self) -> bool:
         """Removes proxy actors from any nodes that no longer exist."""
         all_node_ids = {node_id for node_id, _ in get_all_node_ids(self._gcs_client)}
@@ -268,6 +320,12 @@ class HTTPState:
             proxy = self._proxy_states.pop(node_id)
             ray.kill(proxy.actor_handle, no_restart=True)
 
+        for node_id in list(self._grpc_proxy_states):
+            if node_id not in all_node_ids:
+                logger.info("Removing gRPC proxy on removed node '{}'.".format(node_id))
+                proxy = self._grpc_proxy_states.pop(node_id)
+                ray.kill(proxy.actor_handle, no_restart=True)
+
     async def ensure_http_route_exists(self, endpoint: EndpointTag, timeout_s: float):
         """Block until the route has been propagated to all HTTP proxies.
         When the timeout occur in any of the http proxy, the whole method will
@@ -4,13 +4,14 @@ from dataclasses import dataclass
 import inspect
 import json
 import logging
-from typing import Any, Dict, Type
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
 import starlette.responses
 import starlette.requests
 from starlette.types import Send, ASGIApp
 from fastapi.encoders import jsonable_encoder
 
+from ray._private.utils import get_or_create_event_loop
 from ray.serve.exceptions import RayServeException
 from ray.serve._private.constants import SERVE_LOGGER_NAME
 
@@ -21,10 +22,11 @@ logger = logging.getLogger(SERVE_LOGGER_NAME)
 @dataclass
 class HTTPRequestWrapper:
     scope: Dict[Any, Any]
-    body: bytes
+    # None if the body was passed separately through the object store.
+    body: Optional[bytes]
 
 
-def build_starlette_request(scope, serialized_body: bytes):
+def build_starlette_request(scope, serialized_body: Union[bytes, memoryview]):
     """Build and return a Starlette Request from ASGI payload.
 
     This function is intended to be used immediately before task invocation
@@ -159,6 +161,158 @@ class ASGIHTTPSender(Send):
         return RawASGIResponse(self.messages)
 
 
+@dataclass
+class _StreamEnd:
+    error: Optional[Exception] = None
+
+
+class ASGIResponseStream:
+    """Runs a streaming ASGI response on a replica and buffers its messages.
+
+    Messages are buffered in a bounded queue until the HTTP proxy pulls them
+    with `next_messages`. Once the queue is full the response is paused, so a
+    slow client applies backpressure all the way to the generator producing
+    the response.
+
+    If the messages aren't pulled for `idle_timeout_s` (e.g. the proxy died),
+    the response is aborted and `on_abandoned` is called.
+    """
+
+    def __init__(
+        self,
+        response: ASGIApp,
+        max_buffered_messages: int,
+        idle_timeout_s: float,
+        on_abandoned: Optional[Callable[[], None]] = None,
+    ):
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_buffered_messages)
+        self._idle_timeout_s = idle_timeout_s
+        self._on_abandoned = on_abandoned
+        # The end of the response that was pulled but not returned yet.
+        self._pending_end: Optional[_StreamEnd] = None
+        self._end_consumed = asyncio.Event()
+        self._task = get_or_create_event_loop().create_task(self._run(response))
+
+    async def _receive(self):
+        # Only called by the response to check for an http disconnect, which
+        # is handled by the HTTP proxy. Suspend instead of busy looping.
+        never_set_event = asyncio.Event()
+        await never_set_event.wait()
+
+    async def _send(self, message: Dict[str, Any]):
+        await asyncio.wait_for(self._queue.put(message), self._idle_timeout_s)
+
+    async def _run(self, response: ASGIApp):
+        try:
+            await response(scope=None, receive=self._receive, send=self._send)
+            end = _StreamEnd()
+        except Exception as e:
+            end = _StreamEnd(e)
+
+        try:
+            await asyncio.wait_for(self._queue.put(end), self._idle_timeout_s)
+            await asyncio.wait_for(self._end_consumed.wait(), self._idle_timeout_s)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Aborted a streaming response that wasn't consumed for "
+                f"{self._idle_timeout_s}s."
+            )
+            if self._on_abandoned is not None:
+                self._on_abandoned()
+
+    async def next_messages(self) -> Tuple[List[Dict[str, Any]], bool]:
+        """Wait for the next messages of the response.
+
+        Returns all the buffered messages and whether the response is
+        complete. Raises the exception raised by the response, if any, after
+        all the messages sent before it were returned.
+        """
+        messages = []
+        end = self._pending_end
+        if end is None:
+            item = await self._queue.get()
+            while not isinstance(item, _StreamEnd):
+                messages.append(item)
+                if self._queue.empty():
+                    return messages, False
+                item = self._queue.get_nowait()
+            end = item
+
+        if end.error is not None and len(messages) > 0:
+            self._pending_end = end
+            return messages, False
+
+        self._end_consumed.set()
+        if end.error is not None:
+            raise end.error
+        return messages, True
+
+    def cancel(self):
+        self._task.cancel()
+
+
+class StreamingASGIResponse(ASGIApp):
+    """ASGI response whose messages are pulled from a replica as they come.
+
+    Returned by a replica instead of a RawASGIResponse for a streaming
+    response. It holds the messages that were ready when the request
+    returned. The remaining ones are pulled from the replica's
+    ASGIResponseStream in batches, and the next batch is only requested once
+    the previous one was sent to the client.
+    """
+
+    def __init__(
+        self,
+        actor_handle: Any,
+        stream_id: Optional[int],
+        messages: List[Dict[str, Any]],
+        done: bool,
+        replica_tag: Optional[str] = None,
+    ):
+        self.actor_handle = actor_handle
+        self.stream_id = stream_id
+        # The replica the response streams from, which stays busy until the
+        # response is done.
+        self.replica_tag = replica_tag
+        self.messages = messages
+        self.done = done
+
+    @property
+    def status_code(self):
+        return self.messages[0]["status"]
+
+    async def __call__(self, _scope, receive, send):
+        messages, done = self.messages, self.done
+        disconnect_task = get_or_create_event_loop().create_task(receive())
+        try:
+            while True:
+                for message in messages:
+                    await send(message)
+                if done:
+                    return
+
+                next_messages = asyncio.ensure_future(
+                    self.actor_handle.get_response_stream_messages.remote(
+                        self.stream_id
+                    )
+                )
+                await asyncio.wait(
+                    [next_messages, disconnect_task],
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if disconnect_task.done():
+                    logger.info(
+                        "Client disconnected, cancelling the streaming response.",
+                        extra={"log_to_stderr": False},
+                    )
+                    next_messages.cancel()
+                    self.actor_handle.cancel_response_stream.remote(self.stream_id)
+                    return
+                messages, done = await next_messages
+        finally:
+            disconnect_task.cancel()
+
+
 def make_fastapi_class_based_view(fastapi_app, cls: Type) -> None:
     """Transform the `cls`'s methods and class annotations to FastAPI routes.
 
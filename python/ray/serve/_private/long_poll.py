@@ -1,12 +1,13 @@
 import asyncio
 from asyncio.events import AbstractEventLoop
-from collections import defaultdict
-from dataclasses import dataclass
+from collections import defaultdict, OrderedDict
+import dataclasses
+from dataclasses import dataclass, field
 from enum import Enum, auto
 import logging
 import os
 import random
-from typing import Any, Tuple, Callable, DefaultDict, Dict, Set, Union
+from typing import Any, Tuple, Callable, DefaultDict, Dict, List, Optional, Set, Union
 from ray._private.utils import get_or_create_event_loop
 
 from ray.serve._private.common import ReplicaName
@@ -22,6 +23,7 @@ from ray.serve.generated.serve_pb2 import (
 import ray
 from ray.serve._private.constants import SERVE_LOGGER_NAME
 from ray.serve._private.utils import format_actor_name
+from ray.util import metrics
 
 logger = logging.getLogger(SERVE_LOGGER_NAME)
 
@@ -37,6 +39,16 @@ LISTEN_FOR_CHANGE_REQUEST_TIMEOUT_S = (
     int(os.environ.get("LISTEN_FOR_CHANGE_REQUEST_TIMEOUT_S_UPPER_BOUND", "60")),
 )
 
+# Listeners waiting on a key are woken up at most once per this window, with
+# the latest snapshot, so that rapid successive updates (e.g. replicas
+# transitioning one at a time during a rolling update) are coalesced.
+LONG_POLL_COALESCE_WINDOW_S = float(
+    os.environ.get("RAY_SERVE_LONG_POLL_COALESCE_WINDOW_S", "0.1")
+)
+
+# Number of previous snapshots kept per key to send deltas against.
+LONG_POLL_DELTA_HISTORY_SIZE = 8
+
 
 class LongPollNamespace(Enum):
     def __repr__(self):
@@ -44,6 +56,21 @@ class LongPollNamespace(Enum):
 
     RUNNING_REPLICAS = auto()
     ROUTE_TABLE = auto()
+    MULTIPLEXED_MODEL_IDS = auto()
+    DEPLOYMENT_CONFIG = auto()
+
+
+@dataclass
+class SnapshotDelta:
+    """Changes to a list snapshot since the snapshot `base_snapshot_id`."""
+
+    base_snapshot_id: int
+    added: List[Any] = field(default_factory=list)
+    removed: List[Any] = field(default_factory=list)
+
+    def apply(self, base_snapshot: List[Any]) -> List[Any]:
+        removed = set(self.removed)
+        return [item for item in base_snapshot if item not in removed] + self.added
 
 
 @dataclass
@@ -52,6 +79,22 @@ class UpdatedObject:
     # The identifier for the object's version. There is not sequential relation
     # among different object's snapshot_ids.
     snapshot_id: int
+    # If set, object_snapshot is None and the update has to be applied to the
+    # client's snapshot with id delta.base_snapshot_id.
+    delta: Optional[SnapshotDelta] = None
+
+
+def _is_changed(old: Any, new: Any) -> bool:
+    """Whether two equal snapshot items differ in fields outside their identity.
+
+    E.g. `RunningReplicaInfo` only compares the replica identity, so an item
+    with a new `node_id` is equal to the previous one.
+    """
+    if not dataclasses.is_dataclass(new):
+        return False
+    return any(
+        getattr(old, f.name) != getattr(new, f.name) for f in dataclasses.fields(new)
+    )
 
 
 # Type signature for the update state callbacks. E.g.
@@ -123,7 +166,9 @@ class LongPollClient:
         """Poll the update. The callback is expected to scheduler another
         _poll_next call.
         """
-        self._current_ref = self.host_actor.listen_for_change.remote(self.snapshot_ids)
+        self._current_ref = self.host_actor.listen_for_change.remote(
+            self.snapshot_ids, allow_delta=True
+        )
         self._current_ref._on_completed(lambda update: self._process_update(update))
 
     def _schedule_to_event_loop(self, callback):
@@ -170,13 +215,28 @@ class LongPollClient:
             extra={"log_to_stderr": False},
         )
         for key, update in updates.items():
-            self.object_snapshots[key] = update.object_snapshot
+            object_snapshot = update.object_snapshot
+            if update.delta is not None:
+                if self.snapshot_ids[key] != update.delta.base_snapshot_id:
+                    # Should never happen, ask for a full snapshot next time.
+                    logger.warning(
+                        f"LongPollClient received a delta for key {key} against "
+                        "a snapshot it doesn't have, requesting a full snapshot."
+                    )
+                    self.snapshot_ids[key] = -1
+                    self._schedule_to_event_loop(
+                        lambda: self._on_callback_completed(trigger_at=len(updates))
+                    )
+                    continue
+                object_snapshot = update.delta.apply(self.object_snapshots[key])
+
+            self.object_snapshots[key] = object_snapshot
             self.snapshot_ids[key] = update.snapshot_id
             callback = self.key_listeners[key]
 
             # Bind the parameters because closures are late-binding.
             # https://docs.python-guide.org/writing/gotchas/#late-binding-closures # noqa: E501
-            def chained(callback=callback, arg=update.object_snapshot):
+            def chained(callback=callback, arg=object_snapshot):
                 callback(arg)
                 self._on_callback_completed(trigger_at=len(updates))
 
@@ -195,9 +255,13 @@ class LongPollHost:
     outdated object and immediately return the result. If the client has the
     up-to-date verison, then the listen_for_change call will only return when
     the object is updated.
+
+    For the running replicas of a deployment, clients that have one of the
+    recent snapshots only receive the replicas added and removed since then.
+    Waiting clients are notified at most once per LONG_POLL_COALESCE_WINDOW_S.
     """
 
-    def __init__(self):
+    def __init__(self, coalesce_window_s: float = LONG_POLL_COALESCE_WINDOW_S):
         # Map object_key -> int
         self.snapshot_ids: DefaultDict[KeyType, int] = defaultdict(
             lambda: random.randint(0, 1_000_000)
@@ -209,15 +273,100 @@ class LongPollHost:
             set
         )
 
+        # Map object_key -> recent snapshots by snapshot_id, for the keys
+        # that support deltas.
+        self.snapshot_history: Dict[KeyType, OrderedDict] = dict()
+        # Map (object_key, base_snapshot_id) -> delta to the current snapshot.
+        self._delta_cache: Dict[Tuple[KeyType, int], SnapshotDelta] = dict()
+
+        self.coalesce_window_s = coalesce_window_s
+        # Keys whose waiting listeners will be notified at the end of the
+        # current coalescing window.
+        self._pending_notify_keys: Set[KeyType] = set()
+
+        self.snapshot_size_gauge = metrics.Gauge(
+            "serve_long_poll_snapshot_size",
+            description="The number of items in the latest long poll snapshot.",
+            tag_keys=("namespace",),
+        )
+        self.update_items_counter = metrics.Counter(
+            "serve_long_poll_update_items",
+            description=(
+                "The number of items sent to long poll clients, counting only "
+                "the changed items for delta updates."
+            ),
+            tag_keys=("namespace", "kind"),
+        )
+
+    @staticmethod
+    def _namespace_tag(key: KeyType) -> str:
+        if isinstance(key, tuple):
+            return key[0].name
+        elif isinstance(key, LongPollNamespace):
+            return key.name
+        return "other"
+
+    @staticmethod
+    def _supports_delta(key: KeyType) -> bool:
+        return isinstance(key, tuple) and key[0] == LongPollNamespace.RUNNING_REPLICAS
+
+    def _get_update(
+        self, key: KeyType, client_snapshot_id: int, allow_delta: bool
+    ) -> UpdatedObject:
+        """Build the update to send to a client that has client_snapshot_id."""
+        snapshot_id = self.snapshot_ids[key]
+        history = self.snapshot_history.get(key)
+        if allow_delta and history is not None and client_snapshot_id in history:
+            delta = self._delta_cache.get((key, client_snapshot_id))
+            if delta is None:
+                base = {item: item for item in history[client_snapshot_id]}
+                current = {item: item for item in self.object_snapshots[key]}
+                # Items that changed in place are sent as removed and added.
+                changed = [
+                    item
+                    for item in current
+                    if item in base and _is_changed(base[item], current[item])
+                ]
+                delta = SnapshotDelta(
+                    client_snapshot_id,
+                    added=[current[item] for item in changed]
+                    + [item for item in current if item not in base],
+                    removed=[base[item] for item in changed]
+                    + [item for item in base if item not in current],
+                )
+                self._delta_cache[(key, client_snapshot_id)] = delta
+            self._record_update_items(
+                key, "delta", len(delta.added) + len(delta.removed)
+            )
+            return UpdatedObject(None, snapshot_id, delta=delta)
+
+        object_snapshot = self.object_snapshots[key]
+        self._record_update_items(
+            key,
+            "snapshot",
+            len(object_snapshot) if hasattr(object_snapshot, "__len__") else 1,
+        )
+        return UpdatedObject(object_snapshot, snapshot_id)
+
+    def _record_update_items(self, key: KeyType, kind: str, num_items: int):
+        if num_items > 0:
+            self.update_items_counter.inc(
+                num_items, tags={"namespace": self._namespace_tag(key), "kind": kind}
+            )
+
     async def listen_for_change(
         self,
         keys_to_snapshot_ids: Dict[KeyType, int],
+        allow_delta: bool = False,
     ) -> Union[LongPollState, Dict[KeyType, UpdatedObject]]:
         """Listen for changed objects.
 
         This method will returns a dictionary of updated objects. It returns
         immediately if the snapshot_ids are outdated, otherwise it will block
         until there's one updates.
+
+        If allow_delta is True, the updates may be deltas against the client's
+        snapshots (see UpdatedObject.delta).
         """
         watched_keys = keys_to_snapshot_ids.keys()
         existent_keys = set(watched_keys).intersection(set(self.snapshot_ids.keys()))
@@ -225,7 +374,7 @@ class LongPollHost:
         # If there are any outdated keys (by comparing snapshot ids)
         # return immediately.
         client_outdated_keys = {
-            key: UpdatedObject(self.object_snapshots[key], self.snapshot_ids[key])
+            key: self._get_update(key, keys_to_snapshot_ids[key], allow_delta)
             for key in existent_keys
             if self.snapshot_ids[key] != keys_to_snapshot_ids[key]
         }
@@ -257,9 +406,10 @@ class LongPollHost:
         else:
             updated_object_key: str = async_task_to_watched_keys[done.pop()]
             return {
-                updated_object_key: UpdatedObject(
-                    self.object_snapshots[updated_object_key],
-                    self.snapshot_ids[updated_object_key],
+                updated_object_key: self._get_update(
+                    updated_object_key,
+                    keys_to_snapshot_ids[updated_object_key],
+                    allow_delta,
                 )
             }
 
@@ -356,6 +506,39 @@ class LongPollHost:
         self.object_snapshots[object_key] = updated_object
         logger.debug(f"LongPollHost: Notify change for key {object_key}.")
 
+        if self._supports_delta(object_key):
+            history = self.snapshot_history.setdefault(object_key, OrderedDict())
+            history[self.snapshot_ids[object_key]] = updated_object
+            while len(history) > LONG_POLL_DELTA_HISTORY_SIZE:
+                history.popitem(last=False)
+            for cache_key in [k for k in self._delta_cache if k[0] == object_key]:
+                del self._delta_cache[cache_key]
+
+        if hasattr(updated_object, "__len__"):
+            self.snapshot_size_gauge.set(
+                len(updated_object),
+                tags={"namespace": self._namespace_tag(object_key)},
+            )
+
+        if self.coalesce_window_s > 0:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+            if loop is not None:
+                # Listeners are notified at the end of the window, by then
+                # with the latest snapshot.
+                if object_key not in self._pending_notify_keys:
+                    self._pending_notify_keys.add(object_key)
+                    loop.call_later(
+                        self.coalesce_window_s, self._notify_listeners, object_key
+                    )
+                return
+
+        self._notify_listeners(object_key)
+
+    def _notify_listeners(self, object_key: KeyType):
+        self._pending_notify_keys.discard(object_key)
         if object_key in self.notifier_events:
             for event in self.notifier_events.pop(object_key):
                 event.set()
@@ -1,12 +1,13 @@
 import aiorwlock
 import asyncio
+from filelock import FileLock
 from importlib import import_module
 import inspect
 import logging
 import os
 import pickle
 import time
-from typing import Any, Callable, Optional, Tuple, Dict
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import traceback
 
 import starlette.responses
@@ -23,14 +24,21 @@ from ray.serve._private.common import HEALTH_CHECK_CONCURRENCY_GROUP, ReplicaTag
 from ray.serve.config import DeploymentConfig
 from ray.serve._private.constants import (
     HEALTH_CHECK_METHOD,
+    PREFETCH_METHOD,
     RECONFIGURE_METHOD,
     DEFAULT_LATENCY_BUCKET_MS,
+    RAY_SERVE_HTTP_STREAM_IDLE_TIMEOUT_S,
+    RAY_SERVE_HTTP_STREAM_MAX_BUFFERED_MESSAGES,
     SERVE_LOGGER_NAME,
     SERVE_NAMESPACE,
 )
 from ray.serve.deployment import Deployment
 from ray.serve.exceptions import RayServeException
-from ray.serve._private.http_util import ASGIHTTPSender
+from ray.serve._private.http_util import (
+    ASGIHTTPSender,
+    ASGIResponseStream,
+    StreamingASGIResponse,
+)
 from ray.serve._private.logging_utils import access_log_msg, configure_component_logger
 from ray.serve._private.router import Query, RequestMetadata
 from ray.serve._private.utils import (
@@ -49,6 +57,56 @@ def _format_replica_actor_name(deployment_name: str):
     return f"ServeReplica:{deployment_name}"
 
 
+# File written to the prefetch directory once the prefetch method succeeded.
+_PREFETCH_DONE_FILE = "_PREFETCH_DONE"
+
+
+def _get_prefetch_method(deployment_def: Callable) -> Optional[Callable]:
+    """Return the deployment class's prefetch static or class method if any."""
+    if not inspect.isclass(deployment_def):
+        return None
+    if not isinstance(
+        inspect.getattr_static(deployment_def, PREFETCH_METHOD, None),
+        (staticmethod, classmethod),
+    ):
+        return None
+    return getattr(deployment_def, PREFETCH_METHOD)
+
+
+def _prefetch_once_on_node(
+    prefetch_method: Callable, deployment_name: str, code_version: str
+) -> str:
+    """Run the prefetch method once per node for a deployment's code version.
+
+    The method downloads artifacts to a node-local directory shared by the
+    replicas of the deployment on the node. A file lock makes other replicas
+    on the node wait for the replica running the method, and a marker file
+    makes them skip it once it succeeded. Returns the directory.
+    """
+    prefetch_dir = os.path.join(
+        ray._private.worker._global_node.get_session_dir_path(),
+        "serve",
+        "prefetch",
+        deployment_name,
+        code_version.replace(os.sep, "_"),
+    )
+    os.makedirs(prefetch_dir, exist_ok=True)
+    done_file = os.path.join(prefetch_dir, _PREFETCH_DONE_FILE)
+    with FileLock(prefetch_dir + ".lock"):
+        if not os.path.exists(done_file):
+            start_time = time.time()
+            if inspect.iscoroutinefunction(prefetch_method):
+                asyncio.run(prefetch_method(prefetch_dir))
+            else:
+                prefetch_method(prefetch_dir)
+            open(done_file, "w").close()
+            logger.info(
+                f"Prefetched artifacts of deployment {deployment_name} to "
+                f"{prefetch_dir} in {time.time() - start_time:.2f}s."
+            )
+    return prefetch_dir
+
+
 def create_replica_wrapper(name: str):
     """Creates a replica class wrapping the provided function or class.
 
@@ -144,6 +202,27 @@ def create_replica_wrapper(name: str):
             # method. After that, it calls `reconfigure` to trigger
             # user code initialization.
             async def initialize_replica():
+                prefetch_dir = None
+                prefetch_method = _get_prefetch_method(deployment_def)
+                if prefetch_method is not None:
+                    # Run in a thread, waiting on the file lock or downloading
+                    # must not block the replica's event loop.
+                    prefetch_dir = await asyncio.get_running_loop().run_in_executor(
+                        None,
+                        _prefetch_once_on_node,
+                        prefetch_method,
+                        deployment_name,
+                        version.code_version,
+                    )
+                    ray.serve.context._set_internal_replica_context(
+                        deployment_name,
+                        replica_tag,
+                        controller_name,
+                        servable_object=None,
+                        app_name=app_name,
+                        prefetch_dir=prefetch_dir,
+                    )
+
                 if is_function:
                     _callable = deployment_def
                 else:
@@ -159,6 +238,7 @@ def create_replica_wrapper(name: str):
                     controller_name,
                     servable_object=_callable,
                     app_name=app_name,
+                    prefetch_dir=prefetch_dir,
                 )
 
                 self.replica = RayServeReplica(
@@ -211,6 +291,14 @@ def create_replica_wrapper(name: str):
             query = Query(request_args, request_kwargs, request_metadata, return_num=1)
             return await self.replica.handle_request(query)
 
+        async def get_response_stream_messages(
+            self, stream_id: int
+        ) -> Tuple[List[Dict[str, Any]], bool]:
+            return await self.replica.get_response_stream_messages(stream_id)
+
+        async def cancel_response_stream(self, stream_id: int):
+            self.replica.cancel_response_stream(stream_id)
+
         async def is_allocated(self) -> str:
             """poke the replica to check whether it's alive.
 
@@ -315,6 +403,10 @@ class RayServeReplica:
 
         self.num_ongoing_requests = 0
 
+        # Streaming HTTP responses that are being pulled by HTTP proxies.
+        self._response_streams: Dict[int, ASGIResponseStream] = dict()
+        self._next_response_stream_id = 0
+
         self.request_counter = metrics.Counter(
             "serve_deployment_request_counter",
             description=(
@@ -378,9 +470,10 @@ class RayServeReplica:
     def _collect_autoscaling_metrics(self):
         method_stat = self._get_handle_request_stats()
 
-        num_inflight_requests = 0
+        # Streaming responses keep running after their request returned.
+        num_inflight_requests = len(self._response_streams)
         if method_stat is not None:
-            num_inflight_requests = method_stat["pending"] + method_stat["running"]
+            num_inflight_requests += method_stat["pending"] + method_stat["running"]
 
         return {self.replica_tag: num_inflight_requests}
 
@@ -406,7 +499,21 @@ class RayServeReplica:
             return self.callable
         return getattr(self.callable, method_name)
 
-    async def ensure_serializable_response(self, response: Any) -> Any:
+    async def ensure_serializable_response(
+        self, response: Any, stream: bool = False
+    ) -> Any:
+        """Convert the response to an object that can be sent to the caller.
+
+        If `stream` is True, streaming responses and generators are returned
+        as a StreamingASGIResponse that the HTTP proxy pulls from as the
+        response is produced. Otherwise they are buffered in full.
+        """
+        if stream and (inspect.isgenerator(response) or inspect.isasyncgen(response)):
+            response = starlette.responses.StreamingResponse(response)
+
+        if stream and isinstance(response, starlette.responses.StreamingResponse):
+            return await self._start_response_stream(response)
+
         if isinstance(response, starlette.responses.StreamingResponse):
 
             async def mock_receive():
@@ -421,6 +528,55 @@ class RayServeReplica:
             return sender.build_asgi_response()
         return response
 
+    async def _start_response_stream(
+        self, response: starlette.responses.StreamingResponse
+    ) -> StreamingASGIResponse:
+        stream_id = self._next_response_stream_id
+        self._next_response_stream_id += 1
+        stream = ASGIResponseStream(
+            response,
+            max_buffered_messages=RAY_SERVE_HTTP_STREAM_MAX_BUFFERED_MESSAGES,
+            idle_timeout_s=RAY_SERVE_HTTP_STREAM_IDLE_TIMEOUT_S,
+            on_abandoned=lambda: self._response_streams.pop(stream_id, None),
+        )
+        # Wait for the response to start so the status code is known and the
+        # first chunks are sent along with the result.
+        messages, done = await stream.next_messages()
+        if done:
+            return StreamingASGIResponse(None, None, messages, done)
+
+        self._response_streams[stream_id] = stream
+        return StreamingASGIResponse(
+            ray.get_runtime_context().current_actor,
+            stream_id,
+            messages,
+            done,
+            replica_tag=self.replica_tag,
+        )
+
+    async def get_response_stream_messages(
+        self, stream_id: int
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        stream = self._response_streams.get(stream_id)
+        if stream is None:
+            raise RayServeException(
+                f"Streaming response {stream_id} doesn't exist, it might have "
+                "been aborted because it wasn't consumed."
+            )
+        try:
+            messages, done = await stream.next_messages()
+        except Exception:
+            self._response_streams.pop(stream_id, None)
+            raise
+        if done:
+            self._response_streams.pop(stream_id, None)
+        return messages, done
+
+    def cancel_response_stream(self, stream_id: int):
+        stream = self._response_streams.pop(stream_id, None)
+        if stream is not None:
+            stream.cancel()
+
     async def invoke_single(self, request_item: Query) -> Tuple[Any, bool]:
         """Executes the provided request on this replica.
 
@@ -456,7 +612,9 @@ class RayServeReplica:
                     # call with non-empty args
                     result = await method_to_call(*args, **kwargs)
 
-            result = await self.ensure_serializable_response(result)
+            result = await self.ensure_serializable_response(
+                result, stream=request_item.metadata.http_arg_is_pickled
+            )
             self.request_counter.inc(tags={"route": request_item.metadata.route})
         except Exception as e:
             logger.exception(f"Request failed due to {type(e).__name__}:")
@@ -508,13 +666,19 @@ class RayServeReplica:
     async def handle_request(self, request: Query) -> asyncio.Future:
         async with self.rwlock.reader_lock:
             num_running_requests = self._get_handle_request_stats()["running"]
-            self.num_processing_items.set(num_running_requests)
+            self.num_processing_items.set(
+                num_running_requests + len(self._response_streams)
+            )
 
             # Set request context variables for subsequent handle so that
             # handle can pass the correct request context to subsequent replicas.
             ray.serve.context._serve_request_context.set(
                 ray.serve.context.RequestContext(
-                    request.metadata.route, request.metadata.request_id
+                    request.metadata.route,
+                    request.metadata.request_id,
+                    multiplexed_model_id=request.metadata.multiplexed_model_id,
+                    priority=request.metadata.priority,
+                    deadline_s=request.metadata.deadline_s,
                 )
             )
 
@@ -551,8 +715,12 @@ class RayServeReplica:
             # The handle_request method wasn't even invoked.
             if method_stat is None:
                 break
-            # The handle_request method has 0 inflight requests.
-            if method_stat["running"] + method_stat["pending"] == 0:
+            # The handle_request method has 0 inflight requests and all the
+            # streaming responses were consumed.
+            if (
+                method_stat["running"] + method_stat["pending"] == 0
+                and len(self._response_streams) == 0
+            ):
                 break
             else:
                 logger.info(
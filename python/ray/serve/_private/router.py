@@ -1,11 +1,14 @@
+from abc import ABC, abstractmethod
 import asyncio
+from collections import defaultdict
 from dataclasses import dataclass
 import itertools
 import logging
 import pickle
 import random
 import sys
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Callable, DefaultDict, Dict, List, Optional, Set
 
 import ray
 from ray.actor import ActorHandle
@@ -14,12 +17,18 @@ from ray.exceptions import RayActorError, RayTaskError
 from ray.util import metrics
 
 from ray.serve._private.common import RunningReplicaInfo
-from ray.serve._private.constants import SERVE_LOGGER_NAME
+from ray.serve._private.constants import (
+    RAY_SERVE_ROUTING_POLICY,
+    ROUTING_LATENCY_EWMA_ALPHA,
+    SERVE_LOGGER_NAME,
+)
 from ray.serve._private.long_poll import LongPollClient, LongPollNamespace
 from ray.serve._private.utils import (
     compute_iterable_delta,
     JavaActorHandleProxy,
 )
+from ray.serve.config import DeploymentConfig
+from ray.serve.exceptions import BackPressureError, RequestDeadlineExceededError
 from ray.serve.generated.serve_pb2 import (
     RequestMetadata as RequestMetadataProto,
 )
@@ -43,6 +52,17 @@ class RequestMetadata:
     # Application Name
     app_name: str = ""
 
+    # ID of the multiplexed model the request is for, empty if none.
+    multiplexed_model_id: str = ""
+
+    # Requests with a higher priority are assigned to replicas before queued
+    # requests with a lower priority.
+    priority: int = 0
+
+    # Unix timestamp after which the request is dropped instead of being sent
+    # to a replica, None if the request has no deadline.
+    deadline_s: Optional[float] = None
+
 
 @dataclass
 class Query:
@@ -65,6 +85,182 @@ class Query:
         scanner.clear()
 
 
+class ReplicaRoutingPolicy(ABC):
+    """Policy for choosing the replica that a query is assigned to.
+
+    The ReplicaSet tracks the in-flight queries of each replica, and consults the
+    policy for each query that it assigns.
+    """
+
+    @abstractmethod
+    def update_replicas(self, replicas: List[RunningReplicaInfo]):
+        """Update the set of replicas that queries can be assigned to."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def choose_replica(
+        self,
+        query: Query,
+        num_in_flight: Callable[[RunningReplicaInfo], int],
+    ) -> Optional[RunningReplicaInfo]:
+        """Choose a replica to assign the query to.
+
+        Args:
+            query: The query to assign.
+            num_in_flight: Returns the current number of in-flight queries of a
+                replica.
+
+        Returns:
+            A replica with fewer than ``max_concurrent_queries`` in-flight queries,
+            or None if all replicas are at capacity.
+        """
+        raise NotImplementedError
+
+    def on_query_completed(self, replica: RunningReplicaInfo, latency_s: float):
+        """Called when a query assigned to the replica has completed."""
+        pass
+
+
+class RoundRobinRoutingPolicy(ReplicaRoutingPolicy):
+    """Cycles through the replicas, skipping replicas that are at capacity."""
+
+    def __init__(self):
+        self._replicas: List[RunningReplicaInfo] = []
+        self._replica_iterator = itertools.cycle(self._replicas)
+
+    def update_replicas(self, replicas: List[RunningReplicaInfo]):
+        # Shuffle the replicas randomly to avoid multiple handles sending requests
+        # in the same order.
+        self._replicas = list(replicas)
+        random.shuffle(self._replicas)
+        self._replica_iterator = itertools.cycle(self._replicas)
+
+    def choose_replica(
+        self,
+        query: Query,
+        num_in_flight: Callable[[RunningReplicaInfo], int],
+    ) -> Optional[RunningReplicaInfo]:
+        for _ in range(len(self._replicas)):
+            replica = next(self._replica_iterator)
+            if num_in_flight(replica) < replica.max_concurrent_queries:
+                return replica
+        return None
+
+
+class PowerOfTwoChoicesRoutingPolicy(ReplicaRoutingPolicy):
+    """Samples two replicas at random and picks the less loaded one.
+
+    The load of a replica is estimated as its number of in-flight queries
+    (including the new one) times the exponentially weighted moving average of
+    its recent query latencies, so that slow replicas get fewer queries.
+
+    If ``self_node_id`` is given, replicas on the same node are preferred as long
+    as one of them has capacity.
+    """
+
+    def __init__(
+        self,
+        self_node_id: Optional[str] = None,
+        ewma_alpha: float = ROUTING_LATENCY_EWMA_ALPHA,
+    ):
+        self._self_node_id = self_node_id
+        self._ewma_alpha = ewma_alpha
+        self._replicas: List[RunningReplicaInfo] = []
+        self._local_replicas: List[RunningReplicaInfo] = []
+        self._latency_ewma_s: Dict[RunningReplicaInfo, float] = {}
+
+    def update_replicas(self, replicas: List[RunningReplicaInfo]):
+        self._replicas = list(replicas)
+        self._local_replicas = [
+            r
+            for r in self._replicas
+            if self._self_node_id is not None and r.node_id == self._self_node_id
+        ]
+        replica_set = set(self._replicas)
+        self._latency_ewma_s = {
+            r: latency
+            for r, latency in self._latency_ewma_s.items()
+            if r in replica_set
+        }
+
+    def choose_replica(
+        self,
+        query: Query,
+        num_in_flight: Callable[[RunningReplicaInfo], int],
+    ) -> Optional[RunningReplicaInfo]:
+        if self._local_replicas:
+            replica = self._choose_from(self._local_replicas, num_in_flight)
+            if replica is not None:
+                return replica
+        return self._choose_from(self._replicas, num_in_flight)
+
+    def on_query_completed(self, replica: RunningReplicaInfo, latency_s: float):
+        prev = self._latency_ewma_s.get(replica)
+        if prev is None:
+            self._latency_ewma_s[replica] = latency_s
+        else:
+            self._latency_ewma_s[replica] = (
+                self._ewma_alpha * latency_s + (1 - self._ewma_alpha) * prev
+            )
+
+    def _score(
+        self,
+        replica: RunningReplicaInfo,
+        num_in_flight: Callable[[RunningReplicaInfo], int],
+        default_latency_s: float,
+    ) -> float:
+        latency_s = self._latency_ewma_s.get(replica, default_latency_s)
+        return (num_in_flight(replica) + 1) * latency_s
+
+    def _choose_from(
+        self,
+        candidates: List[RunningReplicaInfo],
+        num_in_flight: Callable[[RunningReplicaInfo], int],
+    ) -> Optional[RunningReplicaInfo]:
+        def has_capacity(r: RunningReplicaInfo) -> bool:
+            return num_in_flight(r) < r.max_concurrent_queries
+
+        if len(candidates) <= 2:
+            available = [r for r in candidates if has_capacity(r)]
+        else:
+            available = [
+                r for r in random.sample(candidates, 2) if has_capacity(r)
+            ]
+            if not available:
+                # Both samples are at capacity, fall back to a full scan.
+                available = [r for r in candidates if has_capacity(r)]
+        if not available:
+            return None
+        if len(available) == 1:
+            return available[0]
+        # Replicas without latency samples yet are scored as average replicas.
+        if self._latency_ewma_s:
+            default_latency_s = sum(self._latency_ewma_s.values()) / len(
+                self._latency_ewma_s
+            )
+        else:
+            default_latency_s = 1.0
+        if len(available) > 2:
+            available = random.sample(available, 2)
+        return min(
+            available, key=lambda r: self._score(r, num_in_flight, default_latency_s)
+        )
+
+
+def _create_routing_policy(
+    policy_name: str, self_node_id: Optional[str] = None
+) -> ReplicaRoutingPolicy:
+    if policy_name == "round_robin":
+        return RoundRobinRoutingPolicy()
+    elif policy_name == "power_of_two_choices":
+        return PowerOfTwoChoicesRoutingPolicy(self_node_id=self_node_id)
+    else:
+        raise ValueError(
+            f"Unknown routing policy '{policy_name}', expected one of "
+            "'power_of_two_choices' or 'round_robin'."
+        )
+
+
 class ReplicaSet:
     """Data structure representing a set of replica actor handles"""
 
@@ -72,20 +268,32 @@ class ReplicaSet:
         self,
         deployment_name,
         event_loop: asyncio.AbstractEventLoop,
+        routing_policy: Optional[ReplicaRoutingPolicy] = None,
     ):
         self.deployment_name = deployment_name
         self.in_flight_queries: Dict[RunningReplicaInfo, set] = dict()
-        # The iterator used for load balancing among replicas. Using itertools
-        # cycle, we implements a round-robin policy, skipping overloaded
-        # replicas.
-        # NOTE(simon): We can make this more pluggable and consider different
-        # policies like: min load, pick min of two replicas, pick replicas on
-        # the same node.
-        self.replica_iterator = itertools.cycle(self.in_flight_queries.keys())
+        # Time each in-flight query was assigned, used to measure replica latency.
+        self._query_start_times: Dict[ray.ObjectRef, float] = dict()
+        # The policy used for load balancing among replicas.
+        if routing_policy is None:
+            routing_policy = _create_routing_policy(RAY_SERVE_ROUTING_POLICY)
+        self.routing_policy = routing_policy
+
+        # Completion callbacks of in-flight queries are marshalled onto this loop.
+        self._event_loop = event_loop
+
+        # Queries for a multiplexed model are preferably assigned to replicas
+        # that have the model loaded. Replicas report the models they have
+        # loaded through the controller, and models are added here when a
+        # query for the model is assigned to a replica, until the replica's
+        # next report.
+        self._replicas_by_tag: Dict[str, RunningReplicaInfo] = dict()
+        self._model_ids_by_replica_tag: Dict[str, Set[str]] = dict()
+        self._replica_tags_by_model_id: DefaultDict[str, Set[str]] = defaultdict(set)
 
         # Used to unblock this replica set waiting for free replicas. A newly
-        # added replica or updated max_concurrent_queries value means the
-        # query that waits on a free replica might be unblocked on.
+        # added replica, updated max_concurrent_queries value or a completed
+        # query means the query that waits on a free replica might be unblocked.
 
         # Python 3.8 has deprecated the 'loop' parameter, and Python 3.10 has
         # removed it alltogether. Call accordingly.
@@ -94,6 +302,14 @@ class ReplicaSet:
         else:
             self.config_updated_event = asyncio.Event(loop=event_loop)
 
+        # Maximum number of queries waiting for a free replica, -1 for no
+        # limit. Updated from the deployment config.
+        self.max_queued_requests = -1
+        # Number of queries waiting for a free replica by priority. Queries
+        # only try to get a replica if no query with a higher priority waits.
+        self._num_waiting_queries = 0
+        self._num_waiting_queries_by_priority: Dict[int, int] = dict()
+
         self.num_queued_queries = 0
         self.num_queued_queries_gauge = metrics.Gauge(
             "serve_deployment_queued_queries",
@@ -106,17 +322,30 @@ class ReplicaSet:
         self.num_queued_queries_gauge.set_default_tags(
             {"deployment": self.deployment_name}
         )
+        self.num_dropped_queries_counter = metrics.Counter(
+            "serve_deployment_dropped_queries",
+            description=(
+                "The number of queries to this deployment that were dropped "
+                "before being assigned to a replica, because the queue was full "
+                "or their deadline passed."
+            ),
+            tag_keys=("deployment", "route", "application", "reason"),
+        )
+        self.num_dropped_queries_counter.set_default_tags(
+            {"deployment": self.deployment_name}
+        )
 
-    def _reset_replica_iterator(self):
-        """Reset the iterator used to load balance replicas.
+    def _update_routing_policy(self):
+        """Update the replicas of the routing policy.
 
         This call is expected to be called after the replica membership has
-        been updated. It will shuffle the replicas randomly to avoid multiple
-        handle sending requests in the same order.
+        been updated.
         """
-        replicas = list(self.in_flight_queries.keys())
-        random.shuffle(replicas)
-        self.replica_iterator = itertools.cycle(replicas)
+        self.routing_policy.update_replicas(list(self.in_flight_queries.keys()))
+        self._replicas_by_tag = {r.replica_tag: r for r in self.in_flight_queries}
+
+    def update_deployment_config(self, deployment_config: DeploymentConfig):
+        self.max_queued_requests = deployment_config.max_queued_requests
 
     def update_running_replicas(self, running_replicas: List[RunningReplicaInfo]):
         added, removed, _ = compute_iterable_delta(
@@ -130,23 +359,67 @@ class ReplicaSet:
             # Delete it directly because shutdown is processed by controller.
             # Replicas might already been deleted due to early detection of
             # actor error.
-            self.in_flight_queries.pop(removed_replica, None)
+            for ref in self.in_flight_queries.pop(removed_replica, ()):
+                self._query_start_times.pop(ref, None)
 
         if len(added) > 0 or len(removed) > 0:
             logger.debug(f"ReplicaSet: +{len(added)}, -{len(removed)} replicas.")
-            self._reset_replica_iterator()
+            self._update_routing_policy()
             self.config_updated_event.set()
 
+    def update_multiplexed_model_ids(
+        self, model_ids_by_replica_tag: Dict[str, List[str]]
+    ):
+        """Update the IDs of the multiplexed models loaded on each replica."""
+        self._model_ids_by_replica_tag = {
+            replica_tag: set(model_ids)
+            for replica_tag, model_ids in model_ids_by_replica_tag.items()
+        }
+        self._replica_tags_by_model_id = defaultdict(set)
+        for replica_tag, model_ids in self._model_ids_by_replica_tag.items():
+            for model_id in model_ids:
+                self._replica_tags_by_model_id[model_id].add(replica_tag)
+
+    def _record_model_assignment(self, replica: RunningReplicaInfo, model_id: str):
+        self._model_ids_by_replica_tag.setdefault(replica.replica_tag, set()).add(
+            model_id
+        )
+        self._replica_tags_by_model_id[model_id].add(replica.replica_tag)
+
+    def _choose_replica_with_model(
+        self, model_id: str
+    ) -> Optional[RunningReplicaInfo]:
+        """Choose the least loaded replica that has the model loaded.
+
+        Returns None if no replica with the model loaded has capacity.
+        """
+        chosen, chosen_num_in_flight = None, None
+        for replica_tag in self._replica_tags_by_model_id.get(model_id, ()):
+            replica = self._replicas_by_tag.get(replica_tag)
+            if replica is None:
+                continue
+            num_in_flight = len(self.in_flight_queries[replica])
+            if num_in_flight < replica.max_concurrent_queries and (
+                chosen is None or num_in_flight < chosen_num_in_flight
+            ):
+                chosen, chosen_num_in_flight = replica, num_in_flight
+        return chosen
+
     def _try_assign_replica(self, query: Query) -> Optional[ray.ObjectRef]:
         """Try to assign query to a replica, return the object ref if succeeded
         or return None if it can't assign this query to any replicas.
         """
-        for _ in range(len(self.in_flight_queries.keys())):
-            replica = next(self.replica_iterator)
-            if len(self.in_flight_queries[replica]) >= replica.max_concurrent_queries:
-                # This replica is overloaded, try next one
-                continue
-
+        replica = None
+        model_id = query.metadata.multiplexed_model_id
+        if model_id:
+            replica = self._choose_replica_with_model(model_id)
+        if replica is None:
+            replica = self.routing_policy.choose_replica(
+                query, lambda r: len(self.in_flight_queries[r])
+            )
+            if replica is not None and model_id:
+                self._record_model_assignment(replica, model_id)
+        if replica is not None:
             logger.debug(
                 f"Assigned query {query.metadata.request_id} "
                 f"to replica {replica.replica_tag}."
@@ -157,11 +430,16 @@ class ReplicaSet:
                 if query.metadata.http_arg_is_pickled:
                     assert isinstance(arg, bytes)
                     loaded_http_input = pickle.loads(arg)
+                    body = loaded_http_input.body
+                    if body is None and len(query.args) == 2:
+                        # Large bodies are put in the object store by the HTTP
+                        # proxy in this process, so this get doesn't block.
+                        body = ray.get(query.args[1]).tobytes()
                     query_string = loaded_http_input.scope.get("query_string")
                     if query_string:
                         arg = query_string.decode().split("=", 1)[1]
-                    elif loaded_http_input.body:
-                        arg = loaded_http_input.body.decode()
+                    elif body:
+                        arg = body.decode()
                 user_ref = JavaActorHandleProxy(
                     replica.actor_handle
                 ).handle_request.remote(
@@ -174,61 +452,184 @@ class ReplicaSet:
                     ).SerializeToString(),
                     [arg],
                 )
-                self.in_flight_queries[replica].add(user_ref)
+                self._track_query(replica, user_ref)
             else:
                 # Directly passing args because it might contain an ObjectRef.
                 tracker_ref, user_ref = replica.actor_handle.handle_request.remote(
                     pickle.dumps(query.metadata), *query.args, **query.kwargs
                 )
-                self.in_flight_queries[replica].add(tracker_ref)
+                self._track_query(replica, tracker_ref)
             return user_ref
         return None
 
-    @property
-    def _all_query_refs(self):
-        return list(itertools.chain.from_iterable(self.in_flight_queries.values()))
-
-    def _drain_completed_object_refs(self) -> int:
-        refs = self._all_query_refs
-        # NOTE(simon): even though the timeout is 0, a large number of refs can still
-        # cause some blocking delay in the event loop. Consider moving this to async?
-        done, _ = ray.wait(refs, num_returns=len(refs), timeout=0)
-        replicas_to_remove = []
-        for replica_info, replica_in_flight_queries in self.in_flight_queries.items():
-            completed_queries = replica_in_flight_queries.intersection(done)
-            if len(completed_queries):
-                try:
-                    # NOTE(simon): this ray.get call should be cheap because all these
-                    # refs are ready as indicated by previous `ray.wait` call.
-                    ray.get(list(completed_queries))
-                except RayActorError:
-                    logger.debug(
-                        f"Removing {replica_info.replica_tag} from replica set "
-                        "because the actor exited."
-                    )
-                    replicas_to_remove.append(replica_info)
-                except RayTaskError:
-                    # Ignore application error.
-                    pass
-                except Exception:
-                    logger.exception(
-                        "Handle received unexpected error when processing request."
-                    )
+    def _track_query(self, replica: RunningReplicaInfo, ref: ray.ObjectRef):
+        """Record an in-flight query and register a callback for its completion.
+
+        The callback is invoked on a core worker thread, so it only hands the
+        result over to the event loop; all bookkeeping happens on the loop.
+        """
+        self.in_flight_queries[replica].add(ref)
+        self._query_start_times[ref] = time.time()
+        event_loop = self._event_loop
+        ref._on_completed(
+            lambda result: event_loop.call_soon_threadsafe(
+                self._on_query_completed, replica, ref, result
+            )
+        )
+
+    def _on_query_completed(
+        self, replica: RunningReplicaInfo, ref: ray.ObjectRef, result: Any
+    ):
+        """Update the bookkeeping for a single completed query in O(1)."""
+        start_time = self._query_start_times.pop(ref, None)
+        replica_in_flight_queries = self.in_flight_queries.get(replica)
+        if replica_in_flight_queries is None or ref not in replica_in_flight_queries:
+            # The replica was removed while the query was in flight.
+            return
+        replica_in_flight_queries.discard(ref)
+
+        if isinstance(result, RayActorError):
+            logger.debug(
+                f"Removing {replica.replica_tag} from replica set "
+                "because the actor exited."
+            )
+            for in_flight_ref in self.in_flight_queries.pop(replica, ()):
+                self._query_start_times.pop(in_flight_ref, None)
+            self._update_routing_policy()
+        elif isinstance(result, RayTaskError):
+            # Ignore application error.
+            pass
+        elif isinstance(result, Exception):
+            logger.error(
+                "Handle received unexpected error when processing request: "
+                f"{result!r}"
+            )
+
+        if start_time is not None and replica in self.in_flight_queries:
+            self.routing_policy.on_query_completed(replica, time.time() - start_time)
+
+        # A slot is free now, wake up the queries waiting on a replica.
+        self.config_updated_event.set()
+
+    def hold_in_flight_slot(self, replica_tag: str) -> Callable[[], None]:
+        """Count a query as in flight on a replica until the returned callback
+        is called.
+
+        Used for streaming responses, which keep running on the replica after
+        the request returned.
+        """
+        replica = self._replicas_by_tag.get(replica_tag)
+        if replica is None:
+            return lambda: None
+
+        slot = object()
+        self.in_flight_queries[replica].add(slot)
+
+        def release():
+            in_flight_queries = self.in_flight_queries.get(replica)
+            if in_flight_queries is None or slot not in in_flight_queries:
+                # The replica was removed while the response was streaming.
+                return
+            in_flight_queries.discard(slot)
+            # A slot is free now, wake up the queries waiting on a replica.
+            self.config_updated_event.set()
+
+        return release
+
+    def _has_higher_priority_waiters(self, priority: int) -> bool:
+        return any(p > priority for p in self._num_waiting_queries_by_priority)
+
+    def _add_waiter(self, priority: int):
+        self._num_waiting_queries += 1
+        self._num_waiting_queries_by_priority[priority] = (
+            self._num_waiting_queries_by_priority.get(priority, 0) + 1
+        )
+
+    def _remove_waiter(self, priority: int):
+        self._num_waiting_queries -= 1
+        self._num_waiting_queries_by_priority[priority] -= 1
+        if self._num_waiting_queries_by_priority[priority] == 0:
+            del self._num_waiting_queries_by_priority[priority]
+            # Queries with a lower priority might have skipped a free replica
+            # for the queries of this priority, let them retry.
+            if self._num_waiting_queries > 0:
+                self.config_updated_event.set()
+
+    def _record_dropped_query(self, query: Query, reason: str):
+        self.num_dropped_queries_counter.inc(
+            tags={
+                "route": query.metadata.route,
+                "application": query.metadata.app_name,
+                "reason": reason,
+            }
+        )
 
-                replica_in_flight_queries.difference_update(completed_queries)
+    def _check_deadline(self, query: Query):
+        deadline_s = query.metadata.deadline_s
+        if deadline_s is not None and time.time() >= deadline_s:
+            self._record_dropped_query(query, "deadline_exceeded")
+            raise RequestDeadlineExceededError(
+                f"Request {query.metadata.request_id} to deployment "
+                f"'{self.deployment_name}' exceeded its deadline before it was "
+                "assigned to a replica."
+            )
 
-        if len(replicas_to_remove) > 0:
-            for replica_info in replicas_to_remove:
-                self.in_flight_queries.pop(replica_info, None)
-            self._reset_replica_iterator()
+    async def _wait_for_free_replica(self, query: Query) -> ray.ObjectRef:
+        """Wait in the queue until the query is assigned to a replica.
 
-        return len(done)
+        Raises:
+            RequestDeadlineExceededError: if the deadline of the query passes
+                while it's waiting.
+        """
+        priority = query.metadata.priority
+        deadline_s = query.metadata.deadline_s
+        self._add_waiter(priority)
+        try:
+            while True:
+                logger.debug(
+                    "Failed to assign a replica for "
+                    f"query {query.metadata.request_id}"
+                )
+                # All replicas are busy, wait for a query to complete or the
+                # config to be updated. Completions are processed on this event
+                # loop, so there is no completion we could miss between the
+                # failed attempt and clearing the event here.
+                logger.debug("All replicas are busy, waiting for a free replica.")
+                self.config_updated_event.clear()
+                if deadline_s is None:
+                    await self.config_updated_event.wait()
+                else:
+                    try:
+                        await asyncio.wait_for(
+                            self.config_updated_event.wait(),
+                            timeout=max(0, deadline_s - time.time()),
+                        )
+                    except asyncio.TimeoutError:
+                        pass
+                    self._check_deadline(query)
+                # A free replica might be ready now, let's retry assigning this
+                # query a replica unless a query with a higher priority waits.
+                if not self._has_higher_priority_waiters(priority):
+                    assigned_ref = self._try_assign_replica(query)
+                    if assigned_ref is not None:
+                        return assigned_ref
+        finally:
+            self._remove_waiter(priority)
 
     async def assign_replica(self, query: Query) -> ray.ObjectRef:
         """Given a query, submit it to a replica and return the object ref.
         This method will keep track of the in flight queries for each replicas
         and only send a query to available replicas (determined by the
         max_concurrent_quries value.)
+
+        If all replicas are busy, the query waits in a queue where queries
+        with a higher priority are assigned first.
+
+        Raises:
+            BackPressureError: if all replicas are busy and max_queued_requests
+                queries are already waiting.
+            RequestDeadlineExceededError: if the deadline of the query passes
+                before it's assigned to a replica.
         """
         self.num_queued_queries += 1
         self.num_queued_queries_gauge.set(
@@ -238,36 +639,31 @@ class ReplicaSet:
                 "application": query.metadata.app_name,
             },
         )
-        await query.resolve_async_tasks()
-        assigned_ref = self._try_assign_replica(query)
-        while assigned_ref is None:  # Can't assign a replica right now.
-            logger.debug(
-                "Failed to assign a replica for " f"query {query.metadata.request_id}"
+        try:
+            await query.resolve_async_tasks()
+            self._check_deadline(query)
+            assigned_ref = None
+            if not self._has_higher_priority_waiters(query.metadata.priority):
+                assigned_ref = self._try_assign_replica(query)
+            if assigned_ref is None:  # Can't assign a replica right now.
+                if 0 <= self.max_queued_requests <= self._num_waiting_queries:
+                    self._record_dropped_query(query, "queue_full")
+                    raise BackPressureError(
+                        f"Request {query.metadata.request_id} to deployment "
+                        f"'{self.deployment_name}' was rejected because "
+                        f"{self._num_waiting_queries} requests are already "
+                        f"queued (max_queued_requests={self.max_queued_requests})."
+                    )
+                assigned_ref = await self._wait_for_free_replica(query)
+        finally:
+            self.num_queued_queries -= 1
+            self.num_queued_queries_gauge.set(
+                self.num_queued_queries,
+                tags={
+                    "route": query.metadata.route,
+                    "application": query.metadata.app_name,
+                },
             )
-            # Maybe there exists a free replica, we just need to refresh our
-            # query tracker.
-            num_finished = self._drain_completed_object_refs()
-            # All replicas are really busy, wait for a query to complete or the
-            # config to be updated.
-            if num_finished == 0:
-                logger.debug("All replicas are busy, waiting for a free replica.")
-                await asyncio.wait(
-                    self._all_query_refs + [self.config_updated_event.wait()],
-                    return_when=asyncio.FIRST_COMPLETED,
-                )
-                if self.config_updated_event.is_set():
-                    self.config_updated_event.clear()
-            # We are pretty sure a free replica is ready now, let's recurse and
-            # assign this query a replica.
-            assigned_ref = self._try_assign_replica(query)
-        self.num_queued_queries -= 1
-        self.num_queued_queries_gauge.set(
-            self.num_queued_queries,
-            tags={
-                "route": query.metadata.route,
-                "application": query.metadata.app_name,
-            },
-        )
         return assigned_ref
 
 
@@ -284,7 +680,14 @@ class Router:
             controller_handle: The controller handle.
         """
         self._event_loop = event_loop
-        self._replica_set = ReplicaSet(deployment_name, event_loop)
+        self._replica_set = ReplicaSet(
+            deployment_name,
+            event_loop,
+            routing_policy=_create_routing_policy(
+                RAY_SERVE_ROUTING_POLICY,
+                self_node_id=ray.get_runtime_context().get_node_id(),
+            ),
+        )
 
         # -- Metrics Registration -- #
         self.num_router_requests = metrics.Counter(
@@ -301,6 +704,14 @@ class Router:
                     LongPollNamespace.RUNNING_REPLICAS,
                     deployment_name,
                 ): self._replica_set.update_running_replicas,
+                (
+                    LongPollNamespace.MULTIPLEXED_MODEL_IDS,
+                    deployment_name,
+                ): self._replica_set.update_multiplexed_model_ids,
+                (
+                    LongPollNamespace.DEPLOYMENT_CONFIG,
+                    deployment_name,
+                ): self._replica_set.update_deployment_config,
             },
             call_in_event_loop=event_loop,
         )
@@ -308,6 +719,9 @@ class Router:
     def get_num_queued_queries(self):
         return self._replica_set.num_queued_queries
 
+    def hold_in_flight_slot(self, replica_tag: str) -> Callable[[], None]:
+        return self._replica_set.hold_in_flight_slot(replica_tag)
+
     async def assign_request(
         self,
         request_meta: RequestMetadata,
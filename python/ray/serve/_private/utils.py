@@ -63,12 +63,17 @@ Default = Union[DEFAULT, T]
 
 
 def parse_request_item(request_item):
-    if len(request_item.args) == 1:
+    if len(request_item.args) in (1, 2):
         arg = request_item.args[0]
         if request_item.metadata.http_arg_is_pickled:
             assert isinstance(arg, bytes)
             arg: HTTPRequestWrapper = pickle.loads(arg)
-            return (build_starlette_request(arg.scope, arg.body),), {}
+            body = arg.body
+            if len(request_item.args) == 2:
+                # Large bodies are passed through the object store and arrive
+                # as a read-only array backed by shared memory.
+                body = memoryview(request_item.args[1])
+            return (build_starlette_request(arg.scope, body),), {}
 
     return request_item.args, request_item.kwargs
 
@@ -95,6 +95,11 @@ def start(
                 - "NoServer" or None: disable HTTP server.
             - num_cpus: The number of CPU cores to reserve for each
               internal Serve HTTP proxy actor.  Defaults to 0.
+            - grpc_port: Port for gRPC proxies started next to the HTTP
+              servers. A call to `/<package>.<Service>/<Method>` is sent
+              to `<Method>` of the ingress deployment named `<Service>`,
+              with the serialized protobuf request as its only argument.
+              Defaults to None, which disables the gRPC proxies.
         dedicated_cpu: Whether to reserve a CPU core for the internal
           Serve controller actor.  Defaults to False.
     """
@@ -275,6 +280,7 @@ def deployment(
     ray_actor_options: Default[Dict] = DEFAULT.VALUE,
     user_config: Default[Optional[Any]] = DEFAULT.VALUE,
     max_concurrent_queries: Default[int] = DEFAULT.VALUE,
+    max_queued_requests: Default[int] = DEFAULT.VALUE,
     autoscaling_config: Default[Union[Dict, AutoscalingConfig, None]] = DEFAULT.VALUE,
     graceful_shutdown_wait_loop_s: Default[float] = DEFAULT.VALUE,
     graceful_shutdown_timeout_s: Default[float] = DEFAULT.VALUE,
@@ -296,6 +302,13 @@ def deployment(
 
         app = MyDeployment.bind()
 
+    A class can define a `prefetch(local_dir)` static or class method to
+    download model artifacts to node-local disk before it's constructed. It
+    runs once per node for each version of the deployment, and the directory
+    is available as `serve.get_replica_context().prefetch_dir`. With
+    `autoscaling_config.max_standby_replicas`, initialized standby replicas
+    are kept ready to be promoted when the deployment scales up.
+
     Args:
         name: Name uniquely identifying this deployment within the application.
             If not provided, the name of the class or function is used.
@@ -317,6 +330,10 @@ def deployment(
             deployment. The user_config must be fully JSON-serializable.
         max_concurrent_queries: The maximum number of queries that are sent to a
             replica of this deployment without receiving a response. Defaults to 100.
+        max_queued_requests: The maximum number of queries that each handle or
+            HTTP proxy queues while all replicas are at max_concurrent_queries.
+            Further queries are rejected with a `BackPressureError` (a 503
+            response over HTTP). Defaults to -1 (no limit).
         health_check_period_s: How often the health check is called on the replica.
             Defaults to 10s. The health check is by default a no-op actor call to the
             replica, but you can define your own as a "check_health" method that raises
@@ -371,6 +388,7 @@ def deployment(
         num_replicas=num_replicas if num_replicas is not None else 1,
         user_config=user_config,
         max_concurrent_queries=max_concurrent_queries,
+        max_queued_requests=max_queued_requests,
         autoscaling_config=autoscaling_config,
         graceful_shutdown_wait_loop_s=graceful_shutdown_wait_loop_s,
         graceful_shutdown_timeout_s=graceful_shutdown_timeout_s,
@@ -1,9 +1,21 @@
 import asyncio
+from collections import deque
 from functools import wraps
 from inspect import iscoroutinefunction
 import time
-from typing import Any, Callable, Dict, List, Optional, overload, Tuple, TypeVar
-from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    overload,
+    Tuple,
+    TypeVar,
+)
+from dataclasses import dataclass, field
 
 
 from ray._private.signature import extract_signature, flatten_args, recover_args
@@ -17,6 +29,7 @@ class _SingleRequest:
     self_arg: Optional[Any]
     flattened_args: List[Any]
     future: asyncio.Future
+    arrival_time: float = field(default_factory=time.time)
 
 
 def _batch_args_kwargs(
@@ -44,12 +57,76 @@ def _batch_args_kwargs(
     return recover_args(batched_flattened_args)
 
 
+class _AdaptiveBatchingPolicy:
+    """Tunes the batch size and wait timeout against a latency SLO.
+
+    Keeps exponentially weighted moving averages of the request arrival rate
+    and of the batch execution latency. Given the SLO, the time a request can
+    spend waiting in the queue is the SLO minus the expected execution
+    latency; the target batch size is the number of requests expected to
+    arrive in that time.
+    """
+
+    def __init__(self, latency_slo_s: float, max_batch_size: int, alpha: float = 0.2):
+        self.latency_slo_s = latency_slo_s
+        self.max_batch_size = max_batch_size
+        self.alpha = alpha
+        self._last_arrival_time: Optional[float] = None
+        self._interarrival_s: Optional[float] = None
+        self._batch_latency_s: Optional[float] = None
+
+    def _ewma(self, current: Optional[float], sample: float) -> float:
+        if current is None:
+            return sample
+        return self.alpha * sample + (1 - self.alpha) * current
+
+    def record_arrival(self, arrival_time: float):
+        if self._last_arrival_time is not None:
+            self._interarrival_s = self._ewma(
+                self._interarrival_s,
+                max(0.0, arrival_time - self._last_arrival_time),
+            )
+        self._last_arrival_time = arrival_time
+
+    def record_batch_latency(self, latency_s: float):
+        self._batch_latency_s = self._ewma(self._batch_latency_s, latency_s)
+
+    @property
+    def arrival_rate(self) -> float:
+        """Observed request arrival rate in requests per second."""
+        if self._interarrival_s is None:
+            return 0.0
+        if self._interarrival_s == 0:
+            return float("inf")
+        return 1 / self._interarrival_s
+
+    @property
+    def expected_batch_latency_s(self) -> float:
+        return self._batch_latency_s or 0.0
+
+    def queueing_budget_s(self) -> float:
+        """Time a request can wait in the queue without missing the SLO."""
+        return max(0.0, self.latency_slo_s - self.expected_batch_latency_s)
+
+    def target_batch_size(self) -> int:
+        expected_arrivals = self.arrival_rate * self.queueing_budget_s()
+        if expected_arrivals >= self.max_batch_size:
+            return self.max_batch_size
+        return max(1, int(expected_arrivals))
+
+    def wait_timeout_s(self, oldest_arrival_time: float, now: float) -> float:
+        """Time left before the oldest request must be flushed to meet the SLO."""
+        return max(0.0, oldest_arrival_time + self.queueing_budget_s() - now)
+
+
 class _BatchQueue:
     def __init__(
         self,
         max_batch_size: int,
         timeout_s: float,
         handle_batch_func: Optional[Callable] = None,
+        latency_slo_s: Optional[float] = None,
+        bucket_key: Optional[Callable[..., Hashable]] = None,
     ) -> None:
         """Async queue that accepts individual items and returns batches.
 
@@ -60,29 +137,63 @@ class _BatchQueue:
         If handle_batch_func is passed in, a background coroutine will run to
         poll from the queue and call handle_batch_func on the results.
 
+        If latency_slo_s is passed in, the batch size and timeout are tuned
+        from the observed arrival rate and batch execution latency, and a
+        batch is flushed early when its oldest request would otherwise miss
+        the SLO. max_batch_size and a nonzero timeout_s are upper bounds.
+
+        If bucket_key is passed in, requests are kept in one queue per bucket
+        and each batch only contains requests of a single bucket. A bucket is
+        returned once it holds a full batch, or once its oldest request has
+        waited for timeout_s.
+
         Arguments:
             max_batch_size: max number of elements to return in a batch.
             timeout_s: time to wait before returning an incomplete
                 batch.
             handle_batch_func(Optional[Callable]): callback to run in the
                 background to handle batches if provided.
+            latency_slo_s(Optional[float]): target end-to-end latency of a
+                request, enables adaptive batching if provided.
+            bucket_key(Optional[Callable]): function called with the
+                arguments of a single request that returns the bucket the
+                request is batched in.
         """
         self.queue: asyncio.Queue[_SingleRequest] = asyncio.Queue()
         self.full_batch_event = asyncio.Event()
         self.max_batch_size = max_batch_size
         self.timeout_s = timeout_s
 
+        self.adaptive_policy: Optional[_AdaptiveBatchingPolicy] = None
+        if latency_slo_s is not None:
+            self.adaptive_policy = _AdaptiveBatchingPolicy(
+                latency_slo_s, max_batch_size
+            )
+        # Number of queued requests at which full_batch_event is set.
+        self._full_batch_threshold = max_batch_size
+
+        self.bucket_key = bucket_key
+        # Pending requests of each bucket, in the order the buckets were created.
+        self._buckets: Dict[Hashable, Deque[_SingleRequest]] = {}
+        # Set when a new bucket is created or a bucket holds a full batch.
+        self._bucket_event = asyncio.Event()
+
         self._handle_batch_task = None
         if handle_batch_func is not None:
             self._handle_batch_task = get_or_create_event_loop().create_task(
                 self._handle_batches(handle_batch_func)
             )
 
-    def put(self, request: Tuple[_SingleRequest, asyncio.Future]) -> None:
+    def put(self, request: _SingleRequest) -> None:
+        if self.adaptive_policy is not None:
+            self.adaptive_policy.record_arrival(request.arrival_time)
+        if self.bucket_key is not None:
+            self._put_in_bucket(request)
+            return
         self.queue.put_nowait(request)
         # Signal when the full batch is ready. The event will be reset
         # in wait_for_batch.
-        if self.queue.qsize() == self.max_batch_size:
+        if self.queue.qsize() >= self._full_batch_threshold:
             self.full_batch_event.set()
 
     async def wait_for_batch(self) -> List[Any]:
@@ -95,6 +206,11 @@ class _BatchQueue:
         Always returns a batch with at least one item - will block
         indefinitely until an item comes in.
         """
+        if self.bucket_key is not None:
+            return await self._wait_for_bucketed_batch()
+        if self.adaptive_policy is not None:
+            return await self._wait_for_adaptive_batch()
+
         curr_timeout = self.timeout_s
         batch = []
         while len(batch) == 0:
@@ -129,6 +245,96 @@ class _BatchQueue:
 
         return batch
 
+    async def _wait_for_adaptive_batch(self) -> List[Any]:
+        """Wait for a batch sized and timed by the adaptive policy.
+
+        Waits until the target batch size is queued or until the oldest
+        request has to be flushed to meet the latency SLO, whichever occurs
+        first.
+        """
+        batch = [await self.queue.get()]
+        target_batch_size = self.adaptive_policy.target_batch_size()
+        timeout = self.adaptive_policy.wait_timeout_s(
+            batch[0].arrival_time, time.time()
+        )
+        if self.timeout_s > 0:
+            timeout = min(timeout, self.timeout_s)
+
+        if target_batch_size > 1 and timeout > 0:
+            # The first request was already taken off the queue.
+            self._full_batch_threshold = target_batch_size - 1
+            if self.queue.qsize() < self._full_batch_threshold:
+                self.full_batch_event.clear()
+                try:
+                    await asyncio.wait_for(self.full_batch_event.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+            self._full_batch_threshold = self.max_batch_size
+
+        while len(batch) < self.max_batch_size and not self.queue.empty():
+            batch.append(self.queue.get_nowait())
+        self.full_batch_event.clear()
+        return batch
+
+    def _put_in_bucket(self, request: _SingleRequest) -> None:
+        args, kwargs = recover_args(request.flattened_args)
+        key = self.bucket_key(*args, **kwargs)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = deque()
+        bucket.append(request)
+        if len(bucket) == 1 or len(bucket) >= self._full_batch_threshold:
+            self._bucket_event.set()
+
+    def _pop_from_bucket(self, key: Hashable) -> List[_SingleRequest]:
+        bucket = self._buckets[key]
+        batch_size = min(len(bucket), self.max_batch_size)
+        batch = [bucket.popleft() for _ in range(batch_size)]
+        if len(bucket) == 0:
+            del self._buckets[key]
+        return batch
+
+    async def _wait_for_bucketed_batch(self) -> List[Any]:
+        """Wait for a batch of requests that all belong to the same bucket.
+
+        Returns the first bucket that holds a full batch, or the bucket with
+        the oldest request once that request has waited for self.timeout_s
+        (or until its latency SLO deadline in adaptive mode).
+        """
+        while True:
+            if self.adaptive_policy is not None:
+                self._full_batch_threshold = self.adaptive_policy.target_batch_size()
+
+            oldest_key, oldest_arrival_time = None, None
+            for key, bucket in self._buckets.items():
+                if len(bucket) >= self._full_batch_threshold:
+                    return self._pop_from_bucket(key)
+                if oldest_arrival_time is None or (
+                    bucket[0].arrival_time < oldest_arrival_time
+                ):
+                    oldest_key, oldest_arrival_time = key, bucket[0].arrival_time
+
+            self._bucket_event.clear()
+            if oldest_key is None:
+                # All buckets are empty, wait for a request to come in.
+                await self._bucket_event.wait()
+                continue
+
+            now = time.time()
+            if self.adaptive_policy is not None:
+                timeout = self.adaptive_policy.wait_timeout_s(oldest_arrival_time, now)
+                if self.timeout_s > 0:
+                    timeout = min(timeout, oldest_arrival_time + self.timeout_s - now)
+            else:
+                timeout = oldest_arrival_time + self.timeout_s - now
+            if timeout <= 0:
+                return self._pop_from_bucket(oldest_key)
+
+            try:
+                await asyncio.wait_for(self._bucket_event.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
     async def _handle_batches(self, func):
         while True:
             batch: List[_SingleRequest] = await self.wait_for_batch()
@@ -137,6 +343,7 @@ class _BatchQueue:
             args, kwargs = _batch_args_kwargs([item.flattened_args for item in batch])
             futures = [item.future for item in batch]
 
+            batch_start = time.time()
             try:
                 # Method call.
                 if self_arg is not None:
@@ -145,6 +352,11 @@ class _BatchQueue:
                 else:
                     results = await func(*args, **kwargs)
 
+                if self.adaptive_policy is not None:
+                    self.adaptive_policy.record_batch_latency(
+                        time.time() - batch_start
+                    )
+
                 if len(results) != len(batch):
                     raise RayServeException(
                         "Batched function doesn't preserve batch size. "
@@ -210,7 +422,10 @@ def batch(func: F) -> G:
 # "Decorator factory" use case (called with arguments).
 @overload
 def batch(
-    max_batch_size: int = 10, batch_wait_timeout_s: float = 0.0
+    max_batch_size: int = 10,
+    batch_wait_timeout_s: float = 0.0,
+    batch_latency_slo_s: Optional[float] = None,
+    bucket_key: Optional[Callable[..., Hashable]] = None,
 ) -> Callable[[F], G]:
     pass
 
@@ -220,6 +435,8 @@ def batch(
     _func: Optional[Callable] = None,
     max_batch_size: int = 10,
     batch_wait_timeout_s: float = 0.0,
+    batch_latency_slo_s: Optional[float] = None,
+    bucket_key: Optional[Callable[..., Hashable]] = None,
 ):
     """Converts a function to asynchronously handle batches.
 
@@ -259,6 +476,19 @@ def batch(
             one call to the underlying function.
         batch_wait_timeout_s: the maximum duration to wait for
             `max_batch_size` elements before running the current batch.
+        batch_latency_slo_s: if set, enables adaptive batching. The batch
+            size and wait timeout are tuned from the observed request arrival
+            rate and batch execution latency so that requests complete within
+            this latency, and a batch is run early when its oldest request
+            would otherwise miss it. `max_batch_size` and a nonzero
+            `batch_wait_timeout_s` remain upper bounds.
+        bucket_key: if set, requests are grouped into buckets and each batch
+            only contains requests from one bucket. It is called with the
+            arguments of a single request (excluding `self`) and must return
+            a hashable key, e.g. `lambda text: len(text) // 32` to batch
+            sequences of similar length together and reduce padding. A bucket
+            is run once it holds `max_batch_size` requests or its oldest
+            request has waited for `batch_wait_timeout_s`.
     """
     # `_func` will be None in the case when the decorator is parametrized.
     # See the comment at the end of this function for a detailed explanation.
@@ -286,6 +516,16 @@ def batch(
     if batch_wait_timeout_s < 0:
         raise ValueError("batch_wait_timeout_s must be a float >= 0")
 
+    if batch_latency_slo_s is not None:
+        if not isinstance(batch_latency_slo_s, (float, int)):
+            raise TypeError("batch_latency_slo_s must be a float > 0")
+
+        if batch_latency_slo_s <= 0:
+            raise ValueError("batch_latency_slo_s must be a float > 0")
+
+    if bucket_key is not None and not callable(bucket_key):
+        raise TypeError("bucket_key must be a callable")
+
     def _batch_decorator(_func):
         @wraps(_func)
         async def batch_wrapper(*args, **kwargs):
@@ -308,7 +548,13 @@ def batch(
             # runs, we just get a reference to the attribute.
             batch_queue_attr = f"__serve_batch_queue_{_func.__name__}"
             if not hasattr(batch_queue_object, batch_queue_attr):
-                batch_queue = _BatchQueue(max_batch_size, batch_wait_timeout_s, _func)
+                batch_queue = _BatchQueue(
+                    max_batch_size,
+                    batch_wait_timeout_s,
+                    _func,
+                    latency_slo_s=batch_latency_slo_s,
+                    bucket_key=bucket_key,
+                )
                 setattr(batch_queue_object, batch_queue_attr, batch_queue)
             else:
                 batch_queue = getattr(batch_queue_object, batch_queue_attr)
@@ -0,0 +1,302 @@
+# Measures the latency distribution of Serve under open-loop load.
+#
+# Unlike microbenchmark.py and handle.py, which send the next request only
+# after the previous one finished (closed loop), this benchmark sends requests
+# at Poisson-distributed arrival times for a target QPS, regardless of how many
+# requests are still in flight. Latencies are measured from the time a request
+# was scheduled to be sent, so queueing delays caused by an overloaded system
+# show up in the tail latencies instead of silently lowering the send rate.
+#
+# The following scenarios are covered:
+#   - handle: a noop deployment called through a serve handle.
+#   - http: a noop deployment called through the HTTP proxy.
+#   - batch: a deployment using @serve.batch called through a serve handle.
+#   - composition: a deployment graph combining two models, called through a
+#     serve handle.
+#
+# Example:
+#   python open_loop.py --qps 100 --qps 500 --duration-s 30 --output out.json
+#
+# Results are printed and written as JSON for regression tracking, e.g.:
+# {
+#   "handle/qps:100": {
+#     "target_qps": 100, "achieved_qps": 99.8, "num_requests": 2994,
+#     "num_errors": 0, "mean_ms": 1.41, "p50_ms": 1.32, "p90_ms": 1.71,
+#     "p99_ms": 3.05, "p999_ms": 7.9, "max_ms": 11.2
+#   },
+#   ...
+# }
+
+import asyncio
+import json
+import logging
+import math
+import time
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import aiohttp
+import click
+import numpy as np
+
+import ray
+from ray import serve
+from ray.serve.context import get_global_client
+from ray.serve.handle import RayServeHandle, RayServeSyncHandle
+
+logger = logging.getLogger(__file__)
+
+MAX_CONCURRENT_QUERIES = 10000
+# Requests sent in the warmup period aren't recorded.
+WARMUP_S = 2
+# Highest latency recorded by the histogram, larger latencies are clamped.
+MAX_LATENCY_S = 60
+PERCENTILES = [50, 90, 99, 99.9]
+
+
+class LatencyHistogram:
+    """Records latencies with a bounded relative error, like an HDR histogram.
+
+    Values are recorded as integer microseconds. Values smaller than
+    `sub_bucket_count` are recorded exactly. Larger values are grouped into
+    power-of-two ranges, each split into `sub_bucket_count / 2` equally sized
+    buckets, so the error of any recorded value is bounded by
+    `10 ** -significant_digits` of the value, using constant memory per
+    order of magnitude.
+    """
+
+    def __init__(self, significant_digits: int = 3):
+        self._sub_bucket_bits = math.ceil(math.log2(2 * 10**significant_digits))
+        self._max_value = int(MAX_LATENCY_S * 1e6)
+        # Map bucket lower bound -> number of values recorded in the bucket.
+        self._counts: Dict[int, int] = {}
+        self.total_count = 0
+        self._sum = 0
+        self.max_value = 0
+
+    def _bucket_shift(self, value: int) -> int:
+        return max(0, value.bit_length() - self._sub_bucket_bits)
+
+    def record(self, latency_s: float):
+        value = min(max(0, int(latency_s * 1e6)), self._max_value)
+        shift = self._bucket_shift(value)
+        lower_bound = (value >> shift) << shift
+        self._counts[lower_bound] = self._counts.get(lower_bound, 0) + 1
+        self.total_count += 1
+        self._sum += value
+        self.max_value = max(self.max_value, value)
+
+    def percentile(self, percentile: float) -> float:
+        """Return the latency at the given percentile in milliseconds.
+
+        This is the highest value equivalent to the values in the bucket that
+        contains the percentile.
+        """
+        if self.total_count == 0:
+            return 0.0
+
+        target = max(1, math.ceil(self.total_count * percentile / 100))
+        seen = 0
+        for lower_bound in sorted(self._counts):
+            seen += self._counts[lower_bound]
+            if seen >= target:
+                width = 1 << self._bucket_shift(lower_bound)
+                value = min(lower_bound + width - 1, self.max_value)
+                return value / 1000
+        return self.max_value / 1000
+
+    def mean(self) -> float:
+        if self.total_count == 0:
+            return 0.0
+        return self._sum / self.total_count / 1000
+
+
+async def run_open_loop(
+    send: Callable[[], Awaitable], qps: float, duration_s: float
+) -> Dict[str, float]:
+    """Send requests with Poisson arrivals at `qps` and record their latencies.
+
+    Each request is sent in its own task at its scheduled arrival time, so
+    slow requests don't delay the ones after them.
+    """
+    histogram = LatencyHistogram()
+    num_errors = 0
+    tasks: List[asyncio.Task] = []
+
+    async def timed_request(scheduled_time: float, record: bool):
+        nonlocal num_errors
+        try:
+            await send()
+        except Exception as e:
+            if record:
+                num_errors += 1
+                logger.debug(f"Request failed: {e}")
+            return
+        if record:
+            histogram.record(time.perf_counter() - scheduled_time)
+
+    start = time.perf_counter()
+    end = start + WARMUP_S + duration_s
+    next_arrival = start
+    while True:
+        next_arrival += np.random.exponential(1 / qps)
+        if next_arrival >= end:
+            break
+        delay = next_arrival - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        record = next_arrival - start >= WARMUP_S
+        tasks.append(asyncio.ensure_future(timed_request(next_arrival, record)))
+
+    await asyncio.gather(*tasks)
+    elapsed_s = time.perf_counter() - start - WARMUP_S
+
+    result = {
+        "target_qps": qps,
+        "achieved_qps": round(histogram.total_count / elapsed_s, 2),
+        "num_requests": histogram.total_count,
+        "num_errors": num_errors,
+        "mean_ms": round(histogram.mean(), 3),
+    }
+    for percentile in PERCENTILES:
+        key = f"p{str(percentile).replace('.', '')}_ms"
+        result[key] = round(histogram.percentile(percentile), 3)
+    result["max_ms"] = round(histogram.max_value / 1000, 3)
+    return result
+
+
+@serve.deployment(max_concurrent_queries=MAX_CONCURRENT_QUERIES)
+class Noop:
+    def __call__(self, *args):
+        return b"ok"
+
+
+@serve.deployment(max_concurrent_queries=MAX_CONCURRENT_QUERIES)
+class Batched:
+    @serve.batch(max_batch_size=32, batch_wait_timeout_s=0.001)
+    async def handle_batch(self, inputs: List[int]) -> List[int]:
+        return [i + 1 for i in inputs]
+
+    async def __call__(self, i: int = 0):
+        return await self.handle_batch(i)
+
+
+@serve.deployment(max_concurrent_queries=MAX_CONCURRENT_QUERIES)
+class Model:
+    def __init__(self, weight: int):
+        self.weight = weight
+
+    def __call__(self, i: int) -> int:
+        return i * self.weight
+
+
+@serve.deployment(max_concurrent_queries=MAX_CONCURRENT_QUERIES)
+class Combiner:
+    def __init__(self, model1: RayServeHandle, model2: RayServeHandle):
+        self.model1 = model1
+        self.model2 = model2
+
+    async def __call__(self, i: int = 1) -> int:
+        refs = await asyncio.gather(self.model1.remote(i), self.model2.remote(i))
+        return sum(await asyncio.gather(*refs))
+
+
+def _get_async_handle(handle: RayServeSyncHandle) -> RayServeHandle:
+    # Deployments are registered under the name prefixed with the app name, so
+    # use the name of the ingress deployment that serve.run() returned a handle to.
+    return get_global_client().get_handle(handle.deployment_name, sync=False)
+
+
+async def _run_scenario(
+    scenario: str, qps_list: List[float], duration_s: float, result_json: Dict
+):
+    if scenario == "handle":
+        handle = _get_async_handle(serve.run(Noop.bind()))
+
+        async def send():
+            await (await handle.remote())
+
+    elif scenario == "http":
+        serve.run(Noop.bind(), route_prefix="/noop")
+        session = aiohttp.ClientSession()
+
+        async def send():
+            async with session.get("http://localhost:8000/noop") as resp:
+                assert resp.status == 200, resp.status
+                await resp.read()
+
+    elif scenario == "batch":
+        handle = _get_async_handle(serve.run(Batched.bind()))
+
+        async def send():
+            await (await handle.remote(1))
+
+    elif scenario == "composition":
+        handle = _get_async_handle(
+            serve.run(
+                Combiner.bind(Model.bind(1), Model.options(name="Model2").bind(2))
+            )
+        )
+
+        async def send():
+            await (await handle.remote(1))
+
+    else:
+        raise ValueError(f"Unknown scenario '{scenario}'.")
+
+    try:
+        for qps in qps_list:
+            logger.info(f"Running scenario '{scenario}' at {qps} QPS.")
+            result = await run_open_loop(send, qps, duration_s)
+            logger.info(f"\t{result}")
+            result_json[f"{scenario}/qps:{qps}"] = result
+    finally:
+        if scenario == "http":
+            await session.close()
+
+
+@click.command()
+@click.option(
+    "--scenario",
+    "scenarios",
+    type=click.Choice(["handle", "http", "batch", "composition"]),
+    multiple=True,
+    help="Scenarios to run, defaults to all of them.",
+)
+@click.option(
+    "--qps",
+    "qps_list",
+    type=float,
+    multiple=True,
+    help="Target QPS to run each scenario at, defaults to 100 and 500.",
+)
+@click.option("--duration-s", type=float, default=30)
+@click.option("--output", type=str, required=False, help="Path to write JSON to.")
+def main(
+    scenarios: List[str],
+    qps_list: List[float],
+    duration_s: float,
+    output: Optional[str],
+):
+    logging.basicConfig(level=logging.INFO)
+    scenarios = scenarios or ["handle", "http", "batch", "composition"]
+    qps_list = qps_list or [100, 500]
+
+    ray.init()
+    serve.start()
+
+    result_json = {}
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    for scenario in scenarios:
+        loop.run_until_complete(
+            _run_scenario(scenario, qps_list, duration_s, result_json)
+        )
+
+    print(json.dumps(result_json, indent=2))
+    if output is not None:
+        with open(output, "w") as f:
+            json.dump(result_json, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
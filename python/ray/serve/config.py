@@ -69,6 +69,30 @@ class AutoscalingConfig(BaseModel):
     # How long to wait before scaling up replicas
     upscale_delay_s: NonNegativeFloat = 30.0
 
+    # The autoscaling policy to use. "basic" reacts to the average number of
+    # ongoing requests; "predictive" additionally scales ahead of the load
+    # forecasted from its recent trend and seasonality, accounting for the
+    # measured replica startup time.
+    policy: str = "basic"
+    # Period of the load seasonality learned by the "predictive" policy.
+    seasonality_period_s: PositiveFloat = 24 * 60 * 60.0
+
+    # Maximum number of standby replicas to keep. Standby replicas are fully
+    # initialized but don't receive requests until they're promoted to
+    # running replicas on scale-up, which skips their startup time. The
+    # autoscaler never keeps more standby replicas than could be promoted
+    # without exceeding max_replicas.
+    max_standby_replicas: NonNegativeInt = 0
+
+    @validator("policy")
+    def policy_valid(cls, v):
+        if v not in ("basic", "predictive"):
+            raise ValueError(
+                f"Got invalid autoscaling policy '{v}', expected 'basic' or "
+                "'predictive'."
+            )
+        return v
+
     @validator("max_replicas", always=True)
     def replicas_settings_valid(cls, max_replicas, values):
         min_replicas = values.get("min_replicas")
@@ -124,6 +148,11 @@ class DeploymentConfig(BaseModel):
         max_concurrent_queries (Optional[int]): The maximum number of queries
             that will be sent to a replica of this deployment without receiving
             a response. Defaults to 100.
+        max_queued_requests (Optional[int]): The maximum number of queries
+            to this deployment that each router (handle or HTTP proxy) queues
+            while all replicas are at max_concurrent_queries. Further queries
+            are rejected with a BackPressureError. Defaults to -1, meaning
+            no limit.
         user_config (Optional[Any]): Arguments to pass to the reconfigure
             method of the deployment. The reconfigure method is called if
             user_config is not None. Must be json-serializable.
@@ -148,6 +177,9 @@ class DeploymentConfig(BaseModel):
     max_concurrent_queries: Optional[int] = Field(
         default=None, update_type=DeploymentOptionUpdateType.NeedsReconfigure
     )
+    max_queued_requests: int = Field(
+        default=-1, update_type=DeploymentOptionUpdateType.NeedsReconfigure
+    )
     user_config: Any = Field(
         default=None, update_type=DeploymentOptionUpdateType.NeedsActorReconfigure
     )
@@ -205,6 +237,12 @@ class DeploymentConfig(BaseModel):
                 raise ValueError("max_concurrent_queries must be >= 0")
         return v
 
+    @validator("max_queued_requests")
+    def max_queued_requests_valid(cls, v):  # noqa 805
+        if v < -1:
+            raise ValueError("max_queued_requests must be -1 (no limit) or >= 0")
+        return v
+
     @validator("user_config", always=True)
     def user_config_json_serializable(cls, v):
         if isinstance(v, bytes):
@@ -559,6 +597,7 @@ class HTTPOptions(pydantic.BaseModel):
     root_path: str = ""
     fixed_number_replicas: Optional[int] = None
     fixed_number_selection_seed: int = 0
+    grpc_port: Optional[int] = None
 
     @validator("location", always=True)
     def location_backfill_no_server(cls, v, values):
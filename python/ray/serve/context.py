@@ -5,7 +5,7 @@ can use this state to access metadata or the Serve controller.
 
 import logging
 from dataclasses import dataclass
-from typing import Callable
+from typing import Callable, Optional
 
 import ray
 from ray.exceptions import RayActorError
@@ -32,6 +32,9 @@ class ReplicaContext:
     _internal_controller_name: str
     servable_object: Callable
     app_name: str
+    # Node-local directory the deployment's `prefetch` method downloaded its
+    # artifacts to, None if the deployment doesn't define one.
+    prefetch_dir: Optional[str] = None
 
 
 @PublicAPI(stability="alpha")
@@ -75,10 +78,16 @@ def _set_internal_replica_context(
     controller_name: str,
     servable_object: Callable,
     app_name: str,
+    prefetch_dir: Optional[str] = None,
 ):
     global _INTERNAL_REPLICA_CONTEXT
     _INTERNAL_REPLICA_CONTEXT = ReplicaContext(
-        deployment, replica_tag, controller_name, servable_object, app_name
+        deployment,
+        replica_tag,
+        controller_name,
+        servable_object,
+        app_name,
+        prefetch_dir=prefetch_dir,
     )
 
 
@@ -138,6 +147,14 @@ def _connect() -> ServeControllerClient:
 #     the route is empty.
 # request_id: the request id is generated from http proxy, the value
 #     shouldn't be changed when the variable is set.
+# multiplexed_model_id: the ID of the multiplexed model the request is for,
+#     see serve.get_multiplexed_model_id(). It's empty if the request isn't
+#     for a multiplexed model.
+# priority: the priority of the request, inherited by the requests made while
+#     handling it.
+# deadline_s: the unix timestamp after which the request and the requests made
+#     while handling it are dropped before reaching a replica, None if the
+#     request has no deadline.
 # note:
 #   The request context is readonly to avoid potential
 #       async task conflicts when using it concurrently.
@@ -149,6 +166,9 @@ class RequestContext:
     route: str = ""
     request_id: str = ""
     app_name: str = ""
+    multiplexed_model_id: str = ""
+    priority: int = 0
+    deadline_s: Optional[float] = None
 
 
 _serve_request_context = contextvars.ContextVar(
@@ -12,6 +12,7 @@ from ray._private.utils import (
     import_attr,
     run_background_task,
 )
+from ray.util import metrics
 from ray.util.scheduling_strategies import NodeAffinitySchedulingStrategy
 from ray.actor import ActorHandle
 from ray._raylet import GcsClient
@@ -162,6 +163,12 @@ class ServeController:
         # Keep track of single-app vs multi-app
         self.deploy_mode = ServeDeployMode.UNSET
 
+        self.control_loop_duration_histogram = metrics.Histogram(
+            "serve_controller_control_loop_duration_s",
+            description="The time taken by an iteration of the control loop.",
+            boundaries=[0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 10],
+        )
+
         run_background_task(self.run_control_loop())
 
         self._recover_config_from_checkpoint()
@@ -179,6 +186,13 @@ class ServeController:
     def record_handle_metrics(self, data: Dict[str, float], send_timestamp: float):
         self.deployment_state_manager.record_handle_metrics(data, send_timestamp)
 
+    def record_multiplexed_model_ids(
+        self, deployment_name: str, replica_tag: str, model_ids: List[str]
+    ):
+        self.deployment_state_manager.record_multiplexed_model_ids(
+            deployment_name, replica_tag, model_ids
+        )
+
     def _dump_autoscaling_metrics_for_testing(self):
         return self.deployment_state_manager.get_autoscaling_metrics()
 
@@ -192,18 +206,25 @@ class ServeController:
             deployment_name
         ]._stop_one_running_replica_for_testing()
 
-    async def listen_for_change(self, keys_to_snapshot_ids: Dict[str, int]):
+    async def listen_for_change(
+        self, keys_to_snapshot_ids: Dict[str, int], allow_delta: bool = False
+    ):
         """Proxy long pull client's listen request.
 
         Args:
             keys_to_snapshot_ids (Dict[str, int]): Snapshot IDs are used to
               determine whether or not the host should immediately return the
               data or wait for the value to be changed.
+            allow_delta: Whether the client accepts delta updates.
         """
         if not self.done_recovering_event.is_set():
             await self.done_recovering_event.wait()
 
-        return await (self.long_poll_host.listen_for_change(keys_to_snapshot_ids))
+        return await (
+            self.long_poll_host.listen_for_change(
+                keys_to_snapshot_ids, allow_delta=allow_delta
+            )
+        )
 
     async def listen_for_change_java(self, keys_to_snapshot_ids_bytes: bytes):
         """Proxy long pull client's listen request.
@@ -262,6 +283,7 @@ class ServeController:
         recovering_timeout = RECOVERING_LONG_POLL_BROADCAST_TIMEOUT_S
         start_time = time.time()
         while True:
+            loop_start_time = time.time()
             if (
                 not self.done_recovering_event.is_set()
                 and time.time() - start_time > recovering_timeout
@@ -297,6 +319,10 @@ class ServeController:
                 self._put_serve_snapshot()
             except Exception:
                 logger.exception("Exception putting serve snapshot.")
+
+            self.control_loop_duration_histogram.observe(
+                time.time() - loop_start_time
+            )
             await asyncio.sleep(CONTROL_LOOP_PERIOD_S)
 
     def _put_serve_snapshot(self) -> None:
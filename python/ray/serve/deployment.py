@@ -403,6 +403,7 @@ class Deployment:
         ray_actor_options: Default[Optional[Dict]] = DEFAULT.VALUE,
         user_config: Default[Optional[Any]] = DEFAULT.VALUE,
         max_concurrent_queries: Default[int] = DEFAULT.VALUE,
+        max_queued_requests: Default[int] = DEFAULT.VALUE,
         autoscaling_config: Default[
             Union[Dict, AutoscalingConfig, None]
         ] = DEFAULT.VALUE,
@@ -461,6 +462,8 @@ class Deployment:
             new_config.user_config = user_config
         if max_concurrent_queries is not DEFAULT.VALUE:
             new_config.max_concurrent_queries = max_concurrent_queries
+        if max_queued_requests is not DEFAULT.VALUE:
+            new_config.max_queued_requests = max_queued_requests
 
         if func_or_class is None:
             func_or_class = self._func_or_class
@@ -528,6 +531,7 @@ class Deployment:
         ray_actor_options: Default[Optional[Dict]] = DEFAULT.VALUE,
         user_config: Default[Optional[Any]] = DEFAULT.VALUE,
         max_concurrent_queries: Default[int] = DEFAULT.VALUE,
+        max_queued_requests: Default[int] = DEFAULT.VALUE,
         autoscaling_config: Default[
             Union[Dict, AutoscalingConfig, None]
         ] = DEFAULT.VALUE,
@@ -558,6 +562,7 @@ class Deployment:
             ray_actor_options=ray_actor_options,
             user_config=user_config,
             max_concurrent_queries=max_concurrent_queries,
+            max_queued_requests=max_queued_requests,
             autoscaling_config=autoscaling_config,
             graceful_shutdown_wait_loop_s=graceful_shutdown_wait_loop_s,
             graceful_shutdown_timeout_s=graceful_shutdown_timeout_s,
@@ -623,6 +628,7 @@ def deployment_to_schema(
         "name": d.name,
         "num_replicas": None if d._config.autoscaling_config else d.num_replicas,
         "max_concurrent_queries": d.max_concurrent_queries,
+        "max_queued_requests": d._config.max_queued_requests,
         "user_config": d.user_config,
         "autoscaling_config": d._config.autoscaling_config,
         "graceful_shutdown_wait_loop_s": d._config.graceful_shutdown_wait_loop_s,
@@ -674,6 +680,7 @@ def schema_to_deployment(s: DeploymentSchema) -> Deployment:
         num_replicas=s.num_replicas,
         user_config=s.user_config,
         max_concurrent_queries=s.max_concurrent_queries,
+        max_queued_requests=s.max_queued_requests,
         autoscaling_config=s.autoscaling_config,
         graceful_shutdown_wait_loop_s=s.graceful_shutdown_wait_loop_s,
         graceful_shutdown_timeout_s=s.graceful_shutdown_timeout_s,
@@ -4,3 +4,20 @@ from ray.util.annotations import PublicAPI
 @PublicAPI(stability="stable")
 class RayServeException(Exception):
     pass
+
+
+@PublicAPI(stability="alpha")
+class BackPressureError(RayServeException):
+    """Raised when a request is rejected because the deployment's queue is full.
+
+    See the `max_queued_requests` deployment option.
+    """
+
+    pass
+
+
+@PublicAPI(stability="alpha")
+class RequestDeadlineExceededError(RayServeException):
+    """Raised when a request's deadline passes before it's sent to a replica."""
+
+    pass
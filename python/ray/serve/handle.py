@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from functools import wraps
 import inspect
 import os
+import time
 from typing import Coroutine, Dict, Optional, Union
 import threading
 
@@ -72,6 +73,10 @@ class HandleOptions:
     """Options for each ServeHandle instances. These fields are immutable."""
 
     method_name: str = "__call__"
+    multiplexed_model_id: str = ""
+    # None to inherit the value of the request being handled, if any.
+    priority: Optional[int] = None
+    timeout_s: Optional[float] = None
 
 
 @PublicAPI(stability="beta")
@@ -195,11 +200,17 @@ class RayServeHandle:
         self,
         *,
         method_name: Union[str, DEFAULT] = DEFAULT.VALUE,
+        multiplexed_model_id: Union[str, DEFAULT] = DEFAULT.VALUE,
+        priority: Union[Optional[int], DEFAULT] = DEFAULT.VALUE,
+        timeout_s: Union[Optional[float], DEFAULT] = DEFAULT.VALUE,
     ):
         new_options_dict = self.handle_options.__dict__.copy()
         user_modified_options_dict = {
             key: value
-            for key, value in zip(["method_name"], [method_name])
+            for key, value in zip(
+                ["method_name", "multiplexed_model_id", "priority", "timeout_s"],
+                [method_name, multiplexed_model_id, priority, timeout_s],
+            )
             if value != DEFAULT.VALUE
         }
         new_options_dict.update(user_modified_options_dict)
@@ -217,6 +228,9 @@ class RayServeHandle:
         self,
         *,
         method_name: Union[str, DEFAULT] = DEFAULT.VALUE,
+        multiplexed_model_id: Union[str, DEFAULT] = DEFAULT.VALUE,
+        priority: Union[Optional[int], DEFAULT] = DEFAULT.VALUE,
+        timeout_s: Union[Optional[float], DEFAULT] = DEFAULT.VALUE,
     ) -> "RayServeHandle":
         """Set options for this handle and return an updated copy of it.
 
@@ -228,11 +242,32 @@ class RayServeHandle:
             obj_ref = await handle.other_method.remote(*args)
             obj_ref = await handle.options(method_name="other_method").remote(*args)
 
+            # Send the request to a replica that has the model "model_1" loaded,
+            # if there's one.
+            obj_ref = await handle.options(multiplexed_model_id="model_1").remote()
+
+            # Send the request before queued requests with a lower priority,
+            # and drop it if it isn't sent to a replica within 1 second.
+            obj_ref = await handle.options(priority=1, timeout_s=1).remote()
+
+        By default, requests made while handling a request for a multiplexed
+        model are for the same model. Requests made while handling another
+        request inherit its priority and can't outlive its deadline.
         """
-        return self._options(method_name=method_name)
+        return self._options(
+            method_name=method_name,
+            multiplexed_model_id=multiplexed_model_id,
+            priority=priority,
+            timeout_s=timeout_s,
+        )
 
     def _remote(self, deployment_name, handle_options, args, kwargs) -> Coroutine:
         _request_context = ray.serve.context._serve_request_context.get()
+        deadline_s = _request_context.deadline_s
+        if handle_options.timeout_s is not None:
+            timeout_deadline_s = time.time() + handle_options.timeout_s
+            if deadline_s is None or timeout_deadline_s < deadline_s:
+                deadline_s = timeout_deadline_s
         request_metadata = RequestMetadata(
             _request_context.request_id,
             deployment_name,
@@ -240,6 +275,16 @@ class RayServeHandle:
             http_arg_is_pickled=self._pickled_http_request,
             route=_request_context.route,
             app_name=_request_context.app_name,
+            multiplexed_model_id=(
+                handle_options.multiplexed_model_id
+                or _request_context.multiplexed_model_id
+            ),
+            priority=(
+                handle_options.priority
+                if handle_options.priority is not None
+                else _request_context.priority
+            ),
+            deadline_s=deadline_s,
         )
         self.request_counter.inc(
             tags={
@@ -339,6 +384,9 @@ class RayServeSyncHandle(RayServeHandle):
         self,
         *,
         method_name: Union[str, DEFAULT] = DEFAULT.VALUE,
+        multiplexed_model_id: Union[str, DEFAULT] = DEFAULT.VALUE,
+        priority: Union[Optional[int], DEFAULT] = DEFAULT.VALUE,
+        timeout_s: Union[Optional[float], DEFAULT] = DEFAULT.VALUE,
     ) -> "RayServeSyncHandle":
         """Set options for this handle and return an updated copy of it.
 
@@ -350,8 +398,21 @@ class RayServeSyncHandle(RayServeHandle):
             obj_ref = handle.other_method.remote(*args)
             obj_ref = handle.options(method_name="other_method").remote(*args)
 
+            # Send the request to a replica that has the model "model_1" loaded,
+            # if there's one.
+            obj_ref = handle.options(multiplexed_model_id="model_1").remote()
+
+            # Send the request before queued requests with a lower priority,
+            # and drop it if it isn't sent to a replica within 1 second.
+            obj_ref = handle.options(priority=1, timeout_s=1).remote()
+
         """
-        return self._options(method_name=method_name)
+        return self._options(
+            method_name=method_name,
+            multiplexed_model_id=multiplexed_model_id,
+            priority=priority,
+            timeout_s=timeout_s,
+        )
 
     def remote(self, *args, **kwargs) -> ray.ObjectRef:
         """Issue an asynchronous request to the __call__ method of the deployment.
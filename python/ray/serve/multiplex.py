@@ -0,0 +1,247 @@
+import asyncio
+from collections import OrderedDict
+from functools import wraps
+import inspect
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import ray
+from ray._private.utils import get_or_create_event_loop
+from ray.actor import ActorHandle
+from ray.serve._private.constants import (
+    DEFAULT_LATENCY_BUCKET_MS,
+    DEFAULT_MAX_NUM_MODELS_PER_REPLICA,
+    SERVE_LOGGER_NAME,
+    SERVE_NAMESPACE,
+)
+from ray.serve.batching import _extract_self_if_method_call
+from ray.util import metrics
+from ray.util.annotations import PublicAPI
+
+logger = logging.getLogger(SERVE_LOGGER_NAME)
+
+
+class _ModelMultiplexWrapper:
+    """LRU cache of the multiplexed models loaded in a replica.
+
+    Models are loaded with the user's load function the first time they're
+    requested. Concurrent requests for a model that's being loaded wait for
+    the same load. Once `max_num_models_per_replica` models are loaded, the
+    least recently used model is unloaded to make room for a new one.
+
+    The IDs of the loaded models are reported to the controller whenever they
+    change, so that routers send requests to replicas that have the model
+    loaded.
+    """
+
+    def __init__(
+        self,
+        load_func: Callable[[str], Any],
+        max_num_models_per_replica: int,
+    ):
+        self._load_func = load_func
+        self.max_num_models_per_replica = max_num_models_per_replica
+        self.models: "OrderedDict[str, Any]" = OrderedDict()
+        # Map model_id -> task loading the model.
+        self._loading: Dict[str, asyncio.Task] = dict()
+
+        context = ray.serve.context.get_internal_replica_context()
+        self._deployment_name: Optional[str] = None
+        self._replica_tag: Optional[str] = None
+        self._controller_handle: Optional[ActorHandle] = None
+        if context is not None:
+            self._deployment_name = context.deployment
+            self._replica_tag = context.replica_tag
+            self._controller_handle = ray.get_actor(
+                context._internal_controller_name, namespace=SERVE_NAMESPACE
+            )
+
+        self.num_models_gauge = metrics.Gauge(
+            "serve_num_multiplexed_models",
+            description="The number of multiplexed models loaded in the replica.",
+        )
+        self.model_load_counter = metrics.Counter(
+            "serve_multiplexed_model_load_counter",
+            description="The number of times multiplexed models were loaded.",
+        )
+        self.model_unload_counter = metrics.Counter(
+            "serve_multiplexed_model_unload_counter",
+            description="The number of times multiplexed models were unloaded.",
+        )
+        self.model_load_latency_ms = metrics.Histogram(
+            "serve_multiplexed_model_load_latency_ms",
+            description="The time taken to load a multiplexed model.",
+            boundaries=DEFAULT_LATENCY_BUCKET_MS,
+        )
+
+    async def load_model(self, model_id: str) -> Any:
+        """Return the model, loading it first if it isn't loaded yet."""
+        if not isinstance(model_id, str) or len(model_id) == 0:
+            raise ValueError(
+                f"The model ID must be a non-empty string, got {model_id!r}. "
+                "Use serve.get_multiplexed_model_id() to get the model ID of "
+                "the current request."
+            )
+
+        if model_id in self.models:
+            self.models.move_to_end(model_id)
+            return self.models[model_id]
+
+        task = self._loading.get(model_id)
+        if task is None:
+            task = get_or_create_event_loop().create_task(self._load(model_id))
+            self._loading[model_id] = task
+            task.add_done_callback(lambda _: self._loading.pop(model_id, None))
+
+        # Shielded so that a cancelled request doesn't cancel the load for the
+        # other requests waiting on it.
+        return await asyncio.shield(task)
+
+    async def _load(self, model_id: str) -> Any:
+        # Make room before loading, so that the replica doesn't hold more
+        # than max_num_models_per_replica models at any time.
+        while len(self.models) >= self.max_num_models_per_replica:
+            self._unload_lru_model()
+
+        start_time = time.time()
+        model = await self._load_func(model_id)
+        self.model_load_latency_ms.observe((time.time() - start_time) * 1000)
+        self.model_load_counter.inc()
+        logger.info(f"Loaded multiplexed model {model_id}.")
+
+        self.models[model_id] = model
+        # Other models might have been loaded concurrently.
+        while len(self.models) > self.max_num_models_per_replica:
+            self._unload_lru_model()
+        self._on_models_changed()
+        return model
+
+    def _unload_lru_model(self):
+        # The model is released once the requests using it have finished.
+        model_id, _ = self.models.popitem(last=False)
+        self.model_unload_counter.inc()
+        logger.info(f"Unloaded multiplexed model {model_id}.")
+        self._on_models_changed()
+
+    def _on_models_changed(self):
+        self.num_models_gauge.set(len(self.models))
+        if self._controller_handle is not None:
+            self._controller_handle.record_multiplexed_model_ids.remote(
+                self._deployment_name, self._replica_tag, list(self.models.keys())
+            )
+
+
+@PublicAPI(stability="alpha")
+def multiplexed(
+    func: Optional[Callable] = None,
+    max_num_models_per_replica: int = DEFAULT_MAX_NUM_MODELS_PER_REPLICA,
+):
+    """Wraps a function or method that loads a model to multiplex models.
+
+    Many models can then be served by the same deployment, with each replica
+    keeping up to `max_num_models_per_replica` models loaded. The function
+    must be `async def` and take the model ID as its sole argument. Calling
+    it returns the loaded model, and only loads the model if it isn't loaded
+    in the replica yet. The least recently used model is unloaded when a new
+    model has to be loaded and the replica has no room left for it.
+
+    The model ID of a request is set with the "serve_multiplexed_model_id"
+    HTTP header or `handle.options(multiplexed_model_id=...)`, and retrieved
+    in the replica with `serve.get_multiplexed_model_id()`. Requests are
+    preferably routed to replicas that have the model loaded.
+
+    Example:
+
+    .. code-block:: python
+
+        from ray import serve
+
+        @serve.deployment
+        class MultiplexedModels:
+            @serve.multiplexed(max_num_models_per_replica=5)
+            async def get_model(self, model_id: str):
+                return await load_model_from_storage(model_id)
+
+            async def __call__(self, request):
+                model = await self.get_model(serve.get_multiplexed_model_id())
+                return model.predict(await request.json())
+
+    Arguments:
+        max_num_models_per_replica: the maximum number of models loaded in
+            each replica.
+    """
+    if func is not None and not callable(func):
+        raise TypeError("The first argument to @serve.multiplexed must be a callable.")
+
+    if (
+        not isinstance(max_num_models_per_replica, int)
+        or max_num_models_per_replica < 1
+    ):
+        raise ValueError("max_num_models_per_replica must be a positive integer.")
+
+    def _multiplex_decorator(func: Callable):
+        if not inspect.iscoroutinefunction(func):
+            raise TypeError(
+                "Functions decorated with @serve.multiplexed must be 'async def'."
+            )
+
+        @wraps(func)
+        async def multiplex_wrapper(*args: List[Any]):
+            self = _extract_self_if_method_call(args, func)
+            if self is None:
+                # For functions, inject the model cache as an attribute of the
+                # function.
+                model_cache_object = func
+                load_func = func
+                model_args = args
+            else:
+                # For methods, inject the model cache as an attribute of the
+                # object.
+                model_cache_object = self
+
+                async def load_func(model_id: str):
+                    return await func(self, model_id)
+
+                model_args = args[1:]
+
+            if len(model_args) != 1:
+                raise TypeError(
+                    "Functions decorated with @serve.multiplexed take the model "
+                    f"ID as their sole argument, got {len(model_args)} arguments."
+                )
+
+            model_cache_attr = f"__serve_multiplex_{func.__name__}"
+            model_cache = getattr(model_cache_object, model_cache_attr, None)
+            if model_cache is None:
+                model_cache = _ModelMultiplexWrapper(
+                    load_func, max_num_models_per_replica
+                )
+                setattr(model_cache_object, model_cache_attr, model_cache)
+
+            return await model_cache.load_model(model_args[0])
+
+        return multiplex_wrapper
+
+    return _multiplex_decorator(func) if callable(func) else _multiplex_decorator
+
+
+@PublicAPI(stability="alpha")
+def get_multiplexed_model_id() -> str:
+    """Get the ID of the multiplexed model the current request is for.
+
+    This is meant to be called from within a deployment. It returns an empty
+    string if the request isn't for a multiplexed model.
+
+    .. code-block:: python
+
+        from ray import serve
+
+        @serve.deployment
+        def my_deployment_function(request):
+            assert serve.get_multiplexed_model_id() == "model_1"
+
+        handle = serve.run(my_deployment_function.bind())
+        handle.options(multiplexed_model_id="model_1").remote(...)
+    """
+    return ray.serve.context._serve_request_context.get().multiplexed_model_id
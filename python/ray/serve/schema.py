@@ -175,6 +175,15 @@ class DeploymentSchema(
         ),
         gt=0,
     )
+    max_queued_requests: int = Field(
+        default=DEFAULT.VALUE,
+        description=(
+            "The max number of queries queued in each handle or HTTP proxy "
+            "while all replicas are busy. Further queries are rejected. -1 "
+            "means no limit. Uses a default if null."
+        ),
+        ge=-1,
+    )
     user_config: Optional[Dict] = Field(
         default=DEFAULT.VALUE,
         description=(
@@ -276,6 +285,7 @@ def _deployment_info_to_schema(name: str, info: DeploymentInfo) -> DeploymentSch
     schema = DeploymentSchema(
         name=name,
         max_concurrent_queries=info.deployment_config.max_concurrent_queries,
+        max_queued_requests=info.deployment_config.max_queued_requests,
         user_config=info.deployment_config.user_config,
         graceful_shutdown_wait_loop_s=(
             info.deployment_config.graceful_shutdown_wait_loop_s
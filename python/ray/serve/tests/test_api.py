@@ -127,6 +127,55 @@ def test_starlette_response(serve_instance):
     assert resp.status_code == 418
 
 
+def test_large_request_body(serve_instance):
+    @serve.deployment
+    class Echo:
+        async def __call__(self, request):
+            body = await request.body()
+            return {"length": len(body), "json": (await request.json())[:3]}
+
+    serve.run(Echo.bind())
+
+    # Bodies above the threshold are passed through the object store.
+    for length in [10, 5 * 1024 * 1024]:
+        payload = [1] * length
+        resp = requests.post("http://127.0.0.1:8000/", json=payload)
+        assert resp.status_code == 200
+        body_length = len(requests.Request(json=payload).prepare().body)
+        assert resp.json() == {"length": body_length, "json": [1, 1, 1]}
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_generator_response_is_streamed(serve_instance, use_async):
+    signal = SignalActor.remote()
+
+    if use_async:
+
+        @serve.deployment
+        async def generator(request):
+            yield "first"
+            await signal.wait.remote()
+            yield "second"
+
+    else:
+
+        @serve.deployment
+        def generator(request):
+            yield "first"
+            ray.get(signal.wait.remote())
+            yield "second"
+
+    serve.run(generator.bind())
+
+    with requests.get("http://127.0.0.1:8000/", stream=True) as resp:
+        assert resp.status_code == 200
+        chunks = resp.iter_content(chunk_size=None, decode_unicode=True)
+        # The first chunk arrives before the generator has finished.
+        assert next(chunks) == "first"
+        ray.get(signal.send.remote())
+        assert "".join(chunks) == "second"
+
+
 @pytest.mark.parametrize("use_async", [False, True])
 def test_deploy_function_no_params(serve_instance, use_async):
     serve.start()
@@ -1,5 +1,8 @@
+import random
 import time
 
+import pytest
+
 import ray
 from ray import serve
 from ray._private.test_utils import wait_for_condition
@@ -69,6 +72,37 @@ class TestInMemoryMetricsStore:
         assert s.max("m1", window_start_timestamp_s=0) == 2
         assert s.max("m2", window_start_timestamp_s=0) == -1
 
+    def test_max_points_per_key(self):
+        s = InMemoryMetricsStore(max_points_per_key=100)
+        for i in range(1000):
+            s.add_metrics_point({"m1": i}, timestamp=i)
+        # Only the most recent points are kept.
+        assert len(s.data["m1"]) == 100
+        assert s.data["m1"][0].timestamp == 900
+        assert s.window_average("m1", window_start_timestamp_s=0) == 949.5
+        assert s.max("m1", window_start_timestamp_s=0) == 999
+
+    def test_sliding_window_matches_full_scan(self):
+        random.seed(0)
+        s = InMemoryMetricsStore(max_points_per_key=200)
+        points = []
+        for i in range(1000):
+            timestamp = i
+            # Occasionally report points out of order.
+            if random.random() < 0.05:
+                timestamp -= random.random() * 5
+            value = random.randint(-100, 100)
+            s.add_metrics_point({"m1": value}, timestamp=timestamp)
+            points.append((timestamp, value))
+
+            window_start = i - 50
+            in_window = [v for t, v in points if t > window_start]
+            assert s.max("m1", window_start, do_compact=False) == max(in_window)
+            assert s.window_average("m1", window_start) == pytest.approx(
+                sum(in_window) / len(in_window)
+            )
+            assert s.max("m1", window_start) == max(in_window)
+
 
 def test_e2e(serve_instance):
     @serve.deployment(
@@ -111,6 +145,4 @@ def test_e2e(serve_instance):
 if __name__ == "__main__":
     import sys
 
-    import pytest
-
     sys.exit(pytest.main(["-v", "-s", __file__]))
@@ -1,3 +1,4 @@
+import math
 import os
 import sys
 import tempfile
@@ -12,7 +13,9 @@ import requests
 from ray._private.test_utils import SignalActor, wait_for_condition
 from ray.serve._private.autoscaling_policy import (
     BasicAutoscalingPolicy,
+    PredictiveAutoscalingPolicy,
     calculate_desired_num_replicas,
+    create_autoscaling_policy,
 )
 from ray.serve._private.common import DeploymentInfo
 from ray.serve._private.common import ReplicaState
@@ -479,6 +482,23 @@ def test_replicas_delayed_startup():
     assert new_num_replicas == 123
 
 
+def test_num_standby_replicas():
+    """Standby replicas are capped by the headroom below max_replicas."""
+    config = AutoscalingConfig(
+        min_replicas=1,
+        max_replicas=4,
+        max_standby_replicas=2,
+    )
+    policy = BasicAutoscalingPolicy(config)
+
+    assert policy.get_num_standby_replicas(1) == 2
+    assert policy.get_num_standby_replicas(3) == 1
+    assert policy.get_num_standby_replicas(4) == 0
+
+    policy = BasicAutoscalingPolicy(AutoscalingConfig(max_replicas=4))
+    assert policy.get_num_standby_replicas(1) == 0
+
+
 @pytest.mark.parametrize("delay_s", [30.0, 0.0])
 def test_fluctuating_ongoing_requests(delay_s):
     """
@@ -1165,6 +1185,71 @@ app = g.bind()
     assert existing_pid in pids
 
 
+class TestPredictiveAutoscalingPolicy:
+    def _make_policy(self, **kwargs):
+        config = AutoscalingConfig(
+            min_replicas=1,
+            max_replicas=100,
+            target_num_ongoing_requests_per_replica=1,
+            policy="predictive",
+            **kwargs,
+        )
+        now = [0.0]
+        policy = PredictiveAutoscalingPolicy(config, time_fn=lambda: now[0])
+        return policy, now
+
+    def test_create_autoscaling_policy(self):
+        policy = create_autoscaling_policy(AutoscalingConfig(policy="predictive"))
+        assert isinstance(policy, PredictiveAutoscalingPolicy)
+        policy = create_autoscaling_policy(AutoscalingConfig())
+        assert type(policy) is BasicAutoscalingPolicy
+        with pytest.raises(ValueError):
+            AutoscalingConfig(policy="unknown")
+
+    def test_scale_ahead_of_trend(self):
+        policy, now = self._make_policy()
+        policy.record_replica_startup_time(60)
+        assert policy.replica_startup_time_s == 60
+
+        # Load grows by 0.05 requests/s: it will have grown by 3 requests by
+        # the time a new replica has started.
+        num_replicas = 10
+        for i in range(600):
+            now[0] = i
+            load = 10 + i * 0.05
+            num_replicas = policy.get_decision_num_replicas(
+                curr_target_num_replicas=num_replicas,
+                current_num_ongoing_requests=[load / num_replicas] * num_replicas,
+                current_handle_queued_queries=0,
+            )
+        assert policy.trend == pytest.approx(0.05, rel=0.01)
+        assert num_replicas == math.ceil(10 + 599 * 0.05 + 60 * 0.05)
+
+    def test_scale_ahead_of_seasonal_ramp(self):
+        period_s = 2880
+        policy, now = self._make_policy(seasonality_period_s=period_s)
+        policy.record_replica_startup_time(60)
+
+        def get_load(timestamp):
+            return 50 if 1000 <= timestamp % period_s < 1500 else 5
+
+        decisions = {}
+        for timestamp in range(0, 3 * period_s, 10):
+            now[0] = timestamp
+            decisions[timestamp] = policy.get_decision_num_replicas(
+                curr_target_num_replicas=5,
+                current_num_ongoing_requests=[get_load(timestamp) / 5] * 5,
+                current_handle_queued_queries=0,
+            )
+
+        # In the first period there is no seasonal profile yet.
+        assert decisions[950] == 5
+        # Afterwards, the deployment is scaled up a startup time ahead of the
+        # daily ramp.
+        assert decisions[2 * period_s + 900] == 5
+        assert decisions[2 * period_s + 950] == 50
+
+
 if __name__ == "__main__":
     import sys
     import pytest
@@ -5,6 +5,7 @@ import pytest
 import ray
 from ray import serve
 from ray._private.utils import get_or_create_event_loop
+from ray.serve.batching import _AdaptiveBatchingPolicy
 
 
 def test_batching(serve_instance):
@@ -132,6 +133,32 @@ async def test_decorator_validation():
             async def method(self, requests):
                 pass
 
+    class LatencySLO:
+        @serve.batch(batch_latency_slo_s=0.5)
+        async def method(self, requests):
+            pass
+
+    with pytest.raises(ValueError):
+
+        class ZeroLatencySLO:
+            @serve.batch(batch_latency_slo_s=0)
+            async def method(self, requests):
+                pass
+
+    with pytest.raises(TypeError):
+
+        class NonCallableBucketKey:
+            @serve.batch(bucket_key=1)
+            async def method(self, requests):
+                pass
+
+    with pytest.raises(TypeError):
+
+        class NonLatencySLO:
+            @serve.batch(batch_latency_slo_s="a")
+            async def method(self, requests):
+                pass
+
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize("use_class", [True, False])
@@ -291,6 +318,100 @@ async def test_batch_args_kwargs(mode, use_class):
     assert result == [("hi1", "hi2"), ("hi3", "hi4")]
 
 
+def test_adaptive_batching_policy():
+    policy = _AdaptiveBatchingPolicy(latency_slo_s=1.0, max_batch_size=8)
+    # Without any observations, batches are run right away.
+    assert policy.target_batch_size() == 1
+    assert policy.wait_timeout_s(oldest_arrival_time=0, now=0) == 1.0
+
+    # 10 requests/s with a 1s SLO and 0.5s batch latency: ~5 requests arrive
+    # while the oldest request can still wait.
+    for i in range(10):
+        policy.record_arrival(i * 0.1)
+    policy.record_batch_latency(0.5)
+    assert policy.arrival_rate == pytest.approx(10)
+    assert policy.target_batch_size() in (4, 5)
+    assert policy.wait_timeout_s(oldest_arrival_time=0, now=0.2) == pytest.approx(
+        0.3
+    )
+    # The oldest request would miss its deadline, flush immediately.
+    assert policy.wait_timeout_s(oldest_arrival_time=0, now=0.6) == 0
+
+    # High load is capped at max_batch_size.
+    for i in range(100):
+        policy.record_arrival(1 + i * 0.001)
+    assert policy.target_batch_size() == 8
+
+
+@pytest.mark.asyncio
+async def test_adaptive_batching():
+    batch_sizes = []
+
+    @serve.batch(max_batch_size=10, batch_latency_slo_s=1.0)
+    async def func(requests):
+        batch_sizes.append(len(requests))
+        await asyncio.sleep(0.01)
+        return requests
+
+    # A single request at low load is not held back waiting for a batch.
+    start = asyncio.get_event_loop().time()
+    assert await func("hi") == "hi"
+    assert asyncio.get_event_loop().time() - start < 0.5
+
+    # Requests arriving at a steady rate are batched together.
+    tasks = []
+    for i in range(20):
+        tasks.append(get_or_create_event_loop().create_task(func(i)))
+        await asyncio.sleep(0.01)
+    assert await asyncio.gather(*tasks) == list(range(20))
+    assert max(batch_sizes) > 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("use_class", [True, False])
+async def test_bucketed_batching(use_class):
+    batches = []
+
+    @serve.batch(max_batch_size=2, batch_wait_timeout_s=0.5, bucket_key=len)
+    async def func(requests):
+        batches.append(requests)
+        return requests
+
+    class Bucketed:
+        @serve.batch(max_batch_size=2, batch_wait_timeout_s=0.5, bucket_key=len)
+        async def method(self, requests):
+            batches.append(requests)
+            return requests
+
+    cls = Bucketed()
+
+    async def call(arg):
+        if use_class:
+            return await cls.method(arg)
+        else:
+            return await func(arg)
+
+    # Full buckets are run right away, only requests of the same length are
+    # batched together.
+    tasks = [
+        get_or_create_event_loop().create_task(call(arg))
+        for arg in ["a", "bbb", "c", "ddd"]
+    ]
+    done, _ = await asyncio.wait(tasks, timeout=0.3)
+    assert set(done) == set(tasks)
+    assert [t.result() for t in tasks] == ["a", "bbb", "c", "ddd"]
+    assert sorted(batches) == [["a", "c"], ["bbb", "ddd"]]
+
+    # A partial bucket is run once its oldest request hits the timeout.
+    batches.clear()
+    t1 = get_or_create_event_loop().create_task(call("a"))
+    t2 = get_or_create_event_loop().create_task(call("bb"))
+    done, _ = await asyncio.wait([t1, t2], timeout=0.1)
+    assert len(done) == 0
+    assert await asyncio.gather(t1, t2) == ["a", "bb"]
+    assert batches == [["a"], ["bb"]]
+
+
 if __name__ == "__main__":
     import sys
 
@@ -70,6 +70,12 @@ class TestDeploymentConfig:
         # Test dynamic default for max_concurrent_queries.
         assert DeploymentConfig().max_concurrent_queries == 100
 
+        # Test max_queued_requests validation.
+        assert DeploymentConfig().max_queued_requests == -1
+        DeploymentConfig(max_queued_requests=0)
+        with pytest.raises(ValidationError, match="value_error"):
+            DeploymentConfig(max_queued_requests=-2)
+
     def test_deployment_config_update(self):
         b = DeploymentConfig(num_replicas=1, max_concurrent_queries=1)
 
@@ -229,6 +235,10 @@ def test_with_proto():
     config = DeploymentConfig(user_config={"python": ("native", ["objects"])})
     assert config == DeploymentConfig.from_proto_bytes(config.to_proto_bytes())
 
+    # Test that an unlimited queue is preserved.
+    config = DeploymentConfig(max_queued_requests=-1)
+    assert config == DeploymentConfig.from_proto_bytes(config.to_proto_bytes())
+
 
 def test_zero_default_proto():
     # Test that options set to zero (protobuf default value) still retain their
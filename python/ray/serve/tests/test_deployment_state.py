@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from copy import copy
 import sys
 import time
 from typing import Any, Dict, List, Optional, Tuple
@@ -24,6 +25,7 @@ from ray.serve._private.deployment_state import (
     DeploymentReplica,
     ReplicaStartupStatus,
     ReplicaStateContainer,
+    TimerWheel,
     VersionedReplica,
     rank_replicas_for_stopping,
 )
@@ -75,6 +77,8 @@ class MockReplicaActorWrapper:
         self.health_check_called = False
         # Returned by the health check.
         self.healthy = True
+        # Time at which the health check should be called next.
+        self.next_health_check_time = 0.0
         self._is_cross_language = False
         self._scheduling_strategy = scheduling_strategy
         self._actor_handle = MockActorHandle()
@@ -1716,6 +1720,143 @@ def test_health_check(mock_get_all_node_ids, mock_deployment_state):
     assert deployment_state.curr_status_info.status == DeploymentStatus.HEALTHY
 
 
+@pytest.mark.parametrize("mock_deployment_state", [False], indirect=True)
+def test_health_check_steady_state(mock_deployment_state):
+    deployment_state, timer = mock_deployment_state
+
+    b_info_1, b_version_1 = deployment_info(num_replicas=3, version="1")
+    deployment_state.deploy(b_info_1)
+    deployment_state.update()
+    replicas = deployment_state._replicas.get()
+    for replica in replicas:
+        replica._actor.set_ready()
+    replicas[0]._actor.next_health_check_time = timer.time() + 10
+
+    deployment_state.update()
+    check_counts(deployment_state, total=3, by_state=[(ReplicaState.RUNNING, 3)])
+    assert deployment_state.curr_status_info.status == DeploymentStatus.HEALTHY
+    assert deployment_state._in_steady_state()
+
+    # Only the replicas whose health check is due are checked.
+    for replica in replicas:
+        replica._actor.health_check_called = False
+    deployment_state.update()
+    assert not replicas[0]._actor.health_check_called
+    assert replicas[1]._actor.health_check_called
+    assert replicas[2]._actor.health_check_called
+
+    timer.advance(11)
+    replicas[0]._actor.health_check_called = False
+    deployment_state.update()
+    assert replicas[0]._actor.health_check_called
+
+    # An unhealthy replica is stopped and replaced.
+    replicas[0]._actor.set_unhealthy()
+    deployment_state.update()
+    assert not deployment_state._in_steady_state()
+    check_counts(
+        deployment_state,
+        total=3,
+        by_state=[(ReplicaState.RUNNING, 2), (ReplicaState.STOPPING, 1)],
+    )
+    assert deployment_state.curr_status_info.status == DeploymentStatus.UNHEALTHY
+
+    # Scaling the deployment leaves the steady state.
+    replicas[0]._actor.set_done_stopping()
+    deployment_state.update()
+    deployment_state.update()
+    for replica in deployment_state._replicas.get(states=[ReplicaState.STARTING]):
+        replica._actor.set_ready()
+    deployment_state.update()
+    assert deployment_state._in_steady_state()
+
+    b_info_2, _ = deployment_info(num_replicas=5, version="1")
+    deployment_state.deploy(b_info_2)
+    assert not deployment_state._in_steady_state()
+    deployment_state.update()
+    check_counts(
+        deployment_state,
+        total=5,
+        by_state=[(ReplicaState.RUNNING, 3), (ReplicaState.STARTING, 2)],
+    )
+
+
+@pytest.mark.parametrize("mock_deployment_state", [False], indirect=True)
+def test_standby_replicas(mock_deployment_state):
+    deployment_state, timer = mock_deployment_state
+
+    b_info_1, b_version_1 = deployment_info(
+        version="1",
+        autoscaling_config={
+            "min_replicas": 1,
+            "max_replicas": 3,
+            "max_standby_replicas": 1,
+        },
+    )
+    deployment_state.deploy(b_info_1)
+
+    # Standby replicas are only started once the deployment is healthy.
+    deployment_state.update()
+    check_counts(deployment_state, total=1, by_state=[(ReplicaState.STARTING, 1)])
+    deployment_state._replicas.get()[0]._actor.set_ready()
+    deployment_state.update()
+    check_counts(deployment_state, total=1, by_state=[(ReplicaState.RUNNING, 1)])
+    assert deployment_state.curr_status_info.status == DeploymentStatus.HEALTHY
+
+    deployment_state.update()
+    check_counts(
+        deployment_state,
+        total=2,
+        by_state=[(ReplicaState.RUNNING, 1), (ReplicaState.STANDBY, 1)],
+    )
+    assert not deployment_state._in_steady_state()
+    standby_replica = deployment_state._replicas.get([ReplicaState.STANDBY])[0]
+    standby_replica._actor.set_ready()
+    deployment_state.update()
+    assert deployment_state._in_steady_state()
+
+    # Scaling up promotes the initialized standby replica instead of starting
+    # a new one, then a new standby replica is started.
+    b_info_2 = copy(deployment_state._target_state.info)
+    b_info_2.set_autoscaled_num_replicas(2)
+    deployment_state._set_target_state(b_info_2)
+    deployment_state.update()
+    assert standby_replica in deployment_state._replicas.get([ReplicaState.RUNNING])
+    check_counts(deployment_state, total=2, by_state=[(ReplicaState.RUNNING, 2)])
+    assert deployment_state.curr_status_info.status == DeploymentStatus.HEALTHY
+
+    deployment_state.update()
+    check_counts(
+        deployment_state,
+        total=3,
+        by_state=[(ReplicaState.RUNNING, 2), (ReplicaState.STANDBY, 1)],
+    )
+
+    # A standby replica that fails to start is replaced after the backoff.
+    standby_replica = deployment_state._replicas.get([ReplicaState.STANDBY])[0]
+    standby_replica._actor.set_failed_to_start()
+    deployment_state.update()
+    check_counts(
+        deployment_state,
+        total=3,
+        by_state=[(ReplicaState.RUNNING, 2), (ReplicaState.STOPPING, 1)],
+    )
+    timer.advance(deployment_state._backoff_time_s + 1)
+    deployment_state.update()
+    check_counts(
+        deployment_state,
+        by_state=[(ReplicaState.RUNNING, 2), (ReplicaState.STANDBY, 1)],
+    )
+
+    # Standby replicas are stopped when the deployment is deleted.
+    deployment_state.delete()
+    deployment_state.update()
+    check_counts(
+        deployment_state,
+        by_state=[(ReplicaState.RUNNING, 0), (ReplicaState.STANDBY, 0)],
+    )
+
+
 @pytest.mark.parametrize("mock_deployment_state", [True, False], indirect=True)
 @patch.object(DriverDeploymentState, "_get_all_node_ids")
 def test_update_while_unhealthy(mock_get_all_node_ids, mock_deployment_state):
@@ -2231,6 +2372,77 @@ def test_resume_deployment_state_from_replica_tags(
     assert not any_recovering
 
 
+def test_resume_standby_replicas(mock_deployment_state_manager):
+    deployment_state_manager, deployment_state, timer = mock_deployment_state_manager
+
+    tag = "test"
+    b_info_1, b_version_1 = deployment_info(
+        version="1",
+        autoscaling_config={
+            "min_replicas": 1,
+            "max_replicas": 3,
+            "max_standby_replicas": 1,
+        },
+    )
+    deployment_state.deploy(b_info_1)
+    deployment_state_manager._deployment_states[tag] = deployment_state
+
+    deployment_state_manager.update()
+    deployment_state._replicas.get()[0]._actor.set_ready()
+    deployment_state_manager.update()
+    deployment_state_manager.update()
+    check_counts(
+        deployment_state,
+        total=2,
+        by_state=[(ReplicaState.RUNNING, 1), (ReplicaState.STANDBY, 1)],
+    )
+    running_replica = deployment_state._replicas.get([ReplicaState.RUNNING])[0]
+    standby_replica = deployment_state._replicas.get([ReplicaState.STANDBY])[0]
+    standby_replica._actor.set_ready()
+    deployment_state_manager.update()
+
+    # Recover from the checkpoint after a controller failure. Standby replicas
+    # have the same actor names as running ones, but don't receive requests.
+    deployment_state._replicas = ReplicaStateContainer()
+    deployment_state_manager._recover_from_checkpoint(
+        [
+            ReplicaName.prefix + running_replica.replica_tag,
+            ReplicaName.prefix + standby_replica.replica_tag,
+        ]
+    )
+    deployment_state = deployment_state_manager._deployment_states[tag]
+    check_counts(
+        deployment_state,
+        total=2,
+        version=None,
+        by_state=[(ReplicaState.RECOVERING, 1), (ReplicaState.STANDBY, 1)],
+    )
+    recovered_standby = deployment_state._replicas.get([ReplicaState.STANDBY])[0]
+    assert recovered_standby.replica_tag == standby_replica.replica_tag
+
+    for replica in deployment_state._replicas.get():
+        replica._actor.set_ready()
+        replica._actor.set_starting_version(b_version_1)
+    deployment_state_manager.update()
+    deployment_state_manager.update()
+
+    # No replicas are stopped or started, and the standby replica is ready to be
+    # promoted again.
+    check_counts(
+        deployment_state,
+        total=2,
+        version=b_version_1,
+        by_state=[(ReplicaState.RUNNING, 1), (ReplicaState.STANDBY, 1)],
+    )
+    assert deployment_state._ready_standby_replica_tags == {
+        standby_replica.replica_tag
+    }
+    assert (
+        deployment_state._replicas.get([ReplicaState.RUNNING])[0].replica_tag
+        == running_replica.replica_tag
+    )
+
+
 def test_stopping_replicas_ranking():
     @dataclass
     class MockReplica:
@@ -2251,6 +2463,39 @@ def test_stopping_replicas_ranking():
     compare([2, 2, 3, 3], [2, 2, 3, 3])  # if equal, ordering should be kept
 
 
+def test_timer_wheel():
+    wheel = TimerWheel(tick_s=1, num_slots=8)
+    assert wheel.pop_expired(0) == []
+
+    wheel.schedule("a", "a", 0.5)
+    wheel.schedule("b", "b", 3)
+    # Further out than the span of the wheel.
+    wheel.schedule("c", "c", 20)
+    assert len(wheel) == 3
+
+    assert wheel.pop_expired(0.5) == ["a"]
+    assert wheel.pop_expired(2.9) == []
+    assert wheel.pop_expired(3.5) == ["b"]
+    assert wheel.pop_expired(12) == []
+    assert wheel.pop_expired(25) == ["c"]
+    assert len(wheel) == 0
+
+    # Rescheduling replaces the previous timer and cancelled timers never fire.
+    wheel.schedule("a", "a", 27)
+    wheel.schedule("a", "a", 29)
+    wheel.schedule("b", "b", 28)
+    wheel.cancel("b")
+    assert wheel.pop_expired(28) == []
+    # Deadlines in the past fire on the next call.
+    wheel.schedule("c", "c", 10)
+    assert sorted(wheel.pop_expired(29)) == ["a", "c"]
+    assert len(wheel) == 0
+
+    wheel.schedule("a", "a", 30)
+    wheel.clear()
+    assert wheel.pop_expired(100) == []
+
+
 @pytest.mark.parametrize("mock_deployment_state", [True, False], indirect=True)
 @patch.object(DriverDeploymentState, "_get_all_node_ids")
 def test_resource_requirements_none(mock_get_all_node_ids, mock_deployment_state):
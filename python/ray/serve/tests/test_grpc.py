@@ -203,6 +203,55 @@ def test_deploy_grpc_driver_to_node(ray_cluster):
     )
 
 
+def test_grpc_proxy(serve_start_shutdown):
+    import grpc
+    from ray.serve.generated import serve_pb2, serve_pb2_grpc
+
+    serve.start(http_options={"grpc_port": 9001})
+
+    @serve.deployment
+    class PredictAPIsService:
+        def Predict(self, request: bytes):
+            # The request is passed to the replica without being decoded.
+            request = serve_pb2.PredictRequest.FromString(request)
+            return serve_pb2.PredictResponse(prediction=request.input["a"])
+
+        def Raw(self, request: bytes):
+            return request[::-1]
+
+        def _private(self, request: bytes):
+            return request
+
+        def check_health(self):
+            pass
+
+    serve.run(PredictAPIsService.bind())
+
+    def check_predict():
+        with grpc.insecure_channel("localhost:9001") as channel:
+            stub = serve_pb2_grpc.PredictAPIsServiceStub(channel)
+            response = stub.Predict(serve_pb2.PredictRequest(input={"a": b"123"}))
+        return response.prediction == b"123"
+
+    wait_for_condition(check_predict)
+
+    with grpc.insecure_channel("localhost:9001") as channel:
+        raw = channel.unary_unary("/ray.serve.PredictAPIsService/Raw")
+        assert raw(b"abc") == b"cba"
+
+        unknown = channel.unary_unary("/ray.serve.UnknownService/Predict")
+        with pytest.raises(grpc.RpcError) as exc_info:
+            unknown(b"")
+        assert exc_info.value.code() == grpc.StatusCode.UNIMPLEMENTED
+
+        # Private methods and Serve's own hooks aren't exposed.
+        for method in ["_private", "check_health", "reconfigure", "__init__"]:
+            call = channel.unary_unary(f"/ray.serve.PredictAPIsService/{method}")
+            with pytest.raises(grpc.RpcError) as exc_info:
+                call(b"")
+            assert exc_info.value.code() == grpc.StatusCode.UNIMPLEMENTED
+
+
 def test_schemas_attach_grpc_server():
 
     # Failed with initiate solely
@@ -99,6 +99,41 @@ def test_update_routes(mock_longest_prefix_router):
     assert route == "/endpoint2" and handle == "endpoint2" and app_name == "app2"
 
 
+def test_many_routes(mock_longest_prefix_router):
+    router = mock_longest_prefix_router
+    router.update_routes(
+        {
+            f"endpoint_{i}_{j}": EndpointInfo(route=f"/app{i}/model{j}", app_name="")
+            for i in range(50)
+            for j in range(20)
+        }
+    )
+
+    route, handle, _ = router.match_route("/app12/model3/predict")
+    assert route == "/app12/model3" and handle == "endpoint_12_3"
+    route, handle, _ = router.match_route("/app12/model30")
+    assert route is None and handle is None
+    route, handle, _ = router.match_route("/app1/model1")
+    assert route == "/app1/model1" and handle == "endpoint_1_1"
+
+
+def test_match_cache(mock_longest_prefix_router):
+    router = mock_longest_prefix_router
+    router.update_routes({"endpoint": EndpointInfo(route="/endpoint", app_name="")})
+
+    for _ in range(3):
+        route, handle, _ = router.match_route("/endpoint/subpath")
+        assert route == "/endpoint" and handle == "endpoint"
+    assert router._match_route_cached.cache_info().hits == 2
+
+    # The cache is invalidated when the routes are updated.
+    router.update_routes(
+        {"endpoint2": EndpointInfo(route="/endpoint/subpath", app_name="")}
+    )
+    route, handle, _ = router.match_route("/endpoint/subpath")
+    assert route == "/endpoint/subpath" and handle == "endpoint2"
+
+
 if __name__ == "__main__":
     import sys
 
@@ -169,6 +169,105 @@ async def test_client_threadsafe(serve_instance):
     await e.wait()
 
 
+@pytest.mark.asyncio
+async def test_delta_updates(serve_instance):
+    host = LongPollHost(coalesce_window_s=0)
+    key = (LongPollNamespace.RUNNING_REPLICAS, "deployment")
+
+    host.notify_changed(key, ["a", "b"])
+    result = await host.listen_for_change({key: -1}, allow_delta=True)
+    first = result[key]
+    assert first.delta is None
+    assert first.object_snapshot == ["a", "b"]
+
+    # A client with a recent snapshot only receives the changes.
+    host.notify_changed(key, ["b", "c"])
+    result = await host.listen_for_change(
+        {key: first.snapshot_id}, allow_delta=True
+    )
+    second = result[key]
+    assert second.object_snapshot is None
+    assert second.delta.base_snapshot_id == first.snapshot_id
+    assert second.delta.added == ["c"]
+    assert second.delta.removed == ["a"]
+    assert sorted(second.delta.apply(first.object_snapshot)) == ["b", "c"]
+
+    # Clients that don't accept deltas or whose snapshot is too old receive
+    # the full snapshot.
+    result = await host.listen_for_change({key: first.snapshot_id})
+    assert result[key].object_snapshot == ["b", "c"]
+    result = await host.listen_for_change({key: -1}, allow_delta=True)
+    assert result[key].object_snapshot == ["b", "c"]
+
+    # Other namespaces always receive full snapshots.
+    host.notify_changed("key_1", ["a"])
+    result = await host.listen_for_change({"key_1": -1}, allow_delta=True)
+    host.notify_changed("key_1", ["a", "b"])
+    result = await host.listen_for_change(
+        {"key_1": result["key_1"].snapshot_id}, allow_delta=True
+    )
+    assert result["key_1"].object_snapshot == ["a", "b"]
+
+
+class _FakeActorHandle:
+    def __init__(self, actor_id: str):
+        self._actor_id = actor_id
+
+
+@pytest.mark.asyncio
+async def test_delta_updates_changed_fields(serve_instance):
+    host = LongPollHost(coalesce_window_s=0)
+    key = (LongPollNamespace.RUNNING_REPLICAS, "deployment")
+
+    def replica_info(tag: str, node_id: str) -> RunningReplicaInfo:
+        return RunningReplicaInfo(
+            deployment_name="deployment",
+            replica_tag=tag,
+            actor_handle=_FakeActorHandle(tag),
+            max_concurrent_queries=1,
+            node_id=node_id,
+        )
+
+    host.notify_changed(key, [replica_info("a", None), replica_info("b", None)])
+    result = await host.listen_for_change({key: -1}, allow_delta=True)
+    first = result[key]
+
+    # Setting the `node_id` doesn't change the replica identity, the changed
+    # replicas are still sent to the client.
+    host.notify_changed(key, [replica_info("a", "n1"), replica_info("b", "n2")])
+    result = await host.listen_for_change(
+        {key: first.snapshot_id}, allow_delta=True
+    )
+    second = result[key]
+    assert len(second.delta.added) == 2
+    assert len(second.delta.removed) == 2
+    snapshot = second.delta.apply(first.object_snapshot)
+    assert sorted(r.replica_tag for r in snapshot) == ["a", "b"]
+    assert sorted(r.node_id for r in snapshot) == ["n1", "n2"]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_updates(serve_instance):
+    host = LongPollHost(coalesce_window_s=0.5)
+    host.notify_changed("key_1", 0)
+    result = await host.listen_for_change({"key_1": -1})
+    snapshot_id = result["key_1"].snapshot_id
+
+    listen_task = get_or_create_event_loop().create_task(
+        host.listen_for_change({"key_1": snapshot_id})
+    )
+    await asyncio.sleep(0.1)
+    for i in range(1, 4):
+        host.notify_changed("key_1", i)
+    await asyncio.sleep(0.1)
+    assert not listen_task.done()
+
+    # The listener is woken up once, with the latest snapshot.
+    result = await listen_task
+    assert result["key_1"].object_snapshot == 3
+    assert result["key_1"].snapshot_id == snapshot_id + 3
+
+
 def test_listen_for_change_java(serve_instance):
     host = ray.remote(LongPollHost).remote()
     ray.get(host.notify_changed.remote("key_1", 999))
@@ -0,0 +1,98 @@
+import asyncio
+
+import pytest
+import requests
+
+import ray
+from ray import serve
+from ray.serve._private.long_poll import LongPollNamespace
+from ray.serve.multiplex import _ModelMultiplexWrapper
+
+
+@pytest.mark.asyncio
+async def test_model_multiplex_wrapper(serve_instance):
+    num_loads = {}
+
+    async def load_model(model_id: str):
+        num_loads[model_id] = num_loads.get(model_id, 0) + 1
+        await asyncio.sleep(0.1)
+        return f"model_{model_id}"
+
+    wrapper = _ModelMultiplexWrapper(load_model, max_num_models_per_replica=2)
+
+    # Concurrent requests for the same model share a single load.
+    results = await asyncio.gather(*[wrapper.load_model("1") for _ in range(3)])
+    assert results == ["model_1"] * 3
+    assert num_loads == {"1": 1}
+
+    assert await wrapper.load_model("2") == "model_2"
+    assert list(wrapper.models) == ["1", "2"]
+
+    # The least recently used model is unloaded.
+    assert await wrapper.load_model("1") == "model_1"
+    assert await wrapper.load_model("3") == "model_3"
+    assert list(wrapper.models) == ["1", "3"]
+    assert num_loads == {"1": 1, "2": 1, "3": 1}
+
+    assert await wrapper.load_model("2") == "model_2"
+    assert list(wrapper.models) == ["3", "2"]
+    assert num_loads == {"1": 1, "2": 2, "3": 1}
+
+    with pytest.raises(ValueError):
+        await wrapper.load_model("")
+
+
+def test_multiplexed_validation():
+    with pytest.raises(TypeError):
+
+        @serve.multiplexed
+        def sync_load_model(model_id: str):
+            pass
+
+    with pytest.raises(ValueError):
+
+        @serve.multiplexed(max_num_models_per_replica=0)
+        async def load_model(model_id: str):
+            pass
+
+
+def test_multiplexed_deployment(serve_instance):
+    @serve.deployment(num_replicas=2)
+    class Model:
+        @serve.multiplexed(max_num_models_per_replica=2)
+        async def get_model(self, model_id: str):
+            return (model_id, serve.get_replica_context().replica_tag)
+
+        async def __call__(self, *args):
+            return await self.get_model(serve.get_multiplexed_model_id())
+
+    handle = serve.run(Model.bind())
+
+    model_id, replica_tag = ray.get(
+        handle.options(multiplexed_model_id="1").remote()
+    )
+    assert model_id == "1"
+
+    # Requests for the model are sent to the replica that has it loaded.
+    for _ in range(10):
+        assert ray.get(handle.options(multiplexed_model_id="1").remote()) == (
+            "1",
+            replica_tag,
+        )
+
+    # The replica reports the loaded models to the controller.
+    key = (LongPollNamespace.MULTIPLEXED_MODEL_IDS, handle.deployment_name)
+    updates = ray.get(serve_instance._controller.listen_for_change.remote({key: -1}))
+    assert updates[key].object_snapshot == {replica_tag: ["1"]}
+
+    # The model ID can also be passed through an HTTP header.
+    resp = requests.get(
+        "http://localhost:8000/", headers={"serve_multiplexed_model_id": "2"}
+    )
+    assert resp.json()[0] == "2"
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main(["-v", "-s", __file__]))
@@ -4,13 +4,22 @@ controller or the actual replica wrapper, use mock if necessary.
 """
 import asyncio
 import copy
+import time
 
 import pytest
 
 import ray
 from ray._private.utils import get_or_create_event_loop
 from ray.serve._private.common import RunningReplicaInfo
-from ray.serve._private.router import Query, ReplicaSet, RequestMetadata
+from ray.serve._private.router import (
+    PowerOfTwoChoicesRoutingPolicy,
+    Query,
+    ReplicaSet,
+    RequestMetadata,
+    RoundRobinRoutingPolicy,
+)
+from ray.serve.config import DeploymentConfig
+from ray.serve.exceptions import BackPressureError, RequestDeadlineExceededError
 from ray._private.test_utils import SignalActor
 
 pytestmark = pytest.mark.asyncio
@@ -156,6 +165,274 @@ async def test_replica_set(ray_instance):
     assert num_queries_set == {2, 1}
 
 
+async def test_replica_set_completion_tracking(ray_instance):
+    @ray.remote(num_cpus=0)
+    class MockWorker:
+        @ray.method(num_returns=2)
+        async def handle_request(self, request):
+            return b"", "DONE"
+
+    @ray.remote(num_cpus=0)
+    class DeadWorker:
+        @ray.method(num_returns=2)
+        async def handle_request(self, request):
+            ray.actor.exit_actor()
+
+    rs = ReplicaSet("my_deployment", get_or_create_event_loop())
+    replica = RunningReplicaInfo(
+        deployment_name="my_deployment",
+        replica_tag="0",
+        actor_handle=MockWorker.remote(),
+        max_concurrent_queries=10,
+    )
+    rs.update_running_replicas([replica])
+
+    query = Query([], {}, RequestMetadata("request-id", "endpoint"))
+    refs = [await rs.assign_replica(query) for _ in range(5)]
+    assert await asyncio.gather(*refs) == ["DONE"] * 5
+
+    # The in-flight counter is decremented by completion callbacks, without
+    # polling the in-flight refs.
+    while len(rs.in_flight_queries[replica]) > 0:
+        await asyncio.sleep(0.1)
+    assert len(rs._query_start_times) == 0
+
+    # A replica whose actor died is removed from the replica set.
+    dead_replica = RunningReplicaInfo(
+        deployment_name="my_deployment",
+        replica_tag="1",
+        actor_handle=DeadWorker.remote(),
+        max_concurrent_queries=10,
+    )
+    rs.update_running_replicas([dead_replica])
+    await rs.assign_replica(query)
+    while dead_replica in rs.in_flight_queries:
+        await asyncio.sleep(0.1)
+
+
+class FakeActorHandle:
+    def __init__(self, actor_id):
+        self._actor_id = actor_id
+
+
+def make_replica(tag, max_concurrent_queries=10, node_id=None):
+    return RunningReplicaInfo(
+        deployment_name="my_deployment",
+        replica_tag=tag,
+        actor_handle=FakeActorHandle(tag),
+        max_concurrent_queries=max_concurrent_queries,
+        node_id=node_id,
+    )
+
+
+async def test_round_robin_routing_policy():
+    policy = RoundRobinRoutingPolicy()
+    replicas = [make_replica(str(i), max_concurrent_queries=1) for i in range(3)]
+    query = Query([], {}, RequestMetadata("request-id", "endpoint"))
+    assert policy.choose_replica(query, lambda r: 0) is None
+
+    policy.update_replicas(replicas)
+    chosen = [policy.choose_replica(query, lambda r: 0) for _ in range(3)]
+    assert set(chosen) == set(replicas)
+
+    # Replicas at capacity are skipped.
+    in_flight = {replicas[0]: 1, replicas[1]: 1, replicas[2]: 0}
+    for _ in range(3):
+        assert policy.choose_replica(query, in_flight.get) == replicas[2]
+    in_flight[replicas[2]] = 1
+    assert policy.choose_replica(query, in_flight.get) is None
+
+
+async def test_power_of_two_choices_routing_policy():
+    policy = PowerOfTwoChoicesRoutingPolicy()
+    query = Query([], {}, RequestMetadata("request-id", "endpoint"))
+    assert policy.choose_replica(query, lambda r: 0) is None
+
+    # With two replicas, the one with fewer in-flight queries is chosen.
+    replicas = [make_replica(str(i)) for i in range(2)]
+    policy.update_replicas(replicas)
+    in_flight = {replicas[0]: 5, replicas[1]: 2}
+    for _ in range(10):
+        assert policy.choose_replica(query, in_flight.get) == replicas[1]
+
+    # Slow replicas are avoided even if they have fewer in-flight queries.
+    policy.on_query_completed(replicas[1], 10.0)
+    policy.on_query_completed(replicas[0], 0.1)
+    for _ in range(10):
+        assert policy.choose_replica(query, in_flight.get) == replicas[0]
+
+    # Replicas at capacity are never chosen.
+    replicas = [make_replica(str(i), max_concurrent_queries=1) for i in range(10)]
+    policy.update_replicas(replicas)
+    in_flight = {r: 1 for r in replicas}
+    in_flight[replicas[7]] = 0
+    for _ in range(10):
+        assert policy.choose_replica(query, in_flight.get) == replicas[7]
+    in_flight[replicas[7]] = 1
+    assert policy.choose_replica(query, in_flight.get) is None
+
+
+async def test_power_of_two_choices_routing_policy_locality():
+    policy = PowerOfTwoChoicesRoutingPolicy(self_node_id="local")
+    query = Query([], {}, RequestMetadata("request-id", "endpoint"))
+    local = make_replica("local", max_concurrent_queries=1, node_id="local")
+    remote = [
+        make_replica(str(i), max_concurrent_queries=1, node_id="remote")
+        for i in range(5)
+    ]
+    policy.update_replicas(remote + [local])
+    in_flight = {r: 0 for r in remote + [local]}
+    for _ in range(10):
+        assert policy.choose_replica(query, in_flight.get) == local
+
+    # Fall back to remote replicas when the local replicas are at capacity.
+    in_flight[local] = 1
+    for _ in range(10):
+        assert policy.choose_replica(query, in_flight.get) in remote
+
+
+async def test_replica_set_multiplexed_model_preference(ray_instance):
+    rs = ReplicaSet("my_deployment", get_or_create_event_loop())
+    replicas = [make_replica(str(i), max_concurrent_queries=1) for i in range(3)]
+    rs.update_running_replicas(replicas)
+    assert rs._choose_replica_with_model("m1") is None
+
+    rs.update_multiplexed_model_ids({"0": ["m1", "m2"], "1": ["m1"], "3": ["m1"]})
+    # Replica "3" isn't in the replica set.
+    assert rs._choose_replica_with_model("m1") in replicas[:2]
+    assert rs._choose_replica_with_model("m2") == replicas[0]
+
+    # Replicas with the model loaded but at capacity are skipped.
+    rs.in_flight_queries[replicas[0]].add("ref")
+    assert rs._choose_replica_with_model("m1") == replicas[1]
+    assert rs._choose_replica_with_model("m2") is None
+
+    # Assignments are recorded until the replica reports its models again.
+    rs._record_model_assignment(replicas[2], "m2")
+    assert rs._choose_replica_with_model("m2") == replicas[2]
+    rs.update_multiplexed_model_ids({"0": ["m2"]})
+    assert rs._choose_replica_with_model("m2") is None
+
+
+async def test_replica_set_admission_control(ray_instance):
+    rs = ReplicaSet("my_deployment", get_or_create_event_loop())
+    rs.update_running_replicas([make_replica("0")])
+    rs.update_deployment_config(DeploymentConfig(max_queued_requests=2))
+    assert rs.max_queued_requests == 2
+
+    # Replace the replica with a single slot that's freed by the test.
+    free_slots = 1
+    assigned = []
+
+    def try_assign_replica(query):
+        nonlocal free_slots
+        if free_slots == 0:
+            return None
+        free_slots -= 1
+        assigned.append(query.metadata.request_id)
+        return query.metadata.request_id
+
+    def free_slot():
+        nonlocal free_slots
+        free_slots += 1
+        rs.config_updated_event.set()
+
+    rs._try_assign_replica = try_assign_replica
+
+    def make_query(request_id, priority=0, deadline_s=None):
+        return Query(
+            [],
+            {},
+            RequestMetadata(
+                request_id, "endpoint", priority=priority, deadline_s=deadline_s
+            ),
+        )
+
+    assert await rs.assign_replica(make_query("first")) == "first"
+
+    # Queries wait for a free replica until the queue is full.
+    low = asyncio.ensure_future(rs.assign_replica(make_query("low", priority=0)))
+    await asyncio.sleep(0.01)
+    high = asyncio.ensure_future(rs.assign_replica(make_query("high", priority=1)))
+    await asyncio.sleep(0.01)
+    assert not low.done() and not high.done()
+    with pytest.raises(BackPressureError):
+        await rs.assign_replica(make_query("rejected", priority=2))
+
+    # Queries with a higher priority get a free replica first.
+    free_slot()
+    assert await high == "high"
+    await asyncio.sleep(0.01)
+    assert not low.done()
+    free_slot()
+    assert await low == "low"
+    assert assigned == ["first", "high", "low"]
+
+    # Queries are dropped once their deadline passes.
+    with pytest.raises(RequestDeadlineExceededError):
+        await rs.assign_replica(make_query("waits", deadline_s=time.time() + 0.1))
+    free_slot()
+    with pytest.raises(RequestDeadlineExceededError):
+        await rs.assign_replica(make_query("expired", deadline_s=time.time() - 1))
+    assert assigned == ["first", "high", "low"]
+    assert rs.num_queued_queries == 0
+
+
+async def test_replica_set_hold_in_flight_slot(ray_instance):
+    rs = ReplicaSet("my_deployment", get_or_create_event_loop())
+    replica = make_replica("0", max_concurrent_queries=1)
+    rs.update_running_replicas([replica])
+
+    # A streaming response keeps the replica busy after its request returned.
+    release = rs.hold_in_flight_slot("0")
+    assert len(rs.in_flight_queries[replica]) == 1
+    query = Query([], {}, RequestMetadata("request-id", "endpoint"))
+    assert rs._try_assign_replica(query) is None
+
+    release()
+    assert len(rs.in_flight_queries[replica]) == 0
+    assert rs.config_updated_event.is_set()
+    # Releasing the slot again is a no-op.
+    release()
+    assert len(rs.in_flight_queries[replica]) == 0
+
+    # Slots on replicas that aren't known aren't held.
+    rs.hold_in_flight_slot("unknown")()
+
+
+async def test_replica_set_update_max_queued_requests(ray_instance):
+    rs = ReplicaSet("my_deployment", get_or_create_event_loop())
+    replicas = [make_replica("0"), make_replica("1")]
+    rs.update_running_replicas(replicas)
+    rs.update_deployment_config(DeploymentConfig(max_queued_requests=2))
+    rs._try_assign_replica = lambda query: None
+
+    def make_query(request_id):
+        return Query([], {}, RequestMetadata(request_id, "endpoint"))
+
+    waiting = [
+        asyncio.ensure_future(rs.assign_replica(make_query(str(i)))) for i in range(2)
+    ]
+    await asyncio.sleep(0.01)
+    assert not any(w.done() for w in waiting)
+
+    # Lowering the limit on a live replica set applies to new queries, and
+    # keeps the in-flight queries tracked for the replicas.
+    rs.in_flight_queries[replicas[0]].add("ref")
+    rs.update_deployment_config(DeploymentConfig(max_queued_requests=1))
+    assert rs.max_queued_requests == 1
+    assert rs.in_flight_queries[replicas[0]] == {"ref"}
+    with pytest.raises(BackPressureError):
+        await rs.assign_replica(make_query("rejected"))
+
+    # The limit is kept if there are no running replicas.
+    rs.update_running_replicas([])
+    assert rs.max_queued_requests == 1
+
+    for w in waiting:
+        w.cancel()
+
+
 if __name__ == "__main__":
     import sys
 
@@ -3,10 +3,12 @@ import logging
 import os
 import tempfile
 import traceback
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple, Union
 from numbers import Number
 from pathlib import Path
 
+import numpy as np
+
 from ray.air._internal.remote_storage import (
     download_from_uri,
     is_directory,
@@ -17,8 +19,7 @@ from ray.air._internal.uri_utils import _join_path_or_uri, URI
 from ray.air.checkpoint import Checkpoint
 from ray.tune.syncer import SyncConfig
 from ray.tune.utils import flatten_dict
-from ray.tune.utils.serialization import TuneFunctionDecoder
-from ray.tune.utils.util import is_nan_or_inf, is_nan
+from ray.tune.utils.util import is_nan
 from ray.util import log_once
 
 try:
@@ -34,11 +35,17 @@ from ray.tune.result import (
     EXPR_PROGRESS_FILE,
     EXPR_RESULT_FILE,
     EXPR_PARAM_FILE,
+    EXPR_RESULT_PARTS_DIR,
     CONFIG_PREFIX,
     TRAINING_ITERATION,
 )
 from ray.tune.experiment import Trial
+from ray.tune.execution.experiment_state import (
+    _get_experiment_journal_path,
+    _load_experiment_state,
+)
 from ray.tune.execution.trial_runner import _find_newest_experiment_checkpoint
+from ray.tune.logger.parquet import _read_result_parts
 from ray.tune.trainable.util import TrainableUtil
 from ray.tune.utils.util import unflattened_lookup
 
@@ -48,6 +55,87 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_FILE_TYPE = "csv"
 
+# Scopes that are stored in `Trial.metric_analysis`.
+_METRIC_ANALYSIS_SCOPES = ["min", "max", "avg", "last", "last-5-avg", "last-10-avg"]
+
+
+class _ResultPartsDataFrames(Mapping):
+    """Maps trial directories to the results logged by ``ParquetLoggerCallback``.
+
+    The results of all trials are read in a single pass on first access.
+    """
+
+    def __init__(self, experiment_paths: List[str], trial_paths: Dict[str, str]):
+        self._experiment_paths = experiment_paths
+        # Map trial ID -> trial directory.
+        self._trial_paths = trial_paths
+        self._dataframes: Optional[Dict[str, DataFrame]] = None
+
+    def _load(self) -> Dict[str, DataFrame]:
+        if self._dataframes is None:
+            self._dataframes = {}
+            df = _read_result_parts(self._experiment_paths)
+            if df is not None:
+                for trial_id, trial_df in df.groupby("trial_id", sort=False):
+                    if trial_id in self._trial_paths:
+                        self._dataframes[
+                            self._trial_paths[trial_id]
+                        ] = trial_df.dropna(axis=1, how="all").reset_index(drop=True)
+        return self._dataframes
+
+    def __getitem__(self, path: str) -> DataFrame:
+        return self._load()[path]
+
+    def __setitem__(self, path: str, df: DataFrame):
+        self._load()[path] = df
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._load())
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+
+class _ResultsTable:
+    """The results of all trials in a single dataframe.
+
+    The table is indexed by (trial dir, row in the trial dataframe). It is
+    built on first use and extended when dataframes of new trials show up,
+    so that queries over all trials are vectorized pandas operations instead
+    of loops over the trial dataframes.
+    """
+
+    def __init__(self):
+        # Map trial dir -> dataframe that is part of the table.
+        self._dataframes: Dict[str, DataFrame] = {}
+        self._table: Optional[DataFrame] = None
+
+    def get(self, trial_dataframes: Mapping[str, DataFrame]) -> Optional[DataFrame]:
+        if any(
+            trial_dataframes.get(path) is not df
+            for path, df in self._dataframes.items()
+        ):
+            # Dataframes were replaced or removed, e.g. by `set_filetype()`.
+            self._dataframes = {}
+            self._table = None
+
+        new_dataframes = {
+            path: df
+            for path, df in trial_dataframes.items()
+            if path not in self._dataframes
+        }
+        if new_dataframes:
+            tables = [self._table] if self._table is not None else []
+            tables.append(
+                pd.concat(
+                    [df.reset_index(drop=True) for df in new_dataframes.values()],
+                    keys=list(new_dataframes),
+                )
+            )
+            self._table = pd.concat(tables) if len(tables) > 1 else tables[0]
+            self._dataframes.update(new_dataframes)
+        return self._table
+
 
 @PublicAPI(stability="beta")
 class ExperimentAnalysis:
@@ -116,6 +204,12 @@ class ExperimentAnalysis:
 
         self._configs = {}
         self._trial_dataframes = {}
+        self._results_table = _ResultsTable()
+        # Map metric -> (number of trials included, trial indices, scores by
+        # scope). See `_get_metric_scores()`.
+        self._metric_scores: Dict[str, Tuple[int, np.ndarray, Dict]] = {}
+        # The trials included in `self._metric_scores`.
+        self._metric_scores_trials: List[Trial] = []
 
         self.default_metric = default_metric
         if default_mode and default_mode not in ["min", "max"]:
@@ -201,9 +295,8 @@ class ExperimentAnalysis:
     def _load_checkpoints_from_latest(self, latest_checkpoint: List[str]) -> None:
         # Collect all checkpoints and their directory paths.
         for path in latest_checkpoint:
-            with open(path) as f:
-                experiment_state = json.load(f, cls=TuneFunctionDecoder)
-                self._experiment_states.append(experiment_state)
+            experiment_state = _load_experiment_state(path)
+            self._experiment_states.append(experiment_state)
 
             if "checkpoints" not in experiment_state:
                 raise TuneError("Experiment state invalid; no checkpoints found.")
@@ -249,6 +342,25 @@ class ExperimentAnalysis:
         except FileNotFoundError:
             return None
 
+        # The journal holds the trial states that changed since the snapshot.
+        try:
+            download_from_uri(
+                _get_experiment_journal_path(experiment_checkpoint_path),
+                _get_experiment_journal_path(local_path),
+            )
+        except FileNotFoundError:
+            pass
+
+        # Results logged by the `ParquetLoggerCallback`.
+        remote_parts_dir = str(
+            URI(experiment_checkpoint_path).parent / EXPR_RESULT_PARTS_DIR
+        )
+        if list_at_uri(remote_parts_dir):
+            download_from_uri(
+                remote_parts_dir,
+                os.path.join(os.path.dirname(local_path), EXPR_RESULT_PARTS_DIR),
+            )
+
         return local_path
 
     def _get_latest_checkpoint_from_dir(
@@ -502,6 +614,45 @@ class ExperimentAnalysis:
         """
         return self._trial_dataframes
 
+    def fetch_results(self, columns: Optional[List[str]] = None) -> DataFrame:
+        """Returns the reported results of all trials as a single dataframe.
+
+        If the results were logged with the ``ParquetLoggerCallback``, only
+        the requested columns are read from disk, which is considerably
+        faster for experiments with many trials or metrics.
+
+        Args:
+            columns: Columns to return, e.g. ``["loss", "training_iteration"]``.
+                The ``trial_id`` column is always included. If None, all
+                columns are returned.
+
+        Returns:
+            pd.DataFrame: One row per reported result.
+        """
+        if not pd:
+            raise ValueError(
+                "`fetch_results` requires pandas. Install with `pip install pandas`."
+            )
+        if columns is not None:
+            columns = ["trial_id"] + [c for c in columns if c != "trial_id"]
+
+        if self._file_type == "parquet":
+            df = _read_result_parts(self._get_experiment_paths(), columns=columns)
+            if df is None:
+                return pd.DataFrame(columns=columns)
+            return df
+
+        dataframes = [
+            df if "trial_id" in df else df.assign(trial_id=None)
+            for df in self.trial_dataframes.values()
+        ]
+        if not dataframes:
+            return pd.DataFrame(columns=columns)
+        df = pd.concat(dataframes, ignore_index=True)
+        if columns is not None:
+            df = df[[c for c in columns if c in df]]
+        return df
+
     def dataframe(
         self, metric: Optional[str] = None, mode: Optional[str] = None
     ) -> DataFrame:
@@ -735,7 +886,52 @@ class ExperimentAnalysis:
 
         metric = self._validate_metric(metric)
         mode = self._validate_mode(mode)
+        self._validate_scope(metric, scope)
+        best_trials = self._get_ranked_trials(
+            metric, mode, scope, filter_nan_and_inf, limit=1
+        )
+        if not best_trials:
+            logger.warning(
+                "Could not find best trial. Did you pass the correct `metric` "
+                "parameter?"
+            )
+            return None
+        return best_trials[0]
+
+    def get_best_trials(
+        self,
+        k: int,
+        metric: Optional[str] = None,
+        mode: Optional[str] = None,
+        scope: str = "last",
+        filter_nan_and_inf: bool = True,
+    ) -> List[Trial]:
+        """Retrieve the ``k`` best trial objects, best first.
+
+        Trials are compared in the same way as in ``get_best_trial()``.
+
+        Args:
+            k: Number of trials to return.
+            metric: Key for trial info to order on. Defaults to
+                ``self.default_metric``.
+            mode: One of [min, max]. Defaults to ``self.default_mode``.
+            scope: One of [all, last, avg, last-5-avg, last-10-avg].
+                See ``get_best_trial()``.
+            filter_nan_and_inf: If True (default), NaN or infinite
+                values are disregarded and these trials are never returned.
+
+        Returns:
+            Up to ``k`` trials. Trials that didn't report the metric are
+                never returned.
+        """
+        metric = self._validate_metric(metric)
+        mode = self._validate_mode(mode)
+        self._validate_scope(metric, scope)
+        return self._get_ranked_trials(
+            metric, mode, scope, filter_nan_and_inf, limit=k
+        )
 
+    def _validate_scope(self, metric: str, scope: str):
         if scope not in ["all", "last", "avg", "last-5-avg", "last-10-avg"]:
             raise ValueError(
                 "ExperimentAnalysis: attempting to get best trial for "
@@ -746,39 +942,70 @@ class ExperimentAnalysis:
                     metric, scope
                 )
             )
-        best_trial = None
-        best_metric_score = None
-
-        for trial in self.trials:
-            if metric not in trial.metric_analysis:
-                continue
-
-            if scope in ["last", "avg", "last-5-avg", "last-10-avg"]:
-                metric_score = trial.metric_analysis[metric][scope]
-            else:
-                metric_score = trial.metric_analysis[metric][mode]
 
-            if filter_nan_and_inf and is_nan_or_inf(metric_score):
-                continue
+    def _get_metric_scores(self, metric: str) -> Tuple[np.ndarray, Dict]:
+        """Returns the scores of all trials that reported ``metric``.
 
-            if best_metric_score is None:
-                best_metric_score = metric_score
-                best_trial = trial
-                continue
-
-            if (mode == "max") and (best_metric_score < metric_score):
-                best_metric_score = metric_score
-                best_trial = trial
-            elif (mode == "min") and (best_metric_score > metric_score):
-                best_metric_score = metric_score
-                best_trial = trial
+        Returns:
+            The indices of the trials in ``self.trials`` and a dict mapping
+            each scope in ``Trial.metric_analysis`` to an array of scores.
 
-        if not best_trial:
-            logger.warning(
-                "Could not find best trial. Did you pass the correct `metric` "
-                "parameter?"
+        The scores are cached. When trials are appended to ``self.trials``,
+        only the new trials are added to the cache. The results of the trials
+        are expected to be final, i.e. not to change after they were cached.
+        """
+        num_cached = len(self._metric_scores_trials)
+        if self.trials[:num_cached] != self._metric_scores_trials:
+            self._metric_scores = {}
+            self._metric_scores_trials = []
+
+        if metric not in self._metric_scores:
+            self._metric_scores[metric] = (
+                0,
+                np.array([], dtype=int),
+                {scope: np.array([]) for scope in _METRIC_ANALYSIS_SCOPES},
             )
-        return best_trial
+        num_trials, indices, scores = self._metric_scores[metric]
+        if num_trials < len(self.trials):
+            new_indices = []
+            new_scores = {scope: [] for scope in _METRIC_ANALYSIS_SCOPES}
+            for i in range(num_trials, len(self.trials)):
+                analysis = self.trials[i].metric_analysis.get(metric)
+                if analysis is None:
+                    continue
+                new_indices.append(i)
+                for scope, values in new_scores.items():
+                    values.append(analysis.get(scope, np.nan))
+
+            indices = np.concatenate([indices, np.array(new_indices, dtype=int)])
+            scores = {
+                scope: np.concatenate([scores[scope], np.array(values, dtype=float)])
+                for scope, values in new_scores.items()
+            }
+            self._metric_scores[metric] = (len(self.trials), indices, scores)
+            if len(self.trials) > num_cached:
+                self._metric_scores_trials = list(self.trials)
+        return indices, scores
+
+    def _get_ranked_trials(
+        self,
+        metric: str,
+        mode: str,
+        scope: str,
+        filter_nan_and_inf: bool,
+        limit: int,
+    ) -> List[Trial]:
+        indices, scores = self._get_metric_scores(metric)
+        scores = scores[mode if scope == "all" else scope]
+
+        if filter_nan_and_inf:
+            finite = np.isfinite(scores)
+            indices, scores = indices[finite], scores[finite]
+
+        # A stable sort keeps the first trial among trials with equal scores.
+        # NaN scores are sorted last.
+        order = np.argsort(-scores if mode == "max" else scores, kind="stable")
+        return [self.trials[i] for i in indices[order[:limit]]]
 
     def get_best_config(
         self,
@@ -873,6 +1100,17 @@ class ExperimentAnalysis:
         Returns:
             A dictionary containing "trial dir" to Dataframe.
         """
+        if self._file_type == "parquet":
+            # This loads the trials from the experiment state if needed.
+            paths = self._get_trial_paths()
+            trial_paths = {
+                trial.trial_id: path for trial, path in zip(self.trials, paths)
+            }
+            self._trial_dataframes = _ResultPartsDataFrames(
+                self._get_experiment_paths(), trial_paths
+            )
+            return self.trial_dataframes
+
         fail_count = 0
         failed_paths = []
         force_dtype = {"trial_id": str}  # Never convert trial_id to float.
@@ -934,10 +1172,13 @@ class ExperimentAnalysis:
         """Overrides the existing file type.
 
         Args:
-            file_type: Read results from json or csv files. Has to be one
-                of [None, json, csv]. Defaults to csv.
+            file_type: Read results from json, csv or parquet files. Has to be
+                one of [None, json, csv, parquet]. Defaults to parquet if the
+                results were logged with the ``ParquetLoggerCallback``, and to
+                csv otherwise.
         """
         self._file_type = self._validate_filetype(file_type)
+        self._trial_dataframes = {}
         self.fetch_trial_dataframes()
         return True
 
@@ -993,9 +1234,19 @@ class ExperimentAnalysis:
             raise TuneError("No trials found.")
         return _trial_paths
 
+    def _get_experiment_paths(self) -> List[str]:
+        return sorted({str(path) for _, path in self._checkpoints_and_paths})
+
     def _validate_filetype(self, file_type: Optional[str] = None):
-        if file_type not in {None, "json", "csv"}:
-            raise ValueError("`file_type` has to be None or one of [json, csv].")
+        if file_type not in {None, "json", "csv", "parquet"}:
+            raise ValueError(
+                "`file_type` has to be None or one of [json, csv, parquet]."
+            )
+        if file_type is None and any(
+            os.path.isdir(os.path.join(path, EXPR_RESULT_PARTS_DIR))
+            for path in self._get_experiment_paths()
+        ):
+            return "parquet"
         return file_type or DEFAULT_FILE_TYPE
 
     def _validate_metric(self, metric: str) -> str:
@@ -1021,23 +1272,25 @@ class ExperimentAnalysis:
     ) -> Dict[str, Any]:
         assert mode is None or mode in ["max", "min"]
         assert not mode or metric
-        rows = {}
-        for path, df in self.trial_dataframes.items():
-            if mode == "max":
-                idx = df[metric].idxmax()
-            elif mode == "min":
-                idx = df[metric].idxmin()
-            else:
-                idx = -1
-            try:
-                rows[path] = df.iloc[idx].to_dict()
-            except TypeError:
-                # idx is nan
+        table = self._results_table.get(self.trial_dataframes)
+        if table is None:
+            return {}
+
+        if mode:
+            scores = table[metric]
+            scores = scores[scores.notna()].groupby(level=0, sort=False)
+            idx = scores.idxmax() if mode == "max" else scores.idxmin()
+            for path in table.index.unique(level=0).difference(idx.index):
                 logger.warning(
                     "Warning: Non-numerical value(s) encountered for {}".format(path)
                 )
+            selected = table.loc[list(idx)]
+        else:
+            selected = table.groupby(level=0, sort=False).tail(1)
 
-        return rows
+        return dict(
+            zip(selected.index.get_level_values(0), selected.to_dict("records"))
+        )
 
     def __getstate__(self) -> Dict[str, Any]:
         """Ensure that trials are marked as stubs when pickling,
@@ -1054,4 +1307,8 @@ class ExperimentAnalysis:
             return trial_copy
 
         state["trials"] = [make_stub_if_needed(t) for t in state["trials"]]
+        # Caches are rebuilt on demand.
+        state["_results_table"] = _ResultsTable()
+        state["_metric_scores"] = {}
+        state["_metric_scores_trials"] = []
         return state
@@ -225,6 +225,30 @@ class Callback(metaclass=_CallbackMeta):
         """
         pass
 
+    def on_trial_results(
+        self,
+        iteration: int,
+        trials: List["Trial"],
+        trial_results: List[Tuple["Trial", Dict]],
+        **info,
+    ):
+        """Called after receiving results from many trials at once.
+
+        By default, this calls ``on_trial_result`` for each result, in the
+        order they were reported. Callbacks can override this to process
+        many results more efficiently.
+
+        Arguments:
+            iteration: Number of iterations of the tuning loop.
+            trials: List of trials.
+            trial_results: Pairs of a trial and a result that it sent.
+            **info: Kwargs dict for forward compatibility.
+        """
+        for trial, result in trial_results:
+            self.on_trial_result(
+                iteration=iteration, trials=trials, trial=trial, result=result, **info
+            )
+
     def on_trial_complete(
         self, iteration: int, trials: List["Trial"], trial: "Trial", **info
     ):
@@ -391,6 +415,10 @@ class CallbackList(Callback):
         for callback in self._callbacks:
             callback.on_trial_result(**info)
 
+    def on_trial_results(self, **info):
+        for callback in self._callbacks:
+            callback.on_trial_results(**info)
+
     def on_trial_complete(self, **info):
         for callback in self._callbacks:
             callback.on_trial_complete(**info)
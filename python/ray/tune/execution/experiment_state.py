@@ -1,11 +1,13 @@
 from collections import Counter
 from dataclasses import dataclass
-from typing import Callable, Dict, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 
 import click
+import json
 import logging
 import os
 import time
+import uuid
 import warnings
 
 from ray.air._internal.remote_storage import list_at_uri
@@ -15,6 +17,7 @@ from ray.tune import TuneError
 from ray.tune.experiment import Trial
 from ray.tune.impl.out_of_band_serialize_dataset import out_of_band_serialize_dataset
 from ray.tune.syncer import SyncConfig, get_node_to_storage_syncer
+from ray.tune.utils.serialization import TuneFunctionDecoder, TuneFunctionEncoder
 
 logger = logging.getLogger(__name__)
 
@@ -95,6 +98,179 @@ def _find_newest_experiment_checkpoint(experiment_dir: str) -> Optional[str]:
     return max(candidate_paths)
 
 
+def _get_experiment_journal_path(experiment_state_path: str) -> str:
+    """Returns the path of the journal belonging to an experiment state file.
+
+    E.g. ``experiment_state-<session>.json`` -> ``experiment_state-<session>.journal``
+    """
+    if experiment_state_path.endswith(".json"):
+        experiment_state_path = experiment_state_path[: -len(".json")]
+    return experiment_state_path + ".journal"
+
+
+def _load_experiment_state(experiment_state_path: str) -> Dict[str, Any]:
+    """Loads an experiment state file and replays its journal, if any.
+
+    Journal records are applied on top of the snapshot in the order they were
+    written. A journal that doesn't belong to the snapshot, e.g. because the
+    driver died while compacting it, is ignored, as is a partially written
+    last record.
+
+    Returns:
+        dict: The experiment state in the snapshot format, with the
+            ``"checkpoints"``, ``"runner_data"`` and ``"stats"`` keys.
+    """
+    with open(experiment_state_path, "r") as f:
+        experiment_state = json.load(f, cls=TuneFunctionDecoder)
+
+    journal_id = experiment_state.get("journal_id")
+    journal_path = _get_experiment_journal_path(experiment_state_path)
+    if journal_id is None or not os.path.exists(journal_path):
+        return experiment_state
+
+    with open(journal_path, "r") as f:
+        header = f.readline()
+        try:
+            if json.loads(header).get("journal_id") != journal_id:
+                return experiment_state
+        except json.JSONDecodeError:
+            return experiment_state
+
+        trial_states = dict(
+            zip(experiment_state["checkpoint_ids"], experiment_state["checkpoints"])
+        )
+        for line in f:
+            try:
+                record = json.loads(line, cls=TuneFunctionDecoder)
+            except json.JSONDecodeError:
+                logger.warning(
+                    f"Ignoring a partially written record at the end of the "
+                    f"experiment journal {journal_path}."
+                )
+                break
+            if "trial_id" in record:
+                trial_states[record["trial_id"]] = record["state"]
+            else:
+                experiment_state["runner_data"] = record["runner_data"]
+                experiment_state["stats"] = record["stats"]
+
+    experiment_state["checkpoint_ids"] = list(trial_states.keys())
+    experiment_state["checkpoints"] = list(trial_states.values())
+    return experiment_state
+
+
+class _ExperimentStateJournal:
+    """Writes the experiment state as a snapshot plus an append-only journal.
+
+    The first save writes a full snapshot in the experiment state file
+    format. Later saves only append the states of the trials that changed
+    since the previous save, and the runner state, to the journal next to the
+    snapshot. Once the journal is larger than the snapshot, it's compacted by
+    writing a new snapshot and starting a new journal.
+
+    Trial states are the JSON strings cached by the trial runner, which are
+    only replaced when a trial changes, so changed trials are found by
+    identity without comparing their contents.
+    """
+
+    def __init__(self):
+        self._experiment_state_path: Optional[str] = None
+        self._snapshot_size_bytes = 0
+        self._journal_size_bytes = 0
+        # Map trial ID -> last trial state written to the snapshot or journal.
+        self._written_trial_states: Dict[str, str] = {}
+
+    def save(
+        self,
+        experiment_state_path: str,
+        trial_states: Dict[str, str],
+        runner_data: Dict[str, Any],
+        stats: Dict[str, Any],
+    ):
+        """Saves the experiment state, appending to the journal if possible.
+
+        Args:
+            experiment_state_path: Path of the experiment state file.
+            trial_states: Map of trial ID to the trial's JSON state.
+            runner_data: State of the trial runner.
+            stats: Experiment stats, e.g. the start time.
+        """
+        if (
+            experiment_state_path != self._experiment_state_path
+            or self._journal_size_bytes >= self._snapshot_size_bytes
+            or not os.path.exists(_get_experiment_journal_path(experiment_state_path))
+        ):
+            self._write_snapshot(
+                experiment_state_path, trial_states, runner_data, stats
+            )
+            return
+
+        changed_trial_states = {
+            trial_id: trial_state
+            for trial_id, trial_state in trial_states.items()
+            if self._written_trial_states.get(trial_id) is not trial_state
+        }
+        records = [
+            json.dumps({"trial_id": trial_id, "state": trial_state})
+            for trial_id, trial_state in changed_trial_states.items()
+        ]
+        records.append(
+            json.dumps(
+                {"runner_data": runner_data, "stats": stats}, cls=TuneFunctionEncoder
+            )
+        )
+        data = "\n".join(records) + "\n"
+        with open(_get_experiment_journal_path(experiment_state_path), "a") as f:
+            f.write(data)
+
+        self._written_trial_states.update(changed_trial_states)
+        self._journal_size_bytes += len(data)
+
+    def _write_snapshot(
+        self,
+        experiment_state_path: str,
+        trial_states: Dict[str, str],
+        runner_data: Dict[str, Any],
+        stats: Dict[str, Any],
+    ):
+        experiment_dir = os.path.dirname(experiment_state_path)
+        journal_id = uuid.uuid4().hex
+        runner_state = {
+            # Trials
+            "checkpoints": list(trial_states.values()),
+            "checkpoint_ids": list(trial_states.keys()),
+            # Experiment data
+            "runner_data": runner_data,
+            # Metadata
+            "stats": stats,
+            # Only a journal starting with the same ID is replayed on top of
+            # this snapshot.
+            "journal_id": journal_id,
+        }
+
+        tmp_file_name = os.path.join(
+            experiment_dir, f".tmp_experiment_state_{uuid.uuid4()}"
+        )
+        with open(tmp_file_name, "w") as f:
+            json.dump(runner_state, f, indent=2, cls=TuneFunctionEncoder)
+        os.replace(tmp_file_name, experiment_state_path)
+
+        # The old journal is only replaced after the new snapshot was written,
+        # and is ignored from then on because its ID doesn't match.
+        tmp_file_name = os.path.join(
+            experiment_dir, f".tmp_experiment_journal_{uuid.uuid4()}"
+        )
+        header = json.dumps({"journal_id": journal_id}) + "\n"
+        with open(tmp_file_name, "w") as f:
+            f.write(header)
+        os.replace(tmp_file_name, _get_experiment_journal_path(experiment_state_path))
+
+        self._experiment_state_path = experiment_state_path
+        self._snapshot_size_bytes = os.path.getsize(experiment_state_path)
+        self._journal_size_bytes = len(header)
+        self._written_trial_states = dict(trial_states)
+
+
 class _ExperimentCheckpointManager:
     """Helper class for managing experiment-level checkpoints.
 
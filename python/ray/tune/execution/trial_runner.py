@@ -1,8 +1,6 @@
-import uuid
 from typing import Any, Dict, List, Optional, Union, Tuple, Set
 
 from datetime import datetime
-import json
 import logging
 import os
 from pathlib import Path
@@ -18,8 +16,10 @@ from ray.exceptions import RayTaskError
 from ray.tune.error import _TuneStopTrialError, _TuneRestoreError
 from ray.tune.execution.experiment_state import (
     _ExperimentCheckpointManager,
+    _ExperimentStateJournal,
     _find_newest_experiment_checkpoint,
     _experiment_checkpoint_exists,
+    _load_experiment_state,
 )
 from ray.tune.utils.util import _split_remote_local_path
 from ray.util import get_node_ip_address
@@ -52,7 +52,6 @@ from ray.tune.experiment import Trial
 from ray.tune.utils import warn_if_slow, flatten_dict
 from ray.tune.utils.log import Verbosity, has_verbosity
 from ray.tune.execution.placement_groups import PlacementGroupFactory
-from ray.tune.utils.serialization import TuneFunctionDecoder, TuneFunctionEncoder
 from ray.tune.web_server import TuneServer
 from ray.util.annotations import DeveloperAPI, Deprecated
 from ray.util.debug import log_once
@@ -197,6 +196,10 @@ class _TuneControllerBase:
 
         self._total_time = 0
         self._iteration = 0
+        # Map phase of the driver loop -> total time spent in it, in seconds.
+        # Sub-phases are recorded as ``phase/sub_phase`` and their time is
+        # also included in the time of their parent phase.
+        self._phase_timings: Dict[str, float] = {}
         self._has_errored = False
         self._fail_fast = fail_fast
         if isinstance(self._fail_fast, str):
@@ -227,6 +230,10 @@ class _TuneControllerBase:
         self._live_trials: Set[Trial] = set()  # Set of non-terminated trials
         self._cached_trial_decisions = {}
         self._queued_trial_decisions = {}
+        # Training results are collected while handling events in a step
+        # and then processed as one batch.
+        self._collect_trial_results = False
+        self._pending_trial_results: List[Tuple[Trial, List[Dict]]] = []
 
         self._stop_queue = []
         self._should_stop_experiment = False  # used by TuneServer
@@ -249,6 +256,7 @@ class _TuneControllerBase:
         self._checkpoint_period = checkpoint_period
         self._trial_checkpoint_config = trial_checkpoint_config or CheckpointConfig()
         self._checkpoint_manager = self._create_checkpoint_manager()
+        self._experiment_state_journal = _ExperimentStateJournal()
 
         self._resumed = False
         resume_config = self._checkpoint_manager.resume(resume_type=resume)
@@ -355,29 +363,17 @@ class _TuneControllerBase:
         """
         experiment_dir = experiment_dir or self._local_experiment_path
 
-        # Get state from trial executor and runner
-        runner_state = {
-            # Trials
-            "checkpoints": list(self._get_trial_checkpoints().values()),
-            # Experiment data
-            "runner_data": self.__getstate__(),
-            # Metadata
-            "stats": {
+        # Get state from trial executor and runner. Only the trials that
+        # changed since the last save are appended to the experiment journal.
+        self._experiment_state_journal.save(
+            os.path.join(experiment_dir, self.experiment_state_file_name),
+            trial_states=self._get_trial_checkpoints(),
+            runner_data=self.__getstate__(),
+            stats={
                 "start_time": self._start_time,
                 "timestamp": self._last_checkpoint_time,
+                "phase_timings": self._phase_timings,
             },
-        }
-
-        tmp_file_name = os.path.join(
-            experiment_dir, f".tmp_experiment_state_{uuid.uuid4()}"
-        )
-
-        with open(tmp_file_name, "w") as f:
-            json.dump(runner_state, f, indent=2, cls=TuneFunctionEncoder)
-
-        os.replace(
-            tmp_file_name,
-            os.path.join(experiment_dir, self.experiment_state_file_name),
         )
 
         self._search_alg.save_to_dir(
@@ -425,8 +421,7 @@ class _TuneControllerBase:
         )
 
         # Actually load data
-        with open(newest_state_path, "r") as f:
-            runner_state = json.load(f, cls=TuneFunctionDecoder)
+        runner_state = _load_experiment_state(newest_state_path)
 
         # 1. Restore trial runner state
         self.__setstate__(runner_state["runner_data"])
@@ -731,103 +726,165 @@ class _TuneControllerBase:
     def _on_training_result(self, trial, result):
         if not isinstance(result, list):
             result = [result]
-        with warn_if_slow("process_trial_result"):
-            self._process_trial_results(trial, result)
-        self._maybe_execute_queued_decision(trial)
+        self._pending_trial_results.append((trial, result))
+        if not self._collect_trial_results:
+            self._process_pending_trial_results()
+
+    def _process_pending_trial_results(self):
+        """Process all results collected since the last call as one batch."""
+        trial_results = self._pending_trial_results
+        if not trial_results:
+            return
+        self._pending_trial_results = []
+        self._process_trial_results(trial_results)
+        for trial, _ in trial_results:
+            self._maybe_execute_queued_decision(trial)
+
+    def _process_trial_results(self, trial_results: List[Tuple[Trial, List[Dict]]]):
+        """Process results of several trials.
 
-    def _process_trial_results(self, trial, results):
-        logger.debug(f"Processing trial results for trial {trial}: {results}")
+        Results are processed in rounds. Each round passes at most one result
+        per trial to the batch hooks of the scheduler, search algorithm and
+        callbacks. Once a trial is stopped, its remaining results are ignored.
+        """
+        logger.debug(f"Processing trial results: {trial_results}")
         with warn_if_slow(
             "process_trial_results",
             message="Processing trial results took {duration:.3f} s, "
             "which may be a performance bottleneck. Please consider "
             "reporting results less frequently to Ray Tune.",
+            timings=self._phase_timings,
         ):
-            for i, result in enumerate(results):
-                with warn_if_slow("process_trial_result"):
-                    decision = self._process_trial_result(trial, result)
-                if decision is None:
-                    # If we didn't get a decision, this means a
-                    # non-training future (e.g. a save) was scheduled.
-                    # We do not allow processing more results then.
-                    if i < len(results) - 1:
-                        if log_once("trial_runner_buffer_checkpoint"):
-                            logger.warning(
-                                f"Trial {trial} has a non-training future "
-                                f"scheduled but {len(results) - i} results "
-                                f"left to process. This means that a "
-                                f"checkpoint was requested, but buffered "
-                                f"training was continued before it was "
-                                f"saved. Consider using non-buffered "
-                                f"training by setting the env variable "
-                                f"`TUNE_RESULT_BUFFER_LENGTH=1`."
-                            )
-                elif decision == TrialScheduler.STOP:
-                    # If the decision is to stop the trial,
-                    # ignore all results that came after that.
-                    break
+            remaining = [(trial, list(results)) for trial, results in trial_results]
+            while remaining:
+                batch = [(trial, results.pop(0)) for trial, results in remaining]
+                decisions = self._process_trial_result_batch(batch)
+                next_remaining = []
+                for (trial, results), decision in zip(remaining, decisions):
+                    if decision == TrialScheduler.STOP or not results:
+                        # If the decision is to stop the trial,
+                        # ignore all results that came after that.
+                        continue
+                    if decision is None and log_once("trial_runner_buffer_checkpoint"):
+                        # If we didn't get a decision, this means a
+                        # non-training future (e.g. a save) was scheduled.
+                        logger.warning(
+                            f"Trial {trial} has a non-training future "
+                            f"scheduled but {len(results) + 1} results "
+                            f"left to process. This means that a "
+                            f"checkpoint was requested, but buffered "
+                            f"training was continued before it was "
+                            f"saved. Consider using non-buffered "
+                            f"training by setting the env variable "
+                            f"`TUNE_RESULT_BUFFER_LENGTH=1`."
+                        )
+                    next_remaining.append((trial, results))
+                remaining = next_remaining
 
-    def _process_trial_result(self, trial, result):
-        result.update(trial_id=trial.trial_id)
-        is_duplicate = RESULT_DUPLICATE in result
-        force_checkpoint = result.get(SHOULD_CHECKPOINT, False)
-        # TrialScheduler and SearchAlgorithm still receive a
-        # notification because there may be special handling for
-        # the `on_trial_complete` hook.
-        if is_duplicate:
-            logger.debug("Trial finished without logging 'done'.")
-            result = trial.last_result
-            result.update(done=True)
-
-        self._total_time += result.get(TIME_THIS_ITER_S, 0)
-
-        flat_result = flatten_dict(result)
-        self._validate_result_metrics(flat_result)
-
-        if self._stopper(trial.trial_id, result) or trial.should_stop(flat_result):
-            decision = TrialScheduler.STOP
-        else:
-            with warn_if_slow("scheduler.on_trial_result"):
-                decision = self._scheduler_alg.on_trial_result(
-                    self._wrapped(), trial, flat_result
+    def _process_trial_result_batch(
+        self, trial_results: List[Tuple[Trial, Dict]]
+    ) -> List[Optional[str]]:
+        """Process at most one result per trial.
+
+        Returns the decision for each result, or None if the decision was
+        cached because the trial is saving.
+        """
+        timings = self._phase_timings
+        results = []
+        flat_results = []
+        duplicates = []
+        force_checkpoints = []
+        decisions = []
+        for trial, result in trial_results:
+            result.update(trial_id=trial.trial_id)
+            is_duplicate = RESULT_DUPLICATE in result
+            force_checkpoints.append(result.get(SHOULD_CHECKPOINT, False))
+            # TrialScheduler and SearchAlgorithm still receive a
+            # notification because there may be special handling for
+            # the `on_trial_complete` hook.
+            if is_duplicate:
+                logger.debug("Trial finished without logging 'done'.")
+                result = trial.last_result
+                result.update(done=True)
+
+            self._total_time += result.get(TIME_THIS_ITER_S, 0)
+
+            flat_result = flatten_dict(result)
+            self._validate_result_metrics(flat_result)
+
+            if self._stopper(trial.trial_id, result) or trial.should_stop(flat_result):
+                decisions.append(TrialScheduler.STOP)
+            else:
+                decisions.append(None)
+            results.append(result)
+            flat_results.append(flat_result)
+            duplicates.append(is_duplicate)
+
+        to_schedule = [i for i, decision in enumerate(decisions) if decision is None]
+        if to_schedule:
+            with warn_if_slow(
+                "process_trial_results/scheduler.on_trial_results", timings=timings
+            ):
+                scheduler_decisions = self._scheduler_alg.on_trial_results(
+                    self._wrapped(),
+                    [(trial_results[i][0], flat_results[i]) for i in to_schedule],
+                )
+            for i, decision in zip(to_schedule, scheduler_decisions):
+                decisions[i] = decision
+
+        # Only updating search alg if the trial is not to be stopped.
+        to_search = []
+        for i, decision in enumerate(decisions):
+            if decision == TrialScheduler.STOP:
+                results[i].update(done=True)
+            else:
+                to_search.append(i)
+        if to_search:
+            with warn_if_slow(
+                "process_trial_results/search_alg.on_trial_results", timings=timings
+            ):
+                self._search_alg.on_trial_results(
+                    [(trial_results[i][0].trial_id, flat_results[i]) for i in to_search]
                 )
-        if decision == TrialScheduler.STOP:
-            result.update(done=True)
-        else:
-            # Only updating search alg if the trial is not to be stopped.
-            with warn_if_slow("search_alg.on_trial_result"):
-                self._search_alg.on_trial_result(trial.trial_id, flat_result)
 
         # If this is not a duplicate result, the callbacks should
         # be informed about the result.
-        if not is_duplicate:
-            with warn_if_slow("callbacks.on_trial_result"):
-                self._callbacks.on_trial_result(
+        to_report = [i for i, is_duplicate in enumerate(duplicates) if not is_duplicate]
+        if to_report:
+            with warn_if_slow(
+                "process_trial_results/callbacks.on_trial_results", timings=timings
+            ):
+                self._callbacks.on_trial_results(
                     iteration=self._iteration,
                     trials=self._trials,
-                    trial=trial,
-                    result=result.copy(),
+                    trial_results=[
+                        (trial_results[i][0], results[i].copy()) for i in to_report
+                    ],
                 )
-            trial.update_last_result(result)
-            # Include in next experiment checkpoint
-            self._mark_trial_to_checkpoint(trial)
 
-        # Checkpoints to disk. This should be checked even if
-        # the scheduler decision is STOP or PAUSE. Note that
-        # PAUSE only checkpoints to memory and does not update
-        # the global checkpoint state.
-        self._checkpoint_trial_if_needed(trial, force=force_checkpoint)
+        for i, (trial, _) in enumerate(trial_results):
+            if not duplicates[i]:
+                trial.update_last_result(results[i])
+                # Include in next experiment checkpoint
+                self._mark_trial_to_checkpoint(trial)
 
-        if trial.is_saving:
-            logger.debug(f"Caching trial decision for trial {trial}: {decision}")
-            # Cache decision to execute on after the save is processed.
-            # This prevents changing the trial's state or kicking off
-            # another training step prematurely.
-            self._cached_trial_decisions[trial.trial_id] = decision
-            return None
-        else:
-            self._queue_decision(trial, decision)
-            return decision
+            # Checkpoints to disk. This should be checked even if
+            # the scheduler decision is STOP or PAUSE. Note that
+            # PAUSE only checkpoints to memory and does not update
+            # the global checkpoint state.
+            self._checkpoint_trial_if_needed(trial, force=force_checkpoints[i])
+
+            decision = decisions[i]
+            if trial.is_saving:
+                logger.debug(f"Caching trial decision for trial {trial}: {decision}")
+                # Cache decision to execute on after the save is processed.
+                # This prevents changing the trial's state or kicking off
+                # another training step prematurely.
+                self._cached_trial_decisions[trial.trial_id] = decision
+                decisions[i] = None
+            else:
+                self._queue_decision(trial, decision)
+        return decisions
 
     def _validate_result_metrics(self, result):
         """
@@ -1158,11 +1215,14 @@ class _TuneControllerBase:
             "_pending_trial_queue_times",
             "_callbacks",
             "_checkpoint_manager",
+            "_experiment_state_journal",
             "_local_experiment_path",
             "_remote_experiment_path",
             "_sync_config",
             "_experiment_dir_name",
             "_insufficient_resources_manager",
+            "_phase_timings",
+            "_pending_trial_results",
         ]:
             del state[k]
         state["launch_web_server"] = bool(self._server)
@@ -1377,29 +1437,38 @@ class TrialRunner(_TuneControllerBase):
         """
         if self.is_finished():
             raise TuneError("Called step when all trials finished?")
-        with warn_if_slow("on_step_begin"):
+        timings = self._phase_timings
+        with warn_if_slow("on_step_begin", timings=timings):
             self.trial_executor.on_step_begin()
-        with warn_if_slow("callbacks.on_step_begin"):
+        with warn_if_slow("callbacks.on_step_begin", timings=timings):
             self._callbacks.on_step_begin(
                 iteration=self._iteration, trials=self._trials
             )
 
-        next_trial = self._update_trial_queue_and_get_next_trial()
+        with warn_if_slow("update_trial_queue", disable=True, timings=timings):
+            next_trial = self._update_trial_queue_and_get_next_trial()
         if next_trial:
             logger.debug(f"Got new trial to run: {next_trial}")
 
-        self._wait_and_handle_event(next_trial)
+        with warn_if_slow("wait_and_handle_event", disable=True, timings=timings):
+            self._collect_trial_results = True
+            try:
+                self._wait_and_handle_event(next_trial)
+            finally:
+                self._collect_trial_results = False
+        self._process_pending_trial_results()
 
         self._stop_experiment_if_needed()
 
         try:
-            self.checkpoint()
+            with warn_if_slow("checkpoint", disable=True, timings=timings):
+                self.checkpoint()
         except Exception as e:
             logger.warning(f"Trial Runner checkpointing failed: {str(e)}")
         self._iteration += 1
 
         if self._server:
-            with warn_if_slow("server"):
+            with warn_if_slow("server", timings=timings):
                 self._process_stop_requests()
 
             if self.is_finished():
@@ -1407,9 +1476,9 @@ class TrialRunner(_TuneControllerBase):
 
         self._reconcile_live_trials()
 
-        with warn_if_slow("on_step_end"):
+        with warn_if_slow("on_step_end", timings=timings):
             self.trial_executor.on_step_end(search_ended=self._search_alg.is_finished())
-        with warn_if_slow("callbacks.on_step_end"):
+        with warn_if_slow("callbacks.on_step_end", timings=timings):
             self._callbacks.on_step_end(iteration=self._iteration, trials=self._trials)
 
     def _wait_and_handle_event(self, next_trial: Optional[Trial]):
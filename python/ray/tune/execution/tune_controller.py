@@ -237,22 +237,37 @@ class TuneController(_TuneControllerBase):
         if self.is_finished():
             raise TuneError("Called step when all trials finished?")
 
-        with warn_if_slow("on_step_begin"):
+        timings = self._phase_timings
+        with warn_if_slow("on_step_begin", timings=timings):
             self.on_step_begin()
 
-        with warn_if_slow("callbacks.on_step_begin"):
+        with warn_if_slow("callbacks.on_step_begin", timings=timings):
             self._callbacks.on_step_begin(
                 iteration=self._iteration, trials=self._trials
             )
 
         # Ask searcher for more trials
-        self._maybe_update_trial_queue()
+        with warn_if_slow("update_trial_queue", disable=True, timings=timings):
+            self._maybe_update_trial_queue()
 
         # Start actors for added trials
-        self._maybe_add_actors()
-
-        # Handle one event
-        if not self._actor_manager.next(timeout=0.1):
+        with warn_if_slow("add_actors", disable=True, timings=timings):
+            self._maybe_add_actors()
+
+        # Handle one event, then all other events that are already ready.
+        # Training results are collected and processed as one batch below.
+        with warn_if_slow("handle_event", disable=True, timings=timings):
+            self._collect_trial_results = True
+            try:
+                handled_event = self._actor_manager.next(timeout=0.1)
+                if handled_event:
+                    for _ in range(self._actor_manager.num_actor_tasks):
+                        if not self._actor_manager.next(timeout=0):
+                            break
+            finally:
+                self._collect_trial_results = False
+        self._process_pending_trial_results()
+        if not handled_event:
             # If there are no actors running, warn about potentially
             # insufficient resources
             if not self._actor_manager.num_live_actors:
@@ -265,7 +280,8 @@ class TuneController(_TuneControllerBase):
 
         # Maybe save experiment state
         try:
-            self.checkpoint()
+            with warn_if_slow("checkpoint", disable=True, timings=timings):
+                self.checkpoint()
         except Exception as e:
             logger.warning(f"Trial controller checkpointing failed: {str(e)}")
             raise e
@@ -273,15 +289,15 @@ class TuneController(_TuneControllerBase):
         self._iteration += 1
 
         if self._server:
-            with warn_if_slow("server"):
+            with warn_if_slow("server", timings=timings):
                 self._process_stop_requests()
 
             if self.is_finished():
                 self._server.shutdown()
 
-        with warn_if_slow("on_step_end"):
+        with warn_if_slow("on_step_end", timings=timings):
             self.on_step_end()
-        with warn_if_slow("callbacks.on_step_end"):
+        with warn_if_slow("callbacks.on_step_end", timings=timings):
             self._callbacks.on_step_end(iteration=self._iteration, trials=self._trials)
 
     def _set_trial_status(self, trial: Trial, status: str):
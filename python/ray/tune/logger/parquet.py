@@ -0,0 +1,190 @@
+import logging
+import os
+import time
+import uuid
+
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from ray.tune.logger.logger import LoggerCallback
+from ray.tune.result import EXPR_RESULT_PARTS_DIR
+from ray.tune.utils import flatten_dict
+from ray.util.annotations import PublicAPI
+from ray.util.debug import log_once
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from ray.tune.experiment.trial import Trial  # noqa: F401
+
+logger = logging.getLogger(__name__)
+
+
+@PublicAPI(stability="alpha")
+class ParquetLoggerCallback(LoggerCallback):
+    """Logs the results of all trials to parquet files.
+
+    Instead of writing one file per trial, results are buffered in memory
+    and written in batches to the ``result_parts`` directory under the
+    experiment directory. Every flush writes a new, immutable file, so files
+    written before a crash stay readable.
+
+    Automatically flattens nested dicts in the result dict before writing:
+
+        {"a": {"b": 1, "c": 2}} -> {"a/b": 1, "a/c": 2}
+
+    ``ExperimentAnalysis`` and ``ResultGrid`` read these files in a single
+    pass instead of parsing a file per trial.
+
+    Args:
+        flush_every_n_results: Write the buffered results after this many
+            results have been received.
+        flush_interval_s: Write the buffered results if the last write is
+            longer ago than this.
+    """
+
+    def __init__(
+        self, flush_every_n_results: int = 1000, flush_interval_s: float = 30.0
+    ):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            self._pa = pa
+            self._pq = pq
+        except ImportError:
+            if log_once("parquet-logger-install"):
+                logger.info("pip install pyarrow to log results to parquet files.")
+            raise
+        self._flush_every_n_results = flush_every_n_results
+        self._flush_interval_s = flush_interval_s
+        # File names start with the creation time so that they sort in write
+        # order, also across restored runs, which never overwrite files.
+        self._file_prefix = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+        self._num_files = 0
+        # Map experiment directory -> results buffered since the last flush.
+        self._buffers: Dict[str, List[Dict]] = {}
+        self._num_buffered = 0
+        self._last_flush_time = time.monotonic()
+
+    def log_trial_result(self, iteration: int, trial: "Trial", result: Dict):
+        self._buffer_result(trial, result)
+        self._maybe_flush()
+
+    def on_trial_results(
+        self,
+        iteration: int,
+        trials: List["Trial"],
+        trial_results: List[Tuple["Trial", Dict]],
+        **info,
+    ):
+        for trial, result in trial_results:
+            self._buffer_result(trial, result)
+        self._maybe_flush()
+
+    def _buffer_result(self, trial: "Trial", result: Dict):
+        tmp = result.copy()
+        tmp.pop("config", None)
+        flat_result = flatten_dict(tmp, delimiter="/")
+        flat_result["trial_id"] = trial.trial_id
+
+        self._buffers.setdefault(trial.local_experiment_path, []).append(flat_result)
+        self._num_buffered += 1
+
+    def log_trial_end(self, trial: "Trial", failed: bool = False):
+        self.flush()
+
+    def on_step_end(self, iteration: int, trials: List["Trial"], **info):
+        self._maybe_flush()
+
+    def on_experiment_end(self, trials: List["Trial"], **info):
+        self.flush()
+
+    def _maybe_flush(self):
+        if (
+            self._num_buffered >= self._flush_every_n_results
+            or time.monotonic() - self._last_flush_time >= self._flush_interval_s
+        ):
+            self.flush()
+
+    def flush(self):
+        """Writes all buffered results to new parquet files."""
+        self._last_flush_time = time.monotonic()
+        if not self._num_buffered:
+            return
+
+        for experiment_path, rows in self._buffers.items():
+            parts_dir = os.path.join(experiment_path, EXPR_RESULT_PARTS_DIR)
+            os.makedirs(parts_dir, exist_ok=True)
+            file_name = f"{self._file_prefix}-{self._num_files:06d}.parquet"
+            self._num_files += 1
+
+            # Write to a temporary file first so that readers never see
+            # partially written files.
+            tmp_path = os.path.join(parts_dir, f".tmp-{file_name}")
+            self._pq.write_table(self._rows_to_table(rows), tmp_path)
+            os.replace(tmp_path, os.path.join(parts_dir, file_name))
+
+        self._buffers = {}
+        self._num_buffered = 0
+
+    def _rows_to_table(self, rows: List[Dict]):
+        columns = {}
+        for row in rows:
+            for key in row:
+                columns.setdefault(key, None)
+
+        arrays = {}
+        for key in columns:
+            values = [row.get(key) for row in rows]
+            try:
+                arrays[key] = self._pa.array(values)
+            except (self._pa.ArrowInvalid, self._pa.ArrowTypeError):
+                # Mixed or unsupported types, e.g. numpy arrays or objects.
+                arrays[key] = self._pa.array(
+                    [None if value is None else str(value) for value in values]
+                )
+        return self._pa.table(arrays)
+
+
+def _read_result_parts(
+    experiment_paths: List[str], columns: Optional[List[str]] = None
+) -> Optional["pd.DataFrame"]:
+    """Reads the results written by ``ParquetLoggerCallback``.
+
+    Args:
+        experiment_paths: Experiment directories to read the results from.
+        columns: Only read these columns. ``trial_id`` is always read.
+
+    Returns:
+        A dataframe with the results of all trials, in the order in which
+        they were written, or None if no results were found.
+    """
+    import pandas as pd
+    import pyarrow.parquet as pq
+
+    if columns is not None:
+        columns = ["trial_id"] + [c for c in columns if c != "trial_id"]
+
+    dataframes = []
+    for experiment_path in experiment_paths:
+        parts_dir = os.path.join(experiment_path, EXPR_RESULT_PARTS_DIR)
+        if not os.path.isdir(parts_dir):
+            continue
+        # File names sort in the order the files were written.
+        for file_name in sorted(os.listdir(parts_dir)):
+            if not file_name.endswith(".parquet") or file_name.startswith("."):
+                continue
+            path = os.path.join(parts_dir, file_name)
+            read_columns = None
+            if columns is not None:
+                # Columns that only appear in later files are missing in
+                # earlier ones.
+                available = set(pq.read_schema(path).names)
+                read_columns = [c for c in columns if c in available]
+            dataframes.append(pq.read_table(path, columns=read_columns).to_pandas())
+
+    if not dataframes:
+        return None
+    # Concatenate with pandas, which fills missing columns and reconciles
+    # columns logged with different types in different files.
+    return pd.concat(dataframes, ignore_index=True)
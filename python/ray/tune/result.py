@@ -156,5 +156,9 @@ EXPR_PROGRESS_FILE = "progress.csv"
 # File that stores results of the trial.
 EXPR_RESULT_FILE = "result.json"
 
+# Directory under the experiment directory that stores the results of all
+# trials as parquet files.
+EXPR_RESULT_PARTS_DIR = "result_parts"
+
 # Config prefix when using ExperimentAnalysis.
 CONFIG_PREFIX = "config"
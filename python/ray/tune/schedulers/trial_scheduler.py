@@ -1,4 +1,4 @@
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
 from ray.air._internal.usage import tag_scheduler
 from ray.tune.execution import trial_runner
@@ -87,6 +87,24 @@ class TrialScheduler:
 
         raise NotImplementedError
 
+    def on_trial_results(
+        self,
+        trial_runner: "trial_runner.TrialRunner",
+        trial_results: List[Tuple[Trial, Dict]],
+    ) -> List[str]:
+        """Called with the intermediate results of many trials at once.
+
+        Contains at most one result per trial. Returns one decision per result,
+        in the same order. Later results of a trial are only passed on once its
+        earlier results were decided, and not at all after a STOP decision.
+
+        By default, this calls ``on_trial_result`` for each result. Schedulers
+        can override this to process many results more efficiently."""
+        return [
+            self.on_trial_result(trial_runner, trial, result)
+            for trial, result in trial_results
+        ]
+
     def on_trial_complete(
         self, trial_runner: "trial_runner.TrialRunner", trial: Trial, result: Dict
     ):
@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional, Union, TYPE_CHECKING
+from typing import Dict, List, Optional, Tuple, Union, TYPE_CHECKING
 
 from ray.util.annotations import DeveloperAPI
 
@@ -87,6 +87,18 @@ class SearchAlgorithm:
         """
         pass
 
+    def on_trial_results(self, trial_results: List[Tuple[str, Dict]]):
+        """Called with the intermediate results of many trials at once.
+
+        By default, this calls ``on_trial_result`` for each result, in the
+        order they were reported.
+
+        Arguments:
+            trial_results: Pairs of trial identifier and result dictionary.
+        """
+        for trial_id, result in trial_results:
+            self.on_trial_result(trial_id, result)
+
     def on_trial_complete(
         self, trial_id: str, result: Optional[Dict] = None, error: bool = False
     ):
@@ -3,7 +3,7 @@ import glob
 import logging
 import os
 import warnings
-from typing import Dict, Optional, List, Union, Any, TYPE_CHECKING
+from typing import Dict, Optional, List, Tuple, Union, Any, TYPE_CHECKING
 
 from ray.air._internal.usage import tag_searcher
 from ray.tune.search.util import _set_search_properties_backwards_compatible
@@ -139,6 +139,20 @@ class Searcher:
         """
         pass
 
+    def on_trial_results(self, trial_results: List[Tuple[str, Dict]]) -> None:
+        """Optional notification for the results of many trials at once.
+
+        By default, this calls ``on_trial_result`` for each result, in the
+        order they were reported. Searchers can override this to process
+        many results more efficiently.
+
+        Args:
+            trial_results: Pairs of a unique string ID for the trial and a
+                dictionary of metrics for its current training progress.
+        """
+        for trial_id, result in trial_results:
+            self.on_trial_result(trial_id, result)
+
     def on_trial_complete(
         self, trial_id: str, result: Optional[Dict] = None, error: bool = False
     ) -> None:
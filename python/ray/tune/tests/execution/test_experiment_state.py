@@ -0,0 +1,92 @@
+import json
+import os
+
+import pytest
+
+from ray.tune.execution.experiment_state import (
+    _ExperimentStateJournal,
+    _get_experiment_journal_path,
+    _load_experiment_state,
+)
+
+
+def _count_journal_records(state_path: str) -> int:
+    with open(_get_experiment_journal_path(state_path)) as f:
+        # The first line is the journal header.
+        return len(f.readlines()) - 1
+
+
+def test_experiment_state_journal(tmp_path):
+    state_path = str(tmp_path / "experiment_state-session.json")
+    journal = _ExperimentStateJournal()
+    trial_states = {"a": json.dumps({"v": 1}), "b": json.dumps({"v": 1})}
+
+    # The first save writes a snapshot.
+    journal.save(state_path, trial_states, runner_data={"step": 1}, stats={})
+    assert _count_journal_records(state_path) == 0
+    state = _load_experiment_state(state_path)
+    assert state["checkpoints"] == list(trial_states.values())
+    assert state["runner_data"] == {"step": 1}
+
+    # Later saves only append the changed trials and the runner state.
+    trial_states["a"] = json.dumps({"v": 2})
+    trial_states["c"] = json.dumps({"v": 1})
+    journal.save(state_path, trial_states, runner_data={"step": 2}, stats={})
+    assert _count_journal_records(state_path) == 3
+    journal.save(state_path, trial_states, runner_data={"step": 3}, stats={})
+    assert _count_journal_records(state_path) == 4
+
+    state = _load_experiment_state(state_path)
+    assert state["checkpoint_ids"] == ["a", "b", "c"]
+    assert state["checkpoints"] == list(trial_states.values())
+    assert state["runner_data"] == {"step": 3}
+
+    # The journal is compacted once it's larger than the snapshot, also if
+    # only the runner state changes.
+    trial_states["b"] = json.dumps({"v": 2})
+    step = 4
+    snapshot_size = os.path.getsize(state_path)
+    while os.path.getsize(_get_experiment_journal_path(state_path)) < snapshot_size:
+        journal.save(state_path, trial_states, runner_data={"step": step}, stats={})
+        step += 1
+    assert _count_journal_records(state_path) > 0
+    journal.save(state_path, trial_states, runner_data={"step": step}, stats={})
+    assert _count_journal_records(state_path) == 0
+    state = _load_experiment_state(state_path)
+    assert state["checkpoints"] == list(trial_states.values())
+    assert state["runner_data"] == {"step": step}
+
+    # A partially written record is ignored.
+    journal.save(state_path, trial_states, runner_data={"step": step + 1}, stats={})
+    with open(_get_experiment_journal_path(state_path), "a") as f:
+        f.write('{"runner_data": {"step": 0}, "sta')
+    state = _load_experiment_state(state_path)
+    assert state["checkpoints"] == list(trial_states.values())
+    assert state["runner_data"] == {"step": step + 1}
+
+
+def test_experiment_state_journal_mismatch(tmp_path):
+    state_path = str(tmp_path / "experiment_state-session.json")
+    journal = _ExperimentStateJournal()
+    trial_states = {"a": json.dumps({"v": 1})}
+    journal.save(state_path, trial_states, runner_data={"step": 1}, stats={})
+
+    # A journal that doesn't belong to the snapshot isn't replayed, e.g. if
+    # the driver died after writing a new snapshot but before replacing the
+    # journal.
+    with open(_get_experiment_journal_path(state_path), "w") as f:
+        f.write(json.dumps({"journal_id": "other"}) + "\n")
+        f.write(json.dumps({"trial_id": "a", "state": "stale"}) + "\n")
+    state = _load_experiment_state(state_path)
+    assert state["checkpoints"] == [trial_states["a"]]
+
+    # Experiment state files without a journal are loaded as is.
+    os.remove(_get_experiment_journal_path(state_path))
+    state = _load_experiment_state(state_path)
+    assert state["checkpoints"] == [trial_states["a"]]
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main(["-v", __file__]))
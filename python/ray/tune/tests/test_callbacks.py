@@ -39,6 +39,16 @@ def test_callback_list_with_stateful_callback(tmp_path):
     assert restored_callbacks._callbacks[1].counter == 3
 
 
+def test_callback_list_batched_results():
+    """Callbacks receive each result of a batch by default."""
+    callback = StatefulCallback()
+    callbacks = CallbackList([Callback(), callback])
+    callbacks.on_trial_results(
+        iteration=0, trials=None, trial_results=[(None, {}), (None, {}), (None, {})]
+    )
+    assert callback.counter == 3
+
+
 def test_callback_list_without_stateful_callback(tmp_path):
     """If no callbacks within a CallbackList are stateful, then nothing
     should be saved."""
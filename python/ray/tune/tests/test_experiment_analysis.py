@@ -11,6 +11,7 @@ import ray
 from ray import tune
 from ray.air._internal.remote_storage import upload_to_uri
 from ray.tune import ExperimentAnalysis
+from ray.tune.logger import ParquetLoggerCallback
 import ray.tune.registry
 from ray.tune.tests.utils.experiment import create_test_experiment_checkpoint
 from ray.tune.utils.mock_trainable import MyTrainableClass
@@ -87,6 +88,30 @@ class ExperimentAnalysisSuite(unittest.TestCase):
         all_dataframes_via_csv2 = self.ea.fetch_trial_dataframes()
         assert set(all_dataframes_via_csv) == set(all_dataframes_via_csv2)
 
+    def testLoadParquet(self):
+        tune.run(
+            MyTrainableClass,
+            name="parquet_exp",
+            storage_path=self.test_dir,
+            stop={"training_iteration": 2},
+            num_samples=self.num_samples,
+            callbacks=[ParquetLoggerCallback()],
+        )
+        ea = ExperimentAnalysis(os.path.join(self.test_dir, "parquet_exp"))
+        assert ea._file_type == "parquet"
+
+        dataframes = ea.trial_dataframes
+        self.assertEqual(len(dataframes), self.num_samples)
+        for df in dataframes.values():
+            self.assertSequenceEqual(list(df.training_iteration), [1, 2])
+
+        df = ea.dataframe(self.metric, mode="max")
+        self.assertEqual(df.shape[0], self.num_samples)
+
+        results = ea.fetch_results(columns=[self.metric])
+        self.assertSequenceEqual(list(results.columns), ["trial_id", self.metric])
+        self.assertEqual(results.shape[0], 2 * self.num_samples)
+
     def testStats(self):
         assert self.ea.stats()
         assert self.ea.runner_data()
@@ -106,6 +131,27 @@ class ExperimentAnalysisSuite(unittest.TestCase):
         self.assertTrue("width" in best_config)
         self.assertTrue("height" in best_config)
 
+    def testBestTrials(self):
+        best_trials = self.ea.get_best_trials(3, self.metric, mode="max")
+        self.assertEqual(len(best_trials), 3)
+        self.assertEqual(best_trials[0], self.ea.get_best_trial(self.metric, "max"))
+        scores = [t.metric_analysis[self.metric]["last"] for t in best_trials]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+
+        # All trials have a score, so the worst trial is the best for "min".
+        all_trials = self.ea.get_best_trials(
+            self.num_samples + 1, self.metric, mode="max"
+        )
+        self.assertEqual(len(all_trials), self.num_samples)
+        self.assertEqual(all_trials[-1], self.ea.get_best_trial(self.metric, "min"))
+
+        # Scores are updated when the trials change.
+        self.ea.trials.append(self.ea.trials.pop(0))
+        self.assertEqual(
+            self.ea.get_best_trial(self.metric, "max"),
+            max(self.ea.trials, key=lambda t: t.metric_analysis[self.metric]["last"]),
+        )
+
     def testBestConfigNan(self):
         nan_ea = self.nan_test_exp()
         best_config = nan_ea.get_best_config(self.metric, mode="max")
@@ -17,15 +17,18 @@ from ray.tune.logger import (
     JsonLoggerCallback,
     JsonLogger,
     CSVLogger,
+    ParquetLoggerCallback,
     TBXLoggerCallback,
     TBXLogger,
 )
 from ray.tune.logger.aim import AimLoggerCallback
+from ray.tune.logger.parquet import _read_result_parts
 from ray.tune.result import (
     EXPR_PARAM_FILE,
     EXPR_PARAM_PICKLE_FILE,
     EXPR_PROGRESS_FILE,
     EXPR_RESULT_FILE,
+    EXPR_RESULT_PARTS_DIR,
 )
 from ray.tune.utils import flatten_dict
 
@@ -199,6 +202,48 @@ class LoggerSuite(unittest.TestCase):
 
         self.assertEqual(loaded_config, config)
 
+    def testParquet(self):
+        config = {"a": 2}
+        t1 = Trial(
+            evaluated_params=config,
+            trial_id="t1",
+            logdir=None,
+            experiment_path=self.test_dir,
+        )
+        t2 = Trial(
+            evaluated_params=config,
+            trial_id="t2",
+            logdir=None,
+            experiment_path=self.test_dir,
+        )
+        parts_dir = os.path.join(self.test_dir, EXPR_RESULT_PARTS_DIR)
+        logger = ParquetLoggerCallback(flush_every_n_results=3, flush_interval_s=600)
+
+        # Results are buffered until enough results were received.
+        logger.on_trial_result(0, [], t1, result(0, 4))
+        logger.on_trial_result(0, [], t2, result(0, 1))
+        self.assertFalse(os.path.exists(parts_dir))
+        logger.on_trial_result(1, [], t1, result(1, 5, hello={"world": 1}))
+        self.assertEqual(len(os.listdir(parts_dir)), 1)
+
+        logger.on_trial_result(2, [], t1, result(2, 6, score=[1, 2, 3]))
+        logger.on_trial_complete(3, [], t1)
+        self.assertEqual(len(os.listdir(parts_dir)), 2)
+
+        df = _read_result_parts([self.test_dir])
+        self.assertSequenceEqual(list(df["trial_id"]), ["t1", "t2", "t1", "t1"])
+        self.assertSequenceEqual(
+            [int(v) for v in df[df["trial_id"] == "t1"]["episode_reward_mean"]],
+            [4, 5, 6],
+        )
+        self.assertEqual(df["hello/world"].dropna().tolist(), [1])
+        self.assertNotIn("config", df)
+
+        # Only the requested columns are read.
+        df = _read_result_parts([self.test_dir], columns=["mean_accuracy"])
+        self.assertSequenceEqual(list(df.columns), ["trial_id", "mean_accuracy"])
+        self.assertEqual(len(df), 4)
+
     def testLegacyTBX(self):
         config = {
             "a": 2,
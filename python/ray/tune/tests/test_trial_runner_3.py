@@ -145,6 +145,51 @@ class TrialRunnerTest3(unittest.TestCase):
         self.assertEqual(trials[2].status, Trial.RUNNING)
         self.assertEqual(trials[-1].status, Trial.TERMINATED)
 
+    def testProcessTrialResultsBatched(self):
+        """Results of several trials are passed to the scheduler as one batch,
+        and results of a trial after it was stopped are ignored."""
+        ray.init(num_cpus=1)
+
+        class BatchRecordingScheduler(FIFOScheduler):
+            def __init__(self):
+                super().__init__()
+                self.batches = []
+
+            def on_trial_results(self, trial_runner, trial_results):
+                self.batches.append([trial for trial, _ in trial_results])
+                return super().on_trial_results(trial_runner, trial_results)
+
+        scheduler = BatchRecordingScheduler()
+        runner = TrialRunner(
+            scheduler=scheduler,
+            trial_executor=RayTrialExecutor(resource_manager=self._resourceManager()),
+        )
+        kwargs = {"stopping_criterion": {TRAINING_ITERATION: 5}}
+        trials = [Trial("__fake", **kwargs), Trial("__fake", **kwargs)]
+        for t in trials:
+            runner.add_trial(t)
+
+        runner._process_trial_results(
+            [
+                (
+                    trials[0],
+                    [
+                        {TRAINING_ITERATION: 1},
+                        {TRAINING_ITERATION: 5},
+                        {TRAINING_ITERATION: 6},
+                    ],
+                ),
+                (trials[1], [{TRAINING_ITERATION: 1}]),
+            ]
+        )
+
+        # The second result of trials[0] is stopped by the stopping criterion
+        # before reaching the scheduler, and its third result is ignored.
+        self.assertEqual(scheduler.batches, [[trials[0], trials[1]]])
+        self.assertEqual(trials[0].last_result[TRAINING_ITERATION], 5)
+        self.assertTrue(trials[0].last_result["done"])
+        self.assertEqual(trials[1].last_result[TRAINING_ITERATION], 1)
+
     def testSearchAlgNotification(self):
         """Checks notification of trial to the Search Algorithm."""
         os.environ["TUNE_RESULT_BUFFER_LENGTH"] = "1"  # Don't finish early
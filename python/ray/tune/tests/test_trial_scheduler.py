@@ -95,6 +95,25 @@ class EarlyStoppingSuite(unittest.TestCase):
             rule.on_trial_result(runner, t2, result(10, 450)), TrialScheduler.STOP
         )
 
+    def testMedianStoppingBatchedResults(self):
+        rule = MedianStoppingRule(
+            metric="episode_reward_mean",
+            mode="max",
+            grace_period=0,
+            min_samples_required=1,
+        )
+        t1, t2 = self.basicSetup(rule)
+        runner = mock_trial_runner()
+        rule.on_trial_complete(runner, t1, result(10, 1000))
+        t3 = Trial("PPO")
+        # Each result of the batch gets its own decision.
+        self.assertEqual(
+            rule.on_trial_results(
+                runner, [(t2, result(10, 450)), (t3, result(1, 1000))]
+            ),
+            [TrialScheduler.STOP, TrialScheduler.CONTINUE],
+        )
+
     def testMedianStoppingOnCompleteOnly(self):
         rule = MedianStoppingRule(
             metric="episode_reward_mean",
@@ -275,6 +275,9 @@ def _delete_external_checkpoint(checkpoint_uri: str):
 class warn_if_slow:
     """Prints a warning if a given operation is slower than 500ms.
 
+    If a ``timings`` dict is passed, the duration of the operation is added
+    to ``timings[name]``.
+
     Example:
         >>> from ray.tune.utils.util import warn_if_slow
         >>> something = ... # doctest: +SKIP
@@ -294,12 +297,14 @@ class warn_if_slow:
         threshold: Optional[float] = None,
         message: Optional[str] = None,
         disable: bool = False,
+        timings: Optional[Dict[str, float]] = None,
     ):
         self.name = name
         self.threshold = threshold or self.DEFAULT_THRESHOLD
         self.message = message or self.DEFAULT_MESSAGE
         self.too_slow = False
         self.disable = disable
+        self.timings = timings
 
     def __enter__(self):
         self.start = time.time()
@@ -307,6 +312,10 @@ class warn_if_slow:
 
     def __exit__(self, type, value, traceback):
         now = time.time()
+        if self.timings is not None:
+            self.timings[self.name] = self.timings.get(self.name, 0.0) + (
+                now - self.start
+            )
         if self.disable:
             return
         if now - self.start > self.threshold and now - START_OF_TIME > 60.0: